@@ -4,6 +4,8 @@ import gc
 
 import time
 
+from olaaaf import TimeLimitException
+
 from ex_KiwiMilkshake import KiwiMilkshakeExample
 from ex_KiwiMilkshakeNoBanana import KiwiMilkshakeNoBananaExample
 from ex_KiwiMilkshakeSameNumberOfFruitTypes import KiwiMilkshakeSameNumberOfFruitTypesExample
@@ -15,7 +17,7 @@ from ex_HighDistance import HighDistanceExample
 from ex_CombinedMilkshake import CombinedMilkshakeExample
 from ex_CombinedSalad import CombinedSaladExample
 
-def run(cls, a, b, c):
+def run(cls, a, b, c, timeLimit):
 
     print("--------------")
     print(cls.__name__)
@@ -24,7 +26,11 @@ def run(cls, a, b, c):
     start = time.perf_counter()
 
     ex = cls()    
-    ex.run(a[0], b[0], c[0])
+    try:
+        ex.run(a[0], b[0], c[0], timeLimit)
+    except TimeLimitException:
+        print("Timeout\n")
+        return
 
     print(time.perf_counter() - start, "\n")
 
@@ -50,9 +56,10 @@ if __name__ == "__main__":
             
             gc.collect()
 
-            thread = multiprocessing.Process(target=run, args=(exClass, dkInclu, withTableaux, withMaxDist))
+            thread = multiprocessing.Process(target=run, args=(exClass, dkInclu, withTableaux, withMaxDist, TIMEOUT))
             thread.start()
-            thread.join(timeout=TIMEOUT)
+            # The time budget only covers the optimization problems, the process is killed as a fallback
+            thread.join(timeout=TIMEOUT + 10)
 
             if thread.is_alive():
                 thread.terminate()
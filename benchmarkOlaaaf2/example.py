@@ -3,9 +3,9 @@ from olaaaf import VariableManager, FormulaManager
 
 class Example:
 
-    def run(self, dkInclusion, withTableaux, withMaxDist):
+    def run(self, dkInclusion, withTableaux, withMaxDist, timeLimit=None):
         return self.adaptator.execute(self.srce_case, self.tgt_problem, domainKnowledge=self.dk, domainKnowledgeInclusion=dkInclusion,\
-                                        withTableaux=withTableaux, withMaxDist=withMaxDist)
+                                        withTableaux=withTableaux, withMaxDist=withMaxDist, timeLimit=timeLimit)
 
     def __init__(self):
         VariableManager.instance = {}
@@ -14,6 +14,9 @@ from .domainKnowledge import *
 
 from .constants import *
 from .formulaInterpreter import *
+from .coupleSession import *
 from .revision import *
 from .adaptation import *
-from .infeasableException import *
\ No newline at end of file
+from .infeasableException import *
+from .timeBudget import *
+from .timeLimitException import *
\ No newline at end of file
@@ -13,6 +13,7 @@ from .simplificator import Simplificator
 from .projector import Projector
 from .revision import Revision
 from .domainKnowledge import DomainKnowledge
+from .timeBudget import TimeBudget
 
 from .constants import Constants
 
@@ -59,7 +60,7 @@ class Adaptation:
         self.__revision.preload()
 
     def execute(self, srce_case : Formula, trgt : Formula, domainKnowledge: dict[str, DomainKnowledge],\
-                domainKnowledgeInclusion: dict[str, bool] = {}, withTableaux: bool = True, withMaxDist: bool = True):
+                domainKnowledgeInclusion: dict[str, bool] = {}, withTableaux: bool = True, withMaxDist: bool = True, timeLimit: float | TimeBudget = None):
         r"""
         Execute the adaptation of \(srce_case\) by \(tgt_problem\), with the domain knowledge \(DK\).
 
@@ -109,4 +110,4 @@ class Adaptation:
 
         dk = And(*dkSet)
 
-        return self.__revision.execute(srce_case & dk, trgt & dk, withTableaux=withTableaux, withMaxDist=withMaxDist)
\ No newline at end of file
+        return self.__revision.execute(srce_case & dk, trgt & dk, withTableaux=withTableaux, withMaxDist=withMaxDist, timeLimit=timeLimit)
\ No newline at end of file
@@ -18,6 +18,36 @@ class Constants():
     SET_VERBOSE = True #: Select the default value for the verbose display of the algorithm.
     DISPLAY_DEPENDENCIES_WARNING = False #: Choose to display dependencies warning for optional packages.
 
+    PARALLEL_COMPONENTS_SIZE = 2000
+    """
+    Minimum number of columns of an optimization problem of the revision for its independent blocks of variables to be solved in parallel,
+    by `olaaaf.mlo_solver.MLOSolver.MLOSolver.solveMany`, instead of one after the other.
+    If set to `None`, the blocks are never solved in parallel.
+    By default, this constant is set to `2000`.
+    """
+
+    PRESOLVE_FREE_NODE_LIMIT = 10000
+    """
+    Maximum number of nodes explored by `olaaaf.mlo_solver.scipySolver.ScipySolver` when a mixed problem found infeasible by HiGHS' presolve
+    is solved once more without it. Beyond it, the problem is considered infeasible.
+    By default, this constant is set to `10000`.
+    """
+
+    DISJUNCTIVE_BIG_M = 10**6
+    """
+    Initial value of \(M\) used by `olaaaf.formulaInterpreter.FormulaInterpreter.optimizeFormulas` to relax the constraints of a disjunction
+    whose variables aren't bounded. It is grown by `olaaaf.constants.Constants.DISJUNCTIVE_BIG_M_GROWTH` when the models of \(\psi\)
+    and \(\mu\) found are too far from the constraints, bounding the variables avoids these extra problems.
+    By default, this constant is set to `10**6`.
+    """
+
+    DISJUNCTIVE_BIG_M_GROWTH = 10**3
+    """
+    Factor applied to the \(M\) of the relaxed constraints reaching it in `olaaaf.formulaInterpreter.FormulaInterpreter.optimizeFormulas`,
+    before solving the problem once more.
+    By default, this constant is set to `10**3`.
+    """
+
     # ---------------------------------------------------
     # Default values for domain knowledge inclusion
     DOMAIN_KNOWLEDGE_INCLUSION_DEFAULT = {"conversion": True,
@@ -0,0 +1,136 @@
+r"""
+Optimization problem of `olaaaf.formulaInterpreter.FormulaInterpreter.optimizeCouple` kept in memory for a given \(\psi\),
+allowing to solve it for multiple \(\mu\) without rebuilding it.
+"""
+
+from __future__ import annotations
+
+from .formula import Formula, LinearConstraint, ConstraintOperator, And
+from .variable import Variable, VariableManager
+from .mlo_solver import OptimizationValues
+from .mlo_solver import MLOSolver
+
+from fractions import Fraction
+import numpy as np
+from scipy.sparse import coo_array
+
+# Typing only imports
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .formulaInterpreter import FormulaInterpreter
+
+class CoupleSession:
+    r"""
+    Optimization problem of `olaaaf.formulaInterpreter.FormulaInterpreter.optimizeCouple` kept in memory for a given \(\psi\),
+    allowing to solve it for multiple \(\mu\) without rebuilding it.
+    The constraints on \(x\), the bounds of the variables and the constraints \(|x - y| \leq z\) are built once as a sparse matrix,
+    only the rows of the constraints on \(y\) are built for each \(\mu\), and the whole problem given to
+    `olaaaf.mlo_solver.MLOSolver.MLOSolver.solveArrays`.
+    The columns are chosen by `olaaaf.formulaInterpreter.FormulaInterpreter._coupleColumns`, on the variables of \(\psi\) and of every \(\mu\).
+    Should be obtained through `olaaaf.formulaInterpreter.FormulaInterpreter.createCoupleSession` and freed with `close`,
+    or used as a context manager.
+
+    Parameters
+    ----------
+    interpreter : olaaaf.formulaInterpreter.FormulaInterpreter
+        The interpreter that created the session, whose time budget and distance function are used.
+    solver : olaaaf.mlo_solver.MLOSolver.MLOSolver
+        The solver used to solve the problem.
+    psi : `olaaaf.formula.naryFormula.andOperator.And`
+        \(\psi\), conjunction of `olaaaf.formula.nullaryFormula.constraint.linearConstraint.LinearConstraint`.
+    muVariables : set of `olaaaf.variable.variable.Variable`
+        All the `olaaaf.variable.variable.Variable` in use in the \(\mu\) that will be given to the session.
+    """
+
+    def __init__(self, interpreter : FormulaInterpreter, solver : MLOSolver, psi : And, muVariables : set[Variable]):
+        self.__interpreter = interpreter
+        self.__psi = psi
+        self.__muVariables = set(muVariables)
+        self.__psiConstraints = [constraint for lc in psi.getAdherence() for constraint in lc]
+
+        psiVariables = set(psi.getVariables())
+        self.__variables = list(psiVariables | self.__muVariables)
+        columns, x, self.__y, z, obj = interpreter._coupleColumns(self.__variables, psiVariables & self.__muVariables)
+        self.__solver = solver
+        self.__size = len(columns)
+        self.__yColumns = VariableManager.getColumns(self.__y)
+        self.__c = np.array(obj, dtype=np.float64)
+        self.__A, self.__lb, self.__ub = interpreter._buildConstraints(self.__psiConstraints, [], x, self.__y, z, self.__size)
+        self.__colLb, self.__colUb, self.__integrality = interpreter._variableArrays(columns)
+
+    def optimize(self, mu : And, maxDist : Fraction) -> tuple[Fraction, Formula]:
+        r"""
+        Method used to solve the optimization problem of `olaaaf.formulaInterpreter.FormulaInterpreter.optimizeCouple`
+        for the \(\psi\) of the session and the given \(\mu\).
+
+        Parameters
+        ----------
+        mu : `olaaaf.formula.naryFormula.andOperator.And`
+            \(\mu\), conjunction of `olaaaf.formula.nullaryFormula.constraint.linearConstraint.LinearConstraint`.
+            If it uses variables unknown to the session, or if the couple splits in independent blocks of variables,
+            the problem is given to `olaaaf.formulaInterpreter.FormulaInterpreter.optimizeCouple` instead.
+        maxDist: `fraction.Fraction`
+            The currently maximum known distance for the revision process.
+            If set to `None`, the optimization problem is solved without a constraint on the maximum distance.
+
+        Returns
+        -------
+        Fraction
+            Minimal distance (calculated with the `olaaaf.distance.distance_function.distanceFunction.DistanceFunction`
+            given at the initialization of the interpreter) between \(\psi\) and \(\mu\).
+        `olaaaf.formula.formula.Formula`
+            `olaaaf.formula.formula.Formula` representing a point \(y \in \mathcal{M}(\mu)\) at this distance.
+        """
+
+        from . import InfeasableException
+
+        muVariables = set(mu.getVariables())
+        if not muVariables.issubset(self.__muVariables):
+            return self.__interpreter.optimizeCouple(self.__psi, mu, maxDist)
+
+        # Couples made of independent blocks are better solved block by block
+        muConstraints = [constraint for lc in mu.getAdherence() for constraint in lc]
+        if len(self.__interpreter._components(self.__psiConstraints + muConstraints)) > 1:
+            return self.__interpreter.optimizeCouple(self.__psi, mu, maxDist)
+
+        # The rows of mu are placed after the ones of psi
+        muA, muLb, muUb = self.__interpreter._constraintArrays([(muConstraints, self.__yColumns)], self.__size)
+        A = coo_array((np.concatenate([self.__A.data, muA.data]),
+                       (np.concatenate([self.__A.row, muA.row + len(self.__lb)]), np.concatenate([self.__A.col, muA.col]))),
+                      shape=(len(self.__lb) + len(muLb), self.__size))
+
+        res = self.__solver.solveArrays(self.__c, A, np.concatenate([self.__lb, muLb]), np.concatenate([self.__ub, muUb]),
+                                        self.__colLb, self.__colUb, self.__integrality, cutoff=maxDist,
+                                        timeLimit=self.__interpreter.getTimeLimit(), exact=True)
+        self.__interpreter.checkBudget(res)
+
+        # Interpretation of the MLO solver result
+        if res[0] == OptimizationValues.INFEASIBLE:
+            raise InfeasableException("Optimize couple impossible")
+
+        # Only the variables of psi and mu are part of the result
+        usedVariables = self.__psi.getVariables() | muVariables
+        values = res[1]
+        resSet = set()
+        for variable in self.__variables:
+            if variable in usedVariables:
+                lc = LinearConstraint("")
+                lc.variables = {variable: Fraction(1)}
+                lc.operator = ConstraintOperator.EQ
+                lc.bound = Fraction(values[self.__y[variable]])
+                resSet.add(lc)
+
+        return res[2], And(*resSet)
+
+    def close(self):
+        """
+        Method used to free the resources held by the session. The session can't be used afterwards.
+        """
+
+        self.__A = None
+
+    def __enter__(self) -> CoupleSession:
+        return self
+
+    def __exit__(self, *args):
+        self.close()
@@ -60,3 +60,4 @@ from .nullaryFormula import *
 from .unaryFormula import *
 from .binaryFormula import *
 from .naryFormula import *
+from .constraintPool import ConstraintPool
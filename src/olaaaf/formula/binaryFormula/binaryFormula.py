@@ -27,6 +27,8 @@ class BinaryFormula(Formula):
     children: tuple of `olaaaf.formula.formula.Formula`
         The children of the current node.
     '''
+
+    __slots__ = ()
         
     def __init__(self, formulaLeft: Formula, formulaRight: Formula, fmName: str = None):
 
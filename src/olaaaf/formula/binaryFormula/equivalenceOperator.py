@@ -24,6 +24,8 @@ class Equivalence(BinaryFormula):
     children: tuple of `olaaaf.formula.formula.Formula`
         The children of the current node.
     '''
+
+    __slots__ = ()
     
     _symbol = "<->"
     
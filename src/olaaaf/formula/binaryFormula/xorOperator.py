@@ -24,6 +24,8 @@ class Xor(BinaryFormula):
     children: tuple of `olaaaf.formula.formula.Formula`
         The children of the current node.
     '''
+
+    __slots__ = ()
     
     _symbol = "XOR"
     
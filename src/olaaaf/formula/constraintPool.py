@@ -0,0 +1,141 @@
+"""
+Pool of the litterals of formulas in Disjunctive Normal Form, storing each of their conjunctions as a set of litteral ids.
+"""
+
+from __future__ import annotations
+
+from .formula import Formula
+from .formulaManager import FormulaManager
+
+# Typing only imports
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .naryFormula import And
+
+class ConstraintPool:
+    """
+    Pool of the litterals of formulas in Disjunctive Normal Form, i.e. `olaaaf.formula.nullaryFormula.constraint.constraint.Constraint`
+    and their `olaaaf.formula.unaryFormula.notOperator.Not`.
+    Every litteral is interned once by `olaaaf.formula.formulaManager.FormulaManager.intern` and given an id, its index in the pool.
+    A conjunction is then stored as a term, an `int` whose set bits are the ids of its litterals, instead of an
+    `olaaaf.formula.naryFormula.andOperator.And` holding its own litterals. A conjunction is only built from its term by
+    `olaaaf.formula.constraintPool.ConstraintPool.materialize`, when it is needed.
+
+    Usage exemple
+    -------------
+    ```py
+        pool = ConstraintPool()
+        terms = pool.toDNF(LinearConstraint("x <= 2") & (LinearConstraint("y <= 3") | LinearConstraint("y >= 5")))
+
+        print(len(terms), len(pool))
+        >>> 2 3
+
+        for term in terms:
+            print(pool.materialize(term))
+        >>> (x <= 2) & (y <= 3)
+        >>> (x <= 2) & (y >= 5)
+    ```
+    """
+
+    def __init__(self):
+        self.__litterals = []
+        self.__ids = dict()
+
+    def add(self, litteral : Formula) -> int:
+        """
+        Method adding a litteral to the pool, if it isn't already in it.
+
+        Parameters
+        ----------
+        litteral : `olaaaf.formula.formula.Formula`
+            The litteral to add.
+
+        Returns
+        -------
+        int
+            The id of the litteral.
+        """
+
+        litteral = FormulaManager.intern(litteral)
+        id = self.__ids.get(litteral)
+        if id is None:
+            id = self.__ids[litteral] = len(self.__litterals)
+            self.__litterals.append(litteral)
+        return id
+
+    def toDNF(self, formula : Formula) -> list[int]:
+        """
+        Method returning the terms of the Disjunctive Normal Form of a `olaaaf.formula.formula.Formula`, whose litterals are added to the pool.
+        The conjunctions and disjunctions are expanded on the terms, without building any `olaaaf.formula.naryFormula.andOperator.And`,
+        any other `olaaaf.formula.formula.Formula` being put in Disjunctive Normal Form by its own `toDNF`.
+
+        Parameters
+        ----------
+        formula : `olaaaf.formula.formula.Formula`
+            The `olaaaf.formula.formula.Formula` to put in Disjunctive Normal Form.
+
+        Returns
+        -------
+        list of int
+            The terms of the conjunctions of the Disjunctive Normal Form, without duplicates.
+        """
+
+        from .naryFormula import And, Or
+
+        if isinstance(formula, And):
+            terms = [0]
+            for child in formula.children:
+                childTerms = self.toDNF(child)
+                terms = list(dict.fromkeys(term | childTerm for term in terms for childTerm in childTerms))
+            return terms
+        elif isinstance(formula, Or):
+            return list(dict.fromkeys(term for child in formula.children for term in self.toDNF(child)))
+
+        dnf = formula.toDNF()
+        if isinstance(dnf, (And, Or)):
+            return self.toDNF(dnf)
+        return [1 << self.add(dnf)]
+
+    def getLitterals(self, term : int) -> list[Formula]:
+        """
+        Method returning the litterals of a term.
+
+        Parameters
+        ----------
+        term : int
+            The term of a conjunction, as returned by `olaaaf.formula.constraintPool.ConstraintPool.toDNF`.
+
+        Returns
+        -------
+        list of `olaaaf.formula.formula.Formula`
+            The litterals of the conjunction, in the order of their ids.
+        """
+
+        litterals = []
+        while term:
+            lowest = term & -term
+            litterals.append(self.__litterals[lowest.bit_length() - 1])
+            term ^= lowest
+        return litterals
+
+    def materialize(self, term : int) -> And:
+        """
+        Method building the conjunction of a term.
+
+        Parameters
+        ----------
+        term : int
+            The term of a conjunction, as returned by `olaaaf.formula.constraintPool.ConstraintPool.toDNF`.
+
+        Returns
+        -------
+        `olaaaf.formula.naryFormula.andOperator.And`
+            The conjunction, interned by `olaaaf.formula.formulaManager.FormulaManager.intern`.
+        """
+
+        from .naryFormula import And
+
+        return FormulaManager.intern(And(*self.getLitterals(term)))
+
+    def __len__(self) -> int:
+        return len(self.__litterals)
@@ -21,7 +21,22 @@ class Formula(ABC):
         Typing depends of the formula's arity.
     '''
     
-    children = None
+    __slots__ = ("children", "_hash", "__weakref__")
+
+    #: Structural hash of the formula, cached once it is interned by `olaaaf.formula.formulaManager.FormulaManager.intern`.
+    _hash: int
+
+    def __new__(cls, *args, **kwargs):
+        # Set here rather than in __init__ so that unpickled formulas have it too
+        formula = super().__new__(cls)
+        formula._hash = None
+        return formula
+
+    def __setattr__(self, name, value):
+        # The hash of an interned formula depends on its children, which are shared with every formula equal to it
+        if name == "children" and self._hash is not None:
+            raise AttributeError(f"An interned {self.__class__.__name__} can't be modified, clone it first.")
+        object.__setattr__(self, name, value)
     
     @abstractmethod
     def getVariables(self) -> set[Variable]:
@@ -219,13 +234,47 @@ class Formula(ABC):
     
     def __eq__(self, o) -> bool:
     
-        if o.__class__ != self.__class__:
+        if self is o:
+            return True
+        elif o.__class__ != self.__class__:
+            return False
+        elif self._hash is not None and o._hash is not None:
+            # Interned formulas are unique, two different ones can't be equal
             return False
         else:
             return self.children == o.children
         
     def __hash__(self):
-        return id(self)
+        if self._hash is not None:
+            return self._hash
+        return self._structuralHash()
+
+    def __getstate__(self) -> dict:
+        # The hash of strings changes from a process to another, an interned formula is sent to another one as a regular one,
+        # so the cached fields (the private slots) are left out
+        return {name: getattr(self, name) for name in self.__publicSlots() if hasattr(self, name)}
+
+    def __setstate__(self, state : dict):
+        for name, value in state.items():
+            setattr(self, name, value)
+
+    @classmethod
+    def __publicSlots(cls) -> list[str]:
+        # Slots shadowed by a class attribute, such as the children of nullary formulas, aren't part of the state
+        return [name for klass in cls.__mro__ for name in klass.__dict__.get("__slots__", ())
+                if not name.startswith("_") and getattr(cls, name) is klass.__dict__[name]]
+
+    def _structuralHash(self) -> int:
+        """
+        Method returning a hash of the current Formula consistent with its equality, i.e. computed from its structure.
+
+        Returns
+        -------
+        int
+            The hash of the `olaaaf.formula.formula.Formula`.
+        """
+
+        return hash((self.__class__, self.children))
     
     @abstractmethod
     def __str__(self):
@@ -10,6 +10,7 @@ from .formula import Formula
 from ..constants import Constants
 
 from pyparsing import Literal, Word, srange, infix_notation, OpAssoc, ParseResults, ParserElement
+from weakref import WeakValueDictionary
 
 class FormulaManager():
     """
@@ -19,6 +20,10 @@ class FormulaManager():
     #: A way to store all known and named `olaaaf.formula.formula.Formula` so they could be accessed again more easily.
     formulaDict: dict[str, Formula] = dict()
 
+    #: The canonical instance of every `olaaaf.formula.formula.Formula` interned by `olaaaf.formula.formulaManager.FormulaManager.intern`,
+    #: only kept in memory as long as it is used elsewhere.
+    internDict: WeakValueDictionary[tuple, Formula] = WeakValueDictionary()
+
     @staticmethod
     def parser(string: str):
         '''
@@ -121,4 +126,66 @@ class FormulaManager():
         """
 
         FormulaManager.formulaDict[name] = formula
-        return formula
\ No newline at end of file
+        return formula
+
+    @staticmethod
+    def intern(formula: Formula) -> Formula:
+        """
+        Function returning the canonical instance of a `olaaaf.formula.formula.Formula`, shared by every structurally equal one
+        interned before, whose hash is computed once and for all. Two interned formulas are equal if and only if they are the same instance,
+        making their comparison immediate and removing any duplicate from the sets they are put in.
+
+        `olaaaf.formula.naryFormula.andOperator.And`, `olaaaf.formula.naryFormula.orOperator.Or`, `olaaaf.formula.unaryFormula.notOperator.Not`,
+        `olaaaf.formula.nullaryFormula.constraint.linearConstraint.LinearConstraint` and
+        `olaaaf.formula.nullaryFormula.constraint.propositionalVariable.PropositionalVariable` are interned, along with their children.
+        Any other `olaaaf.formula.formula.Formula` is returned as is.
+        An interned `olaaaf.formula.formula.Formula`, or any of its children, can't be modified afterwards and raises an error if it is:
+        the children of interned n-ary formulas are stored as a `frozenset`, and the ones to modify must be cloned first.
+
+        Attributes
+        ----------
+        formula: `olaaaf.formula.formula.Formula`
+            The `olaaaf.formula.formula.Formula` to intern.
+
+        Returns
+        -------
+        `olaaaf.formula.formula.Formula`
+            The canonical instance of `formula`, which may be `formula` itself.
+        """
+
+        from .naryFormula import And, Or
+        from .unaryFormula.notOperator import Not
+        from .nullaryFormula.constraint import LinearConstraint, PropositionalVariable
+
+        if formula._hash is not None:
+            return formula
+
+        if isinstance(formula, (And, Or)):
+            children = [(FormulaManager.intern(child), child) for child in formula.children]
+            if any(interned is not child for interned, child in children):
+                formula = formula.__class__(*(interned for interned, _ in children))
+            # Interned children are unique and compared by identity, so their frozen set is both
+            # the key and the children of the canonical formula, stored once
+            key = (formula.__class__, frozenset(interned for interned, _ in children))
+        elif isinstance(formula, Not):
+            child = FormulaManager.intern(formula.children)
+            if child is not formula.children:
+                formula = Not(child)
+            key = (Not, child)
+        elif isinstance(formula, LinearConstraint):
+            key = (LinearConstraint, formula.canonicalKey())
+        elif isinstance(formula, PropositionalVariable):
+            key = (PropositionalVariable, formula.name)
+        else:
+            return formula
+
+        canonical = FormulaManager.internDict.get(key)
+        if canonical is None:
+            if isinstance(formula, (And, Or)):
+                formula.children = key[1]
+            formula._hash = hash(formula)
+            if isinstance(formula, LinearConstraint):
+                formula.variables._frozen = True
+            FormulaManager.internDict[key] = canonical = formula
+        return canonical
+
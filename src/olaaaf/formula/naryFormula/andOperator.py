@@ -30,6 +30,8 @@ class And(NaryFormula):
     children: set of `olaaaf.formula.formula.Formula`
         The children of the current node.
     '''
+
+    __slots__ = ()
     
     _symbol = "AND"
     
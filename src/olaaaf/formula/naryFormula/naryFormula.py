@@ -28,6 +28,8 @@ class NaryFormula(Formula):
     children: set of `olaaaf.formula.formula.Formula`
         The children of the current node.
     """
+
+    __slots__ = ()
         
     def __init__(self, *formulas: Formula, fmName: str = None):
         
@@ -60,7 +62,7 @@ class NaryFormula(Formula):
             All the variables used in the \(n\)-ary `olaaaf.formula.formula.Formula` or its children.
         """
         
-        tempChildren = self.children.copy()
+        tempChildren = set(self.children)
         variables = tempChildren.pop().getVariables()
         
         for child in tempChildren:
@@ -68,6 +70,9 @@ class NaryFormula(Formula):
             
         return variables
     
+    def _structuralHash(self) -> int:
+        return hash((self.__class__, frozenset(self.children)))
+
     def clone(self) -> Formula:
         """
         Method returning a clone of the current Formula.
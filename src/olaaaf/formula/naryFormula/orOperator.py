@@ -31,6 +31,8 @@ class Or(NaryFormula):
     children: set of `olaaaf.formula.formula.Formula`
         The children of the current node.
     '''
+
+    __slots__ = ()
     
     _symbol = "OR"
     
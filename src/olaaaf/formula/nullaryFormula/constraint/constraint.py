@@ -16,5 +16,7 @@ class Constraint(NullaryFormula):
         The children of the current node.
         Since a cosntraint doesn't have any, it's None.
     '''
+
+    __slots__ = ()
     
         
\ No newline at end of file
@@ -14,11 +14,67 @@ from ....constants import Constants
 
 from fractions import Fraction
 
+import numpy as np
+import math
 import re
 
 # Typing only imports
 from ....variable.variable import Variable
 
+class _ConstraintVariables(dict):
+    """
+    Dictionary of the variables of a `olaaaf.formula.nullaryFormula.constraint.linearConstraint.LinearConstraint`, counting its modifications
+    so that the canonical key of the constraint is computed again once they are modified in place.
+    The variables of an interned constraint are frozen, any modification then raises a `TypeError`.
+    """
+
+    __slots__ = ("_version", "_frozen")
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._version = 0
+        self._frozen = False
+
+    def __reduce__(self):
+        return (self.__class__, (dict(self),))
+
+    def __modified(self):
+        if self._frozen:
+            raise TypeError("The variables of an interned LinearConstraint can't be modified, clone it first.")
+        self._version += 1
+
+    def __setitem__(self, key, value):
+        self.__modified()
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        self.__modified()
+        super().__delitem__(key)
+
+    def __ior__(self, other):
+        self.__modified()
+        return super().__ior__(other)
+
+    def pop(self, *args):
+        self.__modified()
+        return super().pop(*args)
+
+    def popitem(self):
+        self.__modified()
+        return super().popitem()
+
+    def clear(self):
+        self.__modified()
+        super().clear()
+
+    def update(self, *args, **kwargs):
+        self.__modified()
+        super().update(*args, **kwargs)
+
+    def setdefault(self, key, default = None):
+        self.__modified()
+        return super().setdefault(key, default)
+
 class LinearConstraint(Constraint):
     '''
     Abstract Constraint class, representing a Constraint in PCMLC.
@@ -54,9 +110,22 @@ class LinearConstraint(Constraint):
         it's None.
     '''
     
+    __slots__ = ("variables", "operator", "bound", "_key", "_arrays")
+
     variables: dict[Variable, Fraction]
     operator: ConstraintOperator
     bound: Fraction
+
+    # Canonical key of the constraint, its hash and the version of its variables it was computed for, None until computed
+    _key: tuple[tuple, int, int]
+    # Arrays of getArrays and the version of the variables they were computed for, None until computed
+    _arrays: tuple[np.ndarray, np.ndarray, int, int]
+
+    def __new__(cls, *args, **kwargs):
+        lc = super().__new__(cls)
+        object.__setattr__(lc, "_key", None)
+        object.__setattr__(lc, "_arrays", None)
+        return lc
     
     def __init__(self, string: str, fmName: str = None):
 
@@ -339,14 +408,97 @@ class LinearConstraint(Constraint):
             del self.variables[variable]
         if len(self.variables) == 0: raise IndexError("Not enough values in constraint")
 
+    def canonicalKey(self) -> tuple:
+        r"""
+        Method returning a key identifying the constraint up to a positive factor, computed once until the constraint is modified.
+        The constraint is written as a \(\leqslant\) or \(=\) constraint, whose coefficients are divided by their greatest common divisor,
+        the first one being positive for an equality. Its terms are sorted by the name of their variable, null coefficients being ignored.
+
+        Returns
+        -------
+        tuple of the form (tuple of tuple of the form (String, fractions.Fraction), olaaaf.formula.nullaryFormula.constraint.constraintOperator.ConstraintOperator, fractions.Fraction)
+            The normalized terms, operator and bound of the constraint.
+        """
+
+        if self._key is not None and self._key[2] == self.variables._version:
+            return self._key[0]
+
+        terms = sorted((variable.name, Fraction(coefficient)) for variable, coefficient in self.variables.items() if coefficient != 0)
+        operator = self.operator
+        bound = Fraction(self.bound)
+        if operator == ConstraintOperator.GEQ:
+            operator = ConstraintOperator.LEQ
+            terms = [(name, -coefficient) for name, coefficient in terms]
+            bound = -bound
+
+        if len(terms) > 0:
+            # Division by the greatest common divisor of the coefficients, i.e. the gcd of their numerators over the lcm of their denominators
+            factor = Fraction(math.lcm(*(coefficient.denominator for _, coefficient in terms)), math.gcd(*(coefficient.numerator for _, coefficient in terms)))
+            if operator == ConstraintOperator.EQ and terms[0][1] < 0:
+                factor = -factor
+            terms = [(name, coefficient * factor) for name, coefficient in terms]
+            bound *= factor
+
+        key = (tuple(terms), operator, bound)
+        object.__setattr__(self, "_key", (key, hash(key), self.variables._version))
+        return key
+
+    def getArrays(self) -> tuple[np.ndarray, np.ndarray, int]:
+        r"""
+        Method returning the coefficients of the constraint as parallel arrays, computed once until its variables are modified:
+        the ids of its variables, given by `olaaaf.variable.variableManager.VariableManager.getId`,
+        and the integer numerators of their coefficients over a common denominator.
+        Along with `olaaaf.variable.variableManager.VariableManager.getColumns`, a row is then built by slicing, e.g.
+        `row[columns[ids]] = numerators * Fraction(1, denominator)`.
+
+        Returns
+        -------
+        numpy.ndarray of int
+            The ids of the variables of the constraint.
+        numpy.ndarray of int
+            The numerators of their coefficients, as exact Python integers.
+        int
+            The common denominator of the coefficients.
+        """
+
+        if self._arrays is not None and self._arrays[3] == self.variables._version:
+            return self._arrays[:3]
+
+        coefficients = [Fraction(coefficient) for coefficient in self.variables.values()]
+        denominator = math.lcm(*(coefficient.denominator for coefficient in coefficients))
+        ids = np.fromiter((VariableManager.getId(variable) for variable in self.variables), dtype=np.intp, count=len(coefficients))
+        numerators = np.empty(len(coefficients), dtype=object)
+        numerators[:] = [coefficient.numerator * (denominator // coefficient.denominator) for coefficient in coefficients]
+
+        object.__setattr__(self, "_arrays", (ids, numerators, denominator, self.variables._version))
+        return ids, numerators, denominator
+
+    def __setattr__(self, name, value):
+
+        if name in ("variables", "operator", "bound") and self._hash is not None:
+            raise AttributeError("An interned LinearConstraint can't be modified, clone it first.")
+        # Any change of the constraint changes its canonical key
+        if name == "variables" and not isinstance(value, _ConstraintVariables):
+            value = _ConstraintVariables(value)
+        if name in ("variables", "operator", "bound"):
+            object.__setattr__(self, "_key", None)
+        if name == "variables":
+            object.__setattr__(self, "_arrays", None)
+        object.__setattr__(self, name, value)
+
     def __eq__(self, o) -> bool:
         
-        if o.__class__ != self.__class__:
+        if self is o:
+            return True
+        elif o.__class__ != self.__class__:
             return False
-        elif (o.variables != self.variables) | (o.operator != self.operator) | (o.bound != self.bound):
+        elif self._hash is not None and o._hash is not None:
             return False
         else:
-            return True
+            return self.canonicalKey() == o.canonicalKey()
         
     def __hash__(self):
-        return hash(str(self))
\ No newline at end of file
+        if self._hash is not None:
+            return self._hash
+        self.canonicalKey()
+        return self._key[1]
\ No newline at end of file
@@ -14,6 +14,7 @@ from ....variable.variable import Variable
 
 
 class PropositionalVariable(Constraint):
+    __slots__ = ("name",)
 
     def __init__(self, name: str, fmName: str = None):
         self.name = name
@@ -108,10 +109,16 @@ class PropositionalVariable(Constraint):
         return clonedPv
       
     def __eq__(self, o) -> bool: #BRAVO
-        if o.__class__ != self.__class__:
+        if self is o:
+            return True
+        elif o.__class__ != self.__class__:
+            return False
+        elif self._hash is not None and o._hash is not None:
             return False
         else:
             return o.name == self.name
         
     def __hash__(self):
-        return hash(str(self))
+        if self._hash is not None:
+            return self._hash
+        return hash(self.name)
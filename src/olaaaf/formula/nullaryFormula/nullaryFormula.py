@@ -18,6 +18,8 @@ class NullaryFormula(Formula):
     children: None
         The children of the current node. Since there isn't any, it's None.
     '''
+
+    __slots__ = ()
     
     children = None
     
@@ -21,6 +21,8 @@ class Top(NullaryFormula):
     children: None 
         The children of the current node.
     '''
+
+    __slots__ = ()
      
     def __init__(self):
         raise NotImplementedError(self.__class__.__name__ + ' is not yet implemented') 
@@ -24,6 +24,8 @@ class Not(UnaryFormula):
     children: `olaaaf.formula.formula.Formula`
         The child of the current node.
     '''
+
+    __slots__ = ()
         
     def toDNF(self) -> Formula:
         '''
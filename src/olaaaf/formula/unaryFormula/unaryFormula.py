@@ -20,6 +20,8 @@ class UnaryFormula(Formula):
         The child of the current node.
     '''
 
+    __slots__ = ()
+
     def __init__(self, formulaInit: Formula, fmName: str = None):
         
         self.children = formulaInit
@@ -40,5 +42,5 @@ class UnaryFormula(Formula):
         
         return self.children.getVariables()
     
-    def __hash__(self):
+    def _structuralHash(self) -> int:
         return hash(self.children)*-1
\ No newline at end of file
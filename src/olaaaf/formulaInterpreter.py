@@ -5,13 +5,19 @@ Class allowing `olaaaf.revision.Revision` to interact with a `olaaaf.mlo_solver.
 from __future__ import annotations
 
 from .formula import Formula, Or, Not, LinearConstraint, ConstraintOperator, And
-from .variable import Variable, RealVariable
+from .variable import Variable, RealVariable, VariableManager
 from .mlo_solver import OptimizationValues
 from .mlo_solver import MLOSolver
 from .distance import DistanceFunction
 from .simplificator import Simplificator
+from .constants import Constants
+from .timeBudget import TimeBudget
+from .coupleSession import CoupleSession
 
 from fractions import Fraction
+import math
+import numpy as np
+from scipy.sparse import coo_array
 
 class FormulaInterpreter:
     r"""
@@ -38,6 +44,54 @@ class FormulaInterpreter:
             simplifier._interpreter = self
             
         self._eVar = RealVariable("@")
+        self.__budget = None
+        self.__distanceVariables = dict()
+
+    def setBudget(self, budget : TimeBudget):
+        """
+        Method used to set the time budget shared by every optimization problem given to the solver, until it is changed.
+
+        Parameters
+        ----------
+        budget : olaaaf.timeBudget.TimeBudget
+            The budget to use. If set to `None`, the problems are solved without any time limit.
+        """
+
+        self.__budget = budget
+
+    def getTimeLimit(self) -> float:
+        """
+        Method returning the time limit to give to the solver for the next optimization problem.
+
+        Returns
+        -------
+        float
+            The time left in the budget, in seconds, or `None` if there is no budget.
+        """
+
+        if self.__budget is None:
+            return None
+        return self.__budget.getRemainingTime()
+
+    def checkBudget(self, res : tuple = None):
+        """
+        Method used to stop the revision once the time budget is exhausted.
+
+        Parameters
+        ----------
+        res : tuple, optional
+            The result of the last optimization problem, if any.
+
+        Raises
+        ------
+        olaaaf.timeLimitException.TimeLimitException
+            If the solver reached its time limit or if there is no time left in the budget.
+        """
+
+        from . import TimeLimitException
+
+        if (res is not None and res[0] == OptimizationValues.TIMEOUT) or (self.__budget is not None and self.__budget.isExpired()):
+            raise TimeLimitException("Time budget exhausted")
 
     def simplifyMLC(self, phi : Formula):
         """
@@ -82,39 +136,168 @@ class FormulaInterpreter:
             Booean symbolizing if \(\varphi\) is feasable (`True`) or not (`False`).
         
         """
-        variables = list(phi.getVariables())
-        variables.append(self._eVar)
-
         for lc in phi.getAdherence(self._eVar):
-            # build tabs for solver
-            constraints = []
-            for constraint in lc:
-                constraintP = []
-                for variable in variables:
-                    if variable in constraint.variables:
-                        constraintP.append(constraint.variables[variable])
-                    else:
-                        constraintP.append(Fraction(0))
-                constraints.append((constraintP, constraint.operator, constraint.bound))
-            constraintP = []
-            for var in variables: 
-                if(var == self._eVar) :
-                    constraintP.append(Fraction(-1))
-                else :
-                    constraintP.append(Fraction(0))
-            constraints.append((constraintP, ConstraintOperator.LEQ, Fraction(0)))
-
-            res = self.__MLOSolver.solve(variables, list(map(lambda v : Fraction(-1) if v == self._eVar else Fraction(0), variables)), constraints)
-
-            # Interpretion of the mlo solver result
-            if res[0] == OptimizationValues.OPTIMAL :
-                if res[1][variables.index(self._eVar)] != Fraction(0):
-                    return True
-            if res[0] == OptimizationValues.UNBOUNDED:
+            # Blocks of variables sharing no constraint are satisfiable independently
+            if all(self.__satConjunction([lc[i] for i in component]) for _, component in self._components(lc)):
                 return True
             
         return False
 
+    def __satConjunction(self, lc : list[LinearConstraint]) -> bool:
+
+        variables = list({variable for constraint in lc for variable in constraint.variables})
+
+        if len(variables) == 0:
+            return self.__MLOSolver.isFeasible(variables, [([], constraint.operator, constraint.bound) for constraint in lc])
+
+        # The epsilon variable is only needed when there are strict inequalities
+        strict = self._eVar in variables
+
+        # build arrays for solver, the coefficients of each constraint being placed by slicing
+        A, lb, ub = self._constraintArrays([(lc, VariableManager.getColumns({variable: i for i, variable in enumerate(variables)}))],
+                                           len(variables))
+        colLb, colUb, integrality = self._variableArrays(variables)
+
+        if not strict:
+            res = self.__MLOSolver.isFeasibleArrays(A, lb, ub, colLb, colUb, integrality, timeLimit=self.getTimeLimit())
+            if res[0] == OptimizationValues.OPTIMAL or res[0] == OptimizationValues.UNBOUNDED:
+                return True
+            self.checkBudget(res)
+            return False
+
+        # maximize epsilon, with epsilon >= 0
+        c = np.zeros(len(variables))
+        epsilon = variables.index(self._eVar)
+        c[epsilon] = -1
+        colLb[epsilon] = max(colLb[epsilon], 0)
+
+        res = self.__MLOSolver.solveArrays(c, A, lb, ub, colLb, colUb, integrality, timeLimit=self.getTimeLimit(), exact=True)
+        self.checkBudget(res)
+
+        # Interpretion of the mlo solver result
+        if res[0] == OptimizationValues.OPTIMAL :
+            if res[1][epsilon] != Fraction(0):
+                return True
+        if res[0] == OptimizationValues.UNBOUNDED:
+            return True
+
+        return False
+
+    def _variableArrays(self, variables : list[Variable]) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Method returning the bounds and the type of some variables, as expected by `olaaaf.mlo_solver.MLOSolver.MLOSolver.solveArrays`.
+
+        Parameters
+        ----------
+        variables : list of `olaaaf.variable.variable.Variable`
+            The variable of each column.
+
+        Returns
+        -------
+        numpy.ndarray
+            The lower bound of each column, or `-numpy.inf`.
+        numpy.ndarray
+            The upper bound of each column, or `numpy.inf`.
+        numpy.ndarray
+            Whether each column is an integer.
+        """
+
+        bounds = [variable.getBounds() for variable in variables]
+        colLb = np.array([-np.inf if lower is None else float(lower) for lower, _ in bounds], dtype=np.float64)
+        colUb = np.array([np.inf if upper is None else float(upper) for _, upper in bounds], dtype=np.float64)
+        return colLb, colUb, np.array([variable.isInteger() for variable in variables], dtype=bool)
+
+    def _constraintArrays(self, blocks : list[tuple[list[LinearConstraint], np.ndarray]], size : int) -> tuple[coo_array, np.ndarray, np.ndarray]:
+        """
+        Method returning constraints as expected by `olaaaf.mlo_solver.MLOSolver.MLOSolver.solveArrays`, i.e. a sparse matrix of floats
+        and the lower and upper bounds of its rows, without building any `fractions.Fraction`.
+
+        Parameters
+        ----------
+        blocks : list of tuple of the form (list of `olaaaf.formula.nullaryFormula.constraint.linearConstraint.LinearConstraint`, numpy.ndarray)
+            Constraints, along with the column of each variable id as given by `olaaaf.variable.variableManager.VariableManager.getColumns`.
+        size : int
+            The number of columns.
+
+        Returns
+        -------
+        scipy.sparse.coo_array
+            The weights of the constraints, one row per constraint in the order of `blocks`.
+        numpy.ndarray
+            The lower bound of each row, or `-numpy.inf`.
+        numpy.ndarray
+            The upper bound of each row, or `numpy.inf`.
+        """
+
+        rows, cols, values = [np.empty(0, dtype=np.intp)], [np.empty(0, dtype=np.intp)], [np.empty(0)]
+        lb, ub = [], []
+
+        for constraints, columns in blocks:
+            for constraint in constraints:
+                ids, numerators, denominator = constraint.getArrays()
+                rows.append(np.full(len(ids), len(lb), dtype=np.intp))
+                cols.append(columns[ids])
+                values.append(np.asarray(numerators / denominator, dtype=np.float64))
+                bound = float(constraint.bound)
+                lb.append(-np.inf if constraint.operator == ConstraintOperator.LEQ else bound)
+                ub.append(np.inf if constraint.operator == ConstraintOperator.GEQ else bound)
+
+        A = coo_array((np.concatenate(values), (np.concatenate(rows), np.concatenate(cols))), shape=(len(lb), size))
+        return A, np.array(lb, dtype=np.float64), np.array(ub, dtype=np.float64)
+
+    def _components(self, constraints : list[LinearConstraint], variables : list[Variable] = None) -> list[tuple[list[Variable], list[int]]]:
+        """
+        Method used to split constraints in independent blocks, i.e. the connected components of the graph linking each
+        constraint to its variables.
+
+        Parameters
+        ----------
+        constraints : list of `olaaaf.formula.nullaryFormula.constraint.linearConstraint.LinearConstraint`
+            The constraints to split.
+        variables : list of `olaaaf.variable.variable.Variable`, optional
+            The variables to split, in the order wanted for each block. By default, the variables of the constraints.
+
+        Returns
+        -------
+        list of tuple of the form (list of `olaaaf.variable.variable.Variable`, list of int)
+            The variables and the indexes of the constraints of each block.
+            If a constraint has no variable, or if a variable is in no constraint, everything is kept in a single block.
+        """
+
+        parent = dict()
+
+        def find(variable):
+            while parent[variable] is not variable:
+                parent[variable] = parent[parent[variable]]
+                variable = parent[variable]
+            return variable
+
+        roots = []
+        for constraint in constraints:
+            root = None
+            for variable in constraint.variables:
+                parent.setdefault(variable, variable)
+                current = find(variable)
+                if root is None:
+                    root = current
+                elif current is not root:
+                    parent[current] = root
+            roots.append(root)
+
+        if variables is None:
+            variables = list(parent)
+
+        if None in roots or any(variable not in parent for variable in variables):
+            return [(list(variables), list(range(len(constraints))))]
+
+        blocks = dict()
+        for variable in variables:
+            blocks.setdefault(find(variable), ([], []))[0].append(variable)
+        for i, root in enumerate(roots):
+            blocks.setdefault(find(root), ([], []))[1].append(i)
+
+        return list(blocks.values())
+
     def findOneSolution(self, variables : list[Variable], psi : And, mu : And, maxDist: Fraction) -> tuple[Fraction, Formula]:
         r"""
         Method used to interact with the initialy specified `olaaaf.mlo_solver.MLOSolver.MLOSolver`, thus finding one solution of
@@ -150,87 +333,170 @@ class FormulaInterpreter:
 
         from . import InfeasableException
 
-        weights = self.__distanceFunction.getWeights()
-        constraints = self.__buildConstraints(variables, psi, mu)
+        psiConstraints = [constraint for lc in psi.getAdherence() for constraint in lc]
+        muConstraints = [constraint for lc in mu.getAdherence() for constraint in lc]
 
-        if maxDist is not None:
-            # Ptet faire ça plus tôt mais bon, ça fonctionne comme ça c'est du prototypage
-            minDistLc = ([0] * len(variables) * 2 + [weights[variable] for variable in variables], ConstraintOperator.LEQ, maxDist)
-            constraints.append(minDistLc)
+        # The distance is separable, each block of variables sharing no constraint is solved on its own
+        problems = []
+        for blockVariables, block in self._components(psiConstraints + muConstraints, variables):
+            blockPsi = [psiConstraints[i] for i in block if i < len(psiConstraints)]
+            blockMu = [muConstraints[i - len(psiConstraints)] for i in block if i >= len(psiConstraints)]
+            problems.append((blockVariables, self.__coupleProblem(blockVariables, blockPsi, blockMu)))
 
-        # Creation of the objective function
-        obj = [0] * len(variables) * 2 + [weights[variable] for variable in variables]
-        
-        # Solve the optimization problem
-        res = self.__MLOSolver.solve(variables * 3, obj, constraints)
+        distance = Fraction(0)
+        point = dict()
 
-        # Interpretation of the MLO solver result
-        if res[0] == OptimizationValues.INFEASIBLE: 
-            raise InfeasableException("Optimize couple impossible") 
+        if len(problems) > 1 and Constants.PARALLEL_COMPONENTS_SIZE is not None \
+            and sum(len(problem[0]) for _, (problem, _) in problems) >= Constants.PARALLEL_COMPONENTS_SIZE:
+
+            # The sparse problems are sent as they are to the processes, whose results are only checked against maxDist as a whole.
+            # Blocks whose distance is null whatever the point only need a feasible one
+            feasibility = [not np.any(problem[0]) for _, (problem, _) in problems]
+            optimized = iter(self.__MLOSolver.solveMany([problem + (maxDist, self.getTimeLimit(), True)
+                                                         for (_, (problem, _)), feasible in zip(problems, feasibility) if not feasible],
+                                                        method="solveArrays"))
+            found = iter(self.__MLOSolver.solveMany([problem[1:] + (self.getTimeLimit(), True)
+                                                     for (_, (problem, _)), feasible in zip(problems, feasibility) if feasible],
+                                                    method="isFeasibleArrays"))
+
+            for (blockVariables, (_, y)), feasible in zip(problems, feasibility):
+                res = next(found) + (Fraction(0),) if feasible else next(optimized)
+                distance += self.__readCouple(res, blockVariables, y, point)
+
+            if maxDist is not None and distance > self.__MLOSolver._relaxedCutoff(maxDist):
+                raise InfeasableException("Optimize couple impossible")
+
+        else:
+            for blockVariables, (problem, y) in problems:
+                cutoff = None if maxDist is None else maxDist - distance
+                if not np.any(problem[0]) and (cutoff is None or cutoff >= 0):
+                    # The distance of the block is null whatever the point, a feasible one is enough
+                    res = self.__MLOSolver.isFeasibleArrays(*problem[1:], timeLimit=self.getTimeLimit(), exact=True) + (Fraction(0),)
+                else:
+                    # Solve the optimization problem, the couple being abandoned as soon as it can't beat maxDist
+                    res = self.__MLOSolver.solveArrays(*problem, cutoff=cutoff, timeLimit=self.getTimeLimit(), exact=True)
+                distance += self.__readCouple(res, blockVariables, y, point)
 
-        values = res[1]
         resSet = set()
-        for i, variable in enumerate(variables):
+        for variable in variables:
             lc = LinearConstraint("")
             lc.variables = {variable: Fraction(1)}
             lc.operator = ConstraintOperator.EQ
-            lc.bound = Fraction(values[len(variables) + i])
+            lc.bound = point[variable]
             resSet.add(lc)
         
-        return res[2], And(*resSet)
+        return distance, And(*resSet)
 
+    def __coupleProblem(self, variables : list[Variable], psiConstraints : list[LinearConstraint], muConstraints : list[LinearConstraint])\
+        -> tuple[tuple[np.ndarray, coo_array, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray], dict[Variable, int]]:
+        shared = {variable for constraint in psiConstraints for variable in constraint.variables}\
+            & {variable for constraint in muConstraints for variable in constraint.variables}
+        columns, x, y, z, obj = self._coupleColumns(variables, shared)
+        A, lb, ub = self._buildConstraints(psiConstraints, muConstraints, x, y, z, len(columns))
+        return (np.array(obj, dtype=np.float64), A, lb, ub, *self._variableArrays(columns)), y
 
-    def __buildConstraints(self, variables : list[Variable], psi : And, mu : And) -> dict[tuple[dict[Fraction], ConstraintOperator, Fraction]]:
-        '''
-        Method used to build table of constraints, for the solver, linked to phi and mu
+    def __readCouple(self, res : tuple[OptimizationValues, list[Fraction], Fraction], variables : list[Variable], y : dict[Variable, int],
+                     point : dict[Variable, Fraction]) -> Fraction:
+
+        from . import InfeasableException
+
+        self.checkBudget(res)
+
+        # Interpretation of the MLO solver result
+        if res[0] == OptimizationValues.INFEASIBLE: 
+            raise InfeasableException("Optimize couple impossible") 
+
+        for variable in variables:
+            point[variable] = Fraction(res[1][y[variable]])
+        return res[2]
+
+
+    def _coupleColumns(self, variables : list[Variable], shared : set[Variable])\
+        -> tuple[list[Variable], dict[Variable, int], dict[Variable, int], dict[Variable, int], list[Fraction]]:
+        r"""
+        Method used to choose the columns of the optimization problem of `findOneSolution`, keeping it as small as possible.
+        Each variable has a column for \(x\), \(y\) and \(z\), with \(|x - y| \leq z\), except when the distance term is provably zero:
+        a variable with a null weight doesn't need \(z\), and a variable only used on one side shares a single column for \(x\) and \(y\),
+        since the other side is free and thus equal at the optimum.
+        Since \(|x - y|\) isn't bounded as the variable is, \(z\) has its own anonymous variable, bounded by 0 and the width of the domain.
+
+        Parameters
+        ----------
+        variables : list of `olaaaf.variable.variable.Variable`
+            List of all the `olaaaf.variable.variable.Variable` in use in both \(\psi\) and \(\mu\).
+        shared : set of `olaaaf.variable.variable.Variable`
+            The variables whose \(x\) and \(y\) must be kept apart, usually the ones in use in both \(\psi\) and \(\mu\).
+
+        Returns
+        -------
+        list of `olaaaf.variable.variable.Variable`
+            The variable of each column.
+        dict of `olaaaf.variable.variable.Variable` to int
+            The column of \(x\), \(y\) and \(z\) of each variable, the last one only for the variables having one.
+        list of fractions.Fraction
+            The objective function \(\sum_i w_i z_i\).
+        """
+
+        weights = self.__distanceFunction.getWeights()
+        columns = []
+        x, y, z = dict(), dict(), dict()
+
+        for variable in variables:
+            x[variable] = len(columns)
+            columns.append(variable)
+            if variable not in shared and weights[variable] >= 0:
+                y[variable] = x[variable]
+                continue
+            y[variable] = len(columns)
+            columns.append(variable)
+            if weights[variable] != 0:
+                z[variable] = len(columns)
+                columns.append(self.__distanceVariable(variable))
+
+        obj = [0] * len(columns)
+        for variable, column in z.items():
+            obj[column] = weights[variable]
+
+        return columns, x, y, z, obj
+
+    def __distanceVariable(self, variable : Variable) -> Variable:
+
+        # One variable per declared variable, so that the columns of z stay the same from one problem to the other
+        if variable not in self.__distanceVariables:
+            lower, upper = variable.getBounds()
+            width = None if lower is None or upper is None else upper - lower
+            self.__distanceVariables[variable] = variable.__class__.declareAnonymous(ending="z" + variable.name, lowerBound=Fraction(0), upperBound=width)
+        return self.__distanceVariables[variable]
+
+    def _buildConstraints(self, psi : list[LinearConstraint], mu : list[LinearConstraint], x : dict[Variable, int], y : dict[Variable, int], z : dict[Variable, int],
+                           size : int) -> tuple[coo_array, np.ndarray, np.ndarray]:
+        r'''
+        Method used to build the constraints, for the solver, linked to psi and mu, as a sparse matrix of floats.
+        \(x\) is constrained by psi, \(y\) by mu and \(|x - y| \leq z\), with the columns given by `_coupleColumns`.
         
         Attributes
         ----------
-        variables : list of variables
-        phi : a formula (And)
-        mu : a formula (And)
+        psi : constraints of psi
+        mu : constraints of mu
+        x, y, z : columns of each variable
+        size : number of columns
 
         Returns
         -------
-        res: table of constraint wich simbolyze all of constraints of phi and mu
+        res: matrix, lower and upper bounds of the constraints of psi and mu,
+        as expected by `olaaaf.mlo_solver.MLOSolver.MLOSolver.solveArrays`
         '''
-        constraints = []
-        i = 0
-        for formula in [psi, mu]:
-            for lc in formula.getAdherence():
-                for constraint in lc:
-                    constraintP = []
-                    for _ in range(0,(len(variables)) *i):
-                        constraintP.append(0)
-                    for variable in variables:
-                        if variable in constraint.variables:
-                            constraintP.append(constraint.variables[variable])
-                        else:
-                            constraintP.append(0)
-                    for _ in range(0,(len(variables)) *(2-i)):
-                        constraintP.append(0)
-                    constraints.append((constraintP, constraint.operator, constraint.bound))
-            i += 1
-        for variable in variables:
-            constraintP = []
-            constraintN = []
-            index = variables.index(variable)
-            for i in range(0, len(variables)*3):
-                if i == index:
-                    constraintP.append(1)
-                    constraintN.append(-1)
-                elif i == index + len(variables):
-                    constraintP.append(-1)
-                    constraintN.append(1)
-                elif i == index + len(variables)*2:
-                    constraintP.append(-1)
-                    constraintN.append(-1)
-                else:
-                    constraintP.append(0)
-                    constraintN.append(0)
-            constraints.append((constraintP, ConstraintOperator.LEQ, 0))
-            constraints.append((constraintN, ConstraintOperator.LEQ, 0))
-        return constraints
+        A, lb, ub = self._constraintArrays([(psi, VariableManager.getColumns(x)), (mu, VariableManager.getColumns(y))], size)
+
+        # x - y - z <= 0 and - x + y - z <= 0, each variable having two rows of three weights
+        xs, ys, zs = (np.array([columns[variable] for variable in z], dtype=np.intp) for columns in (x, y, z))
+        rows = len(lb) + np.repeat(np.arange(2 * len(z)), 3)
+        cols = np.stack([xs, ys, zs, xs, ys, zs], axis=1).ravel()
+        values = np.tile(np.array([1., -1., -1., -1., 1., -1.]), len(z))
+
+        A = coo_array((np.concatenate([A.data, values]), (np.concatenate([A.row, rows]), np.concatenate([A.col, cols]))),
+                      shape=(len(lb) + 2 * len(z), size))
+        return A, np.concatenate([lb, np.full(2 * len(z), -np.inf)]), np.concatenate([ub, np.zeros(2 * len(z))])
 
     def optimizeCouple(self, psi : And, mu : And, maxDist: Fraction) -> tuple[Fraction, Formula]:
         r"""
@@ -268,6 +534,126 @@ class FormulaInterpreter:
 
         return self.findOneSolution(variables, psi, mu, maxDist)    
 
+    def coupleLowerBound(self, psi : And, mu : And) -> float:
+        r"""
+        Method returning a lower bound of the distance found by `optimizeCouple`, much cheaper to compute since it is the optimum
+        of the linear relaxation of its optimization problem, i.e. with every variable considered real.
+
+        Parameters
+        ----------
+        psi, mu : `olaaaf.formula.naryFormula.andOperator.And`
+            \(\psi\) and \(\mu\), conjunctions of `olaaaf.formula.nullaryFormula.constraint.linearConstraint.LinearConstraint`.
+
+        Returns
+        -------
+        float
+            The lower bound, or `math.inf` if the relaxation, and thus the couple, is infeasible.
+        """
+
+        variables = list(And(psi, mu).getVariables())
+        psiConstraints = [constraint for lc in psi.getAdherence() for constraint in lc]
+        muConstraints = [constraint for lc in mu.getAdherence() for constraint in lc]
+        (c, A, lb, ub, colLb, colUb, integrality), _ = self.__coupleProblem(variables, psiConstraints, muConstraints)
+
+        res = self.__MLOSolver.solveArrays(c, A, lb, ub, colLb, colUb, np.zeros_like(integrality), timeLimit=self.getTimeLimit())
+        self.checkBudget(res)
+
+        if res[0] == OptimizationValues.INFEASIBLE:
+            return math.inf
+        if res[0] == OptimizationValues.UNBOUNDED:
+            return -math.inf
+        return float(res[2])
+
+    def boundingBox(self, phi : And, variables : list[Variable], rounds : int = 20) -> tuple[np.ndarray, np.ndarray]:
+        r"""
+        Method returning a box containing every model of a conjunction of `olaaaf.formula.nullaryFormula.constraint.linearConstraint.LinearConstraint`,
+        found by propagating the bounds of the variables through the constraints, without any call to the solver.
+
+        Parameters
+        ----------
+        phi : `olaaaf.formula.naryFormula.andOperator.And`
+            \(\varphi\), conjunction of `olaaaf.formula.nullaryFormula.constraint.linearConstraint.LinearConstraint`.
+        variables : list of `olaaaf.variable.variable.Variable`
+            The variables whose bounds are wanted, those not in use in \(\varphi\) are only bounded by their own bounds.
+        rounds : int, optional
+            Maximum number of propagations through all the constraints. By default, set to 20.
+
+        Returns
+        -------
+        numpy.ndarray
+            The lower bound of each variable, or `-numpy.inf`.
+        numpy.ndarray
+            The upper bound of each variable, or `numpy.inf`.
+        """
+
+        columns = VariableManager.getColumns({variable: i for i, variable in enumerate(variables)})
+        lower = np.array([-np.inf if variable.getBounds()[0] is None else float(variable.getBounds()[0]) for variable in variables])
+        upper = np.array([np.inf if variable.getBounds()[1] is None else float(variable.getBounds()[1]) for variable in variables])
+        integer = np.array([variable.isInteger() for variable in variables], dtype=bool)
+
+        # Every constraint is written as one or two rows of A x <= b
+        rows, b = [], []
+        for lc in phi.getAdherence():
+            for constraint in lc:
+                ids, numerators, denominator = constraint.getArrays()
+                row = np.zeros(len(variables))
+                row[columns[ids]] = (numerators / denominator).astype(float)
+                if constraint.operator != ConstraintOperator.GEQ:
+                    rows.append(row)
+                    b.append(float(constraint.bound))
+                if constraint.operator != ConstraintOperator.LEQ:
+                    rows.append(-row)
+                    b.append(-float(constraint.bound))
+
+        if len(rows) > 0:
+            A = np.array(rows)
+            b = np.array(b)
+            positive, negative = A > 0, A < 0
+
+            with np.errstate(invalid="ignore", divide="ignore"):
+                for _ in range(rounds):
+                    # Smallest possible value of each term, and of each row without the term
+                    terms = np.where(positive, A * lower, np.where(negative, A * upper, 0))
+                    infinite = np.isneginf(terms)
+                    finiteSum = np.where(infinite, 0, terms).sum(axis=1, keepdims=True)
+                    infiniteCount = infinite.sum(axis=1, keepdims=True)
+                    others = np.where(infinite, np.where(infiniteCount == 1, finiteSum, -np.inf),
+                                      np.where(infiniteCount == 0, finiteSum - terms, -np.inf))
+                    limit = (b[:, None] - others) / np.where(A == 0, 1, A)
+
+                    newUpper = np.minimum(upper, np.where(positive, limit, np.inf).min(axis=0))
+                    newLower = np.maximum(lower, np.where(negative, limit, -np.inf).max(axis=0))
+                    newUpper = np.where(integer, np.floor(newUpper + 1e-9), newUpper)
+                    newLower = np.where(integer, np.ceil(newLower - 1e-9), newLower)
+
+                    changed = np.any(newUpper < upper - 1e-9) or np.any(newLower > lower + 1e-9)
+                    lower, upper = newLower, newUpper
+                    if not changed:
+                        break
+
+        # Floating point errors shouldn't make the box smaller than it is
+        return lower - 1e-6 * np.maximum(1, np.abs(lower)), upper + 1e-6 * np.maximum(1, np.abs(upper))
+
+    def createCoupleSession(self, psi : And, mus : list[And]) -> CoupleSession:
+        r"""
+        Method returning a `olaaaf.coupleSession.CoupleSession`, allowing to solve the optimization problem of `optimizeCouple`
+        for a single \(\psi\) and multiple \(\mu\) without rebuilding the whole problem each time.
+
+        Parameters
+        ----------
+        psi : `olaaaf.formula.naryFormula.andOperator.And`
+            \(\psi\), conjunction of `olaaaf.formula.nullaryFormula.constraint.linearConstraint.LinearConstraint`.
+        mus : list of `olaaaf.formula.formula.Formula`
+            Every \(\mu\) that will be given to the session, only used to know their variables.
+
+        Returns
+        -------
+        olaaaf.coupleSession.CoupleSession
+            The session, to be freed with its `close` method once it isn't used anymore.
+        """
+
+        return CoupleSession(self, self.__MLOSolver, psi, set().union(*(mu.getVariables() for mu in mus)))
+
     def removeNot(self, phi: And, epsilon = Fraction(0)) -> And:
         r"""
         Method used to transform a conjunction of litterals (i.e `olaaaf.formula.nullaryFormula.constraint.linearConstraint.LinearConstraint`
@@ -340,26 +726,21 @@ class FormulaInterpreter:
 
         from . import InfeasableException
 
-        # Reorder variables order
+        # Reorder variables order, x and y are never merged since d(x,y) >= lambdaEpsilon may be reached on any variable
         variables = list(variables)
-        constraints = self.__buildConstraints(variables, psi, mu)
-
-        weights = self.__distanceFunction.getWeights()
+        columns, x, y, z, obj = self._coupleColumns(variables, set(variables))
+        A, lb, ub = self._buildConstraints([constraint for lc in psi.getAdherence() for constraint in lc],
+                                            [constraint for lc in mu.getAdherence() for constraint in lc], x, y, z, len(columns))
+        c = np.array(obj, dtype=np.float64)
 
-        if maxDist is not None:
-            # Ptet faire ça plus tôt mais bon, ça fonctionne comme ça c'est du prototypage
-            minDistLc = ([0] * len(variables) * 2 + [weights[variable] for variable in variables], ConstraintOperator.LEQ, maxDist)
-            constraints.append(minDistLc)
-
-        # creation of the objective function
-        obj = [0]*len(variables)*2
-        constraintLambdaEpsilon = [0]*len(variables)*2
-        for variable in variables:
-            obj.append(weights[variable])
-            constraintLambdaEpsilon.append(-weights[variable])
-        constraints.append((constraintLambdaEpsilon, ConstraintOperator.LEQ, -lambdaEpsilon))
+        # creation of the constraint d(x,y) >= lambdaEpsilon
+        zs = np.array(list(z.values()), dtype=np.intp)
+        A = coo_array((np.concatenate([A.data, c[zs]]), (np.concatenate([A.row, np.full(len(zs), len(lb))]), np.concatenate([A.col, zs]))),
+                      shape=(len(lb) + 1, len(columns)))
+        lb, ub = np.append(lb, float(lambdaEpsilon)), np.append(ub, np.inf)
 
-        res = self.__MLOSolver.solve(variables*3, obj, constraints)
+        res = self.__MLOSolver.solveArrays(c, A, lb, ub, *self._variableArrays(columns), cutoff=maxDist, timeLimit=self.getTimeLimit(), exact=True)
+        self.checkBudget(res)
 
         # interpretation of the mlo solver result
         if(res[0] == OptimizationValues.INFEASIBLE): 
@@ -367,11 +748,11 @@ class FormulaInterpreter:
         
         values = res[1]
         resSet = set([])
-        for i in range(0,len(variables)):
+        for variable in variables:
             lc = LinearConstraint("") 
-            lc.variables = {variables[i]: Fraction(1)}
+            lc.variables = {variable: Fraction(1)}
             lc.operator = ConstraintOperator.EQ
-            lc.bound = Fraction(values[len(variables)+i])
+            lc.bound = Fraction(values[y[variable]])
             resSet.add(lc)
         return (res[2], And(*resSet))
 
@@ -416,3 +797,324 @@ class FormulaInterpreter:
 
         return self.findOneSolutionWithLimit(variables, psi, mu, lambdaEpsilon, maxDist)
     
+
+    def optimizeCoupleDiscretized(self, psi : And, mu : And, epsilon : Fraction) -> Formula:
+        r"""
+        Method used to find a point of \(\mu\) at the discretized distance of \(\psi\), when the point found by `optimizeCouple`
+        on their adherences isn't a model of \(\mu\) and \(\psi\) and \(\mu\) are conjunctions of litterals.
+        The strict inequalities of both formulas are relaxed by \(\epsilon\) as in `removeNot`, and the closest couple
+        of the relaxed formulas is found by `optimizeCouple`:
+
+        \[
+            \begin{cases}
+                x \in \mathcal{M}(\psi_\epsilon) \\
+                y \in \mathcal{M}(\mu_\epsilon) \\
+                \text{minimize } d(x, y)
+            \end{cases}
+        \]
+
+        Its distance is the one of the adherences rounded up to a multiple of \(\epsilon\), already known by the caller,
+        so only the point is returned.
+
+        Parameters
+        ----------
+        psi, mu : `olaaaf.formula.naryFormula.andOperator.And`
+            \(\psi\) and \(\mu\), conjunctions of litterals (i.e `olaaaf.formula.nullaryFormula.constraint.linearConstraint.LinearConstraint`
+            and `olaaaf.formula.unaryFormula.notOperator.Not` of `olaaaf.formula.nullaryFormula.constraint.linearConstraint.LinearConstraint`).
+        epsilon : `fraction.Fraction`
+            The discretization step \(\epsilon\), used to relax the strict inequalities.
+
+        Returns
+        -------
+        `olaaaf.formula.formula.Formula`
+            `olaaaf.formula.formula.Formula` representing a point \(y \in \mathcal{M}(\mu_\epsilon)\) that satisfies the optimization problem above.
+
+        Raises
+        ------
+        olaaaf.InfeasableException
+            If \(\psi_\epsilon\) or \(\mu_\epsilon\) has no model.
+        """
+
+        return self.optimizeCouple(self.removeNot(psi, epsilon), self.removeNot(mu, epsilon), None)[1]
+
+    def optimizeFormulas(self, psi : Formula, mu : Formula, epsilon : Fraction = Fraction(0), lambdaEpsilon : Fraction = None) -> tuple[Fraction, Formula]:
+        r"""
+        Method used to solve the optimization problem of `optimizeCouple`, or of `optimizeCoupleWithLimit` if \(\lambda_\epsilon\) is given,
+        when \(\psi\) and \(\mu\) are any `olaaaf.formula.formula.Formula` instead of conjunctions, in a single mixed linear problem
+        and without putting them in Disjunctive Normal Form.
+
+        Each disjunction is encoded by binary selectors, one per child, exactly one of them being set to 1 when the disjunction has to hold.
+        The constraints of a child are only enforced when its selector is set, through a big-M reformulation
+        \(\sum_{j=1}^{n}a_jx_j \leqslant b + M(1 - \delta)\), where \(M\) is found from the bounds of the variables,
+        or starts at `olaaaf.constants.Constants.DISJUNCTIVE_BIG_M` when they aren't bounded. In this last case, \(M\) is multiplied
+        by `olaaaf.constants.Constants.DISJUNCTIVE_BIG_M_GROWTH` and the problem solved again as long as a relaxed constraint
+        reaches \(b + M\) and the distance found decreases, so that the models far from the constraints aren't missed.
+
+        Parameters
+        ----------
+        psi, mu : `olaaaf.formula.formula.Formula`
+            \(\psi\) and \(\mu\), in the PCMLC formalism.
+        epsilon : `fraction.Fraction`, optional
+            The approximation used for the strict inequalities, i.e. the negations of `olaaaf.formula.nullaryFormula.constraint.linearConstraint.LinearConstraint`.
+            By default, set to 0 (the adherence of the formulas is used).
+        lambdaEpsilon : `fraction.Fraction`, optional
+            If given, the minimal distance \(d(x,y) \geq \lambda_\epsilon\) is looked for, as in `optimizeCoupleWithLimit`.
+            By default, set to `None`.
+
+        Returns
+        -------
+        Fraction
+            Minimal distance (calculated with the `olaaaf.distance.distance_function.distanceFunction.DistanceFunction`
+            given at the initialization of the class) between \(\psi\) and \(\mu\).
+        `olaaaf.formula.formula.Formula`
+            `olaaaf.formula.formula.Formula` representing a point \(y \in \mathcal{M}(\mu)\) at this distance.
+
+        Raises
+        ------
+        olaaaf.InfeasableException
+            If \(\psi\) or \(\mu\) has no model.
+        """
+
+        from . import InfeasableException
+
+        psiVariables = self.__formulaVariables(psi)
+        muVariables = self.__formulaVariables(mu)
+        variables = list(psiVariables | muVariables)
+
+        # With a limit, x and y are never merged since d(x,y) >= lambdaEpsilon may be reached on any variable
+        shared = set(variables) if lambdaEpsilon is not None else psiVariables & muVariables
+        columns, x, y, z, obj = self._coupleColumns(variables, shared)
+
+        rows, cols, values = [], [], []
+        operators, bounds = [], []
+        psiLitterals, muLitterals = [], []
+        relaxed = []
+        self.__encodeFormula(psi, x, None, False, epsilon, (columns, (rows, cols, values), operators, bounds, psiLitterals, relaxed))
+        self.__encodeFormula(mu, y, None, False, epsilon, (columns, (rows, cols, values), operators, bounds, muLitterals, relaxed))
+
+        # x - y - z <= 0 and - x + y - z <= 0
+        for variable, column in z.items():
+            for sign in (1, -1):
+                row = len(bounds)
+                rows += [row, row, row]
+                cols += [x[variable], y[variable], column]
+                values += [sign, -sign, -1]
+                operators.append(ConstraintOperator.LEQ)
+                bounds.append(Fraction(0))
+
+        if lambdaEpsilon is not None:
+            row = len(bounds)
+            for column in z.values():
+                rows.append(row)
+                cols.append(column)
+                values.append(-obj[column])
+            operators.append(ConstraintOperator.LEQ)
+            bounds.append(-lambdaEpsilon)
+
+        obj = obj + [0] * (len(columns) - len(obj))
+        previous = None
+        while True:
+            res = self.__MLOSolver.solveSparse(columns, obj, (rows, cols, values), operators, bounds, timeLimit=self.getTimeLimit())
+            self.checkBudget(res)
+
+            if res[0] != OptimizationValues.OPTIMAL:
+                raise InfeasableException("Optimize formulas impossible")
+
+            # A relaxed constraint reaching b + M may cut out closer models of an unchosen child: M is grown and the problem
+            # solved again, until no such constraint remains or M no longer changes the distance
+            binding = [entry for entry in relaxed if self.__reachesBigM(entry, res[1])]
+            if len(binding) > 0 and (previous is None or res[2] < previous):
+                previous = res[2]
+                for entry in binding:
+                    row, index, bound, _, bigM, _ = entry
+                    entry[4] = bigM * Constants.DISJUNCTIVE_BIG_M_GROWTH
+                    values[index] = entry[4]
+                    bounds[row] = bound + entry[4]
+                continue
+
+            # Without epsilon, the strict inequalities are replaced by their adherence, that may be reached while the chosen
+            # conjunction has no model: as in the Disjunctive Normal Form, it must be satisfiable for its adherence to be used,
+            # otherwise the choice of its selectors is cut out and the problem solved again
+            cuts = 0
+            for litterals in (psiLitterals, muLitterals) if epsilon == 0 else ():
+                chosen = [litteral for litteral, guard in litterals if guard is None or res[1][guard] > 0.5]
+                if len(chosen) == 0 or self.sat(And(*chosen)):
+                    continue
+                selectors = sorted({guard for _, guard in litterals if guard is not None and res[1][guard] > 0.5})
+                if len(selectors) == 0:
+                    raise InfeasableException("Optimize formulas impossible")
+                row = len(bounds)
+                rows += [row] * len(selectors)
+                cols += selectors
+                values += [1] * len(selectors)
+                operators.append(ConstraintOperator.LEQ)
+                bounds.append(Fraction(len(selectors) - 1))
+                cuts += 1
+            if cuts == 0:
+                break
+
+        resSet = set()
+        for variable in variables:
+            lc = LinearConstraint("")
+            lc.variables = {variable: Fraction(1)}
+            lc.operator = ConstraintOperator.EQ
+            lc.bound = Fraction(res[1][y[variable]])
+            resSet.add(lc)
+
+        return res[2], And(*resSet)
+
+    def holds(self, phi : Formula, point : And) -> bool:
+        r"""
+        Method used to verify that a point satisfies a `olaaaf.formula.formula.Formula`, without any call to the solver.
+        The constraints are checked up to the precision of the solvers, except the strict inequalities that must hold beyond it.
+
+        Parameters
+        ----------
+        phi : `olaaaf.formula.formula.Formula`
+            \(\varphi\), in the PCMLC formalism.
+        point : `olaaaf.formula.naryFormula.andOperator.And`
+            Conjunction of `olaaaf.formula.nullaryFormula.constraint.linearConstraint.LinearConstraint` of the form \(x_i = v_i\),
+            giving the value of every variable of \(\varphi\).
+
+        Returns
+        -------
+        boolean
+            `True` if the point is a model of \(\varphi\), `False` otherwise.
+        """
+
+        values = {variable: constraint.bound for constraint in point.children for variable in constraint.variables}
+        return self.__holds(phi, values, False)
+
+    def __holds(self, phi : Formula, values : dict[Variable, Fraction], negated : bool) -> bool:
+
+        from .formula import BinaryFormula, Top, Bottom
+
+        if isinstance(phi, BinaryFormula):
+            return self.__holds(phi._eliminate(), values, negated)
+        if isinstance(phi, Not):
+            return self.__holds(phi.children, values, not negated)
+        if isinstance(phi, (And, Or)):
+            results = (self.__holds(child, values, negated) for child in phi.children)
+            return all(results) if isinstance(phi, And) != negated else any(results)
+        if isinstance(phi, Top):
+            return not negated
+        if isinstance(phi, Bottom):
+            return negated
+
+        value = sum(weight * values[variable] for variable, weight in phi.variables.items())
+        tolerance = Fraction(1, 10**9) * max(1, abs(phi.bound))
+        if phi.operator == ConstraintOperator.EQ:
+            inside = abs(value - phi.bound) <= tolerance
+            # The negation of an equality holds on both sides, beyond the tolerance
+            return inside if not negated else abs(value - phi.bound) > tolerance
+        if phi.operator == ConstraintOperator.GEQ:
+            value, bound = -value, -phi.bound
+        else:
+            bound = phi.bound
+        return value <= bound + tolerance if not negated else value > bound + tolerance
+
+    def __formulaVariables(self, phi : Formula) -> set[Variable]:
+
+        from .formula import BinaryFormula
+
+        if isinstance(phi, LinearConstraint):
+            return set(phi.variables)
+        if isinstance(phi, BinaryFormula) or isinstance(phi, (And, Or)):
+            return set().union(*(self.__formulaVariables(child) for child in phi.children))
+        if isinstance(phi, Not):
+            return self.__formulaVariables(phi.children)
+        return set()
+
+    def __encodeFormula(self, phi : Formula, columns : dict[Variable, int], guard : int, negated : bool, epsilon : Fraction,
+                        problem : tuple[list[Variable], tuple[list[int], list[int], list[Fraction]], list[ConstraintOperator], list[Fraction], list[tuple[Formula, int]], list[list]]):
+
+        from .formula import BinaryFormula, Top, Bottom
+        from .variable import IntegerVariable
+
+        variables, (rows, cols, values), operators, bounds, litterals, _ = problem
+
+        if isinstance(phi, BinaryFormula):
+            self.__encodeFormula(phi._eliminate(), columns, guard, negated, epsilon, problem)
+
+        elif isinstance(phi, Not):
+            self.__encodeFormula(phi.children, columns, guard, not negated, epsilon, problem)
+
+        elif isinstance(phi, (And, Or)) and isinstance(phi, And) != negated:
+            for child in phi.children:
+                self.__encodeFormula(child, columns, guard, negated, epsilon, problem)
+
+        elif isinstance(phi, (And, Or)):
+            # Exactly one child holds when the disjunction is enforced: sum of the selectors - guard = 0
+            selectors = []
+            for child in phi.children:
+                selectors.append(len(variables))
+                variables.append(IntegerVariable.declareAnonymous(ending="selector", lowerBound=Fraction(0), upperBound=Fraction(1)))
+                self.__encodeFormula(child, columns, selectors[-1], negated, epsilon, problem)
+            row = len(bounds)
+            rows += [row] * len(selectors)
+            cols += selectors
+            values += [1] * len(selectors)
+            if guard is not None:
+                rows.append(row)
+                cols.append(guard)
+                values.append(-1)
+            operators.append(ConstraintOperator.EQ)
+            bounds.append(Fraction(0) if guard is not None else Fraction(1))
+
+        elif isinstance(phi, (Top, Bottom)):
+            # Bottom is encoded as 0 <= -1, that can only be relaxed by the guard
+            if isinstance(phi, Bottom) != negated:
+                self.__addGuarded(dict(), Fraction(-1), columns, guard, problem)
+
+        elif phi.operator != ConstraintOperator.LEQ:
+            self.__encodeFormula(phi.toLessOrEqConstraint(), columns, guard, negated, epsilon, problem)
+
+        else:
+            litterals.append((Not(phi) if negated else phi, guard))
+            litteral = Not(phi).copyNegLitteral(epsilon) if negated else phi
+            self.__addGuarded(litteral.variables, litteral.bound, columns, guard, problem)
+
+    def __addGuarded(self, weights : dict[Variable, Fraction], bound : Fraction, columns : dict[Variable, int], guard : int,
+                     problem : tuple[list[Variable], tuple[list[int], list[int], list[Fraction]], list[ConstraintOperator], list[Fraction], list[tuple[Formula, int]], list[list]]):
+
+        variables, (rows, cols, values), operators, bounds, _, relaxed = problem
+
+        bigM = Fraction(0)
+        if guard is not None:
+            # sum(a_j x_j) <= b + M (1 - guard), with M the largest value of sum(a_j x_j) - b on the bounds of the variables
+            for variable, weight in weights.items():
+                lower, upper = variable.getBounds()
+                extreme = upper if weight > 0 else lower
+                if extreme is None:
+                    bigM = None
+                    break
+                bigM += weight * extreme
+            if bigM is None:
+                # Without bounds, M may be too small: the row is kept to be checked once solved
+                bigM = Fraction(Constants.DISJUNCTIVE_BIG_M)
+                relaxed.append([len(bounds), len(values) + len(weights), bound, [(columns[variable], weight) for variable, weight in weights.items()], bigM, guard])
+            else:
+                bigM -= bound
+            if bigM <= 0:
+                # The constraint always holds
+                return
+
+        row = len(bounds)
+        for variable, weight in weights.items():
+            rows.append(row)
+            cols.append(columns[variable])
+            values.append(weight)
+        if guard is not None:
+            rows.append(row)
+            cols.append(guard)
+            values.append(bigM)
+        operators.append(ConstraintOperator.LEQ)
+        bounds.append(bound + bigM)
+
+    def __reachesBigM(self, entry : list, values : list[Fraction]) -> bool:
+
+        _, _, bound, weights, bigM, guard = entry
+        if values[guard] > 0.5:
+            return False
+        value = sum(float(weight) * float(values[column]) for column, weight in weights)
+        return value - float(bound) >= float(bigM) * (1 - 1e-6)
@@ -0,0 +1,192 @@
+"""
+Mixed linear problem kept in memory by lp_solve 5.5 between resolutions, allowing it to be modified in place.
+"""
+
+from __future__ import annotations
+
+from ..formula.nullaryFormula.constraint.constraintOperator import ConstraintOperator
+from ..variable import Variable
+from .optimizationValues import OptimizationValues
+from .MLOModel import MLOModel
+
+from fractions import Fraction
+import math
+import lpsolve55 as lp_solve
+
+# Typing only imports
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .LPSolver import LPSolver
+
+class LPModel(MLOModel):
+    """
+    Mixed linear problem kept in memory by lp_solve 5.5 between resolutions, allowing to add and remove constraints,
+    change the objective function and the bounds of the variables without rebuilding the whole problem.
+    Since the lp_solve handle is kept, each resolution starts from the basis of the previous one.
+
+    Should be obtained through `olaaaf.mlo_solver.LPSolver.LPSolver.createModel` and freed with `close`, or used as a context manager.
+
+    Parameters
+    ----------
+    solver : olaaaf.mlo_solver.LPSolver.LPSolver
+        The solver used to solve the problem.
+    variables : list of olaaaf.variable.variable.Variable
+        Variables used in constraints.
+    objectif : list of fractions.Fraction
+        Weights of the objective function to optimize.
+    constraints : list of tuple of the form (list of fractions.Fraction, olaaaf.formula.nullaryFormula.constraint.constraintOperator.ConstraintOperator, fractions.Fraction), optional
+        Initial constraints of the problem, each tuple represents a linear constraint, with the first element being the weights,
+        the second the operator and the third the bound.
+    """
+
+    def __init__(self, solver : LPSolver, variables : list[Variable], objectif : list[Fraction],
+                 constraints : list[tuple[list[Fraction], ConstraintOperator, Fraction]] = []):
+        self._solver = solver
+        self._nextId = 0
+        # Identifiers of the constraints, in the order of lp_solve's rows
+        self.__rows = []
+
+        self.__lp = lp_solve.lpsolve('make_lp', 0, len(variables))
+        lp_solve.lpsolve('set_verbose', self.__lp, lp_solve.IMPORTANT)
+
+        for i in range(0,len(variables)):
+            if(variables[i].isInteger()): 
+                lp_solve.lpsolve('set_int', self.__lp, i+1, 1)
+
+            self.setBounds(i, *variables[i].getBounds())
+
+        self.setObjective(objectif)
+        for constraint in constraints:
+            self.addConstraint(*constraint)
+
+    def addConstraint(self, weights : list[Fraction], operator : ConstraintOperator, bound : Fraction) -> int:
+        """
+        Method used to add a constraint to the problem.
+
+        Parameters
+        ----------
+        weights : list of fractions.Fraction
+            The weights of the constraint, one per variable.
+        operator : olaaaf.formula.nullaryFormula.constraint.constraintOperator.ConstraintOperator
+            The operator of the constraint.
+        bound : fractions.Fraction
+            The bound of the constraint.
+
+        Returns
+        -------
+        int
+            Identifier of the constraint, used to remove it with `removeConstraint`.
+        """
+
+        comp = lp_solve.LE
+        if(operator == ConstraintOperator.EQ):
+            comp = lp_solve.EQ
+        elif (operator == ConstraintOperator.GEQ):
+            comp = lp_solve.GE
+        lp_solve.lpsolve('add_constraint', self.__lp, weights, comp, bound)
+
+        constraintId = self._nextId
+        self._nextId += 1
+        self.__rows.append(constraintId)
+        return constraintId
+
+    def removeConstraint(self, constraintId : int):
+        """
+        Method used to remove a constraint from the problem.
+
+        Parameters
+        ----------
+        constraintId : int
+            Identifier of the constraint, as returned by `addConstraint`.
+        """
+
+        row = self.__rows.index(constraintId)
+        lp_solve.lpsolve('del_constraint', self.__lp, row+1)
+        del self.__rows[row]
+
+    def setObjective(self, objectif : list[Fraction]):
+        """
+        Method used to change the objective function of the problem.
+
+        Parameters
+        ----------
+        objectif : list of fractions.Fraction
+            Weights of the new objective function to optimize.
+        """
+
+        lp_solve.lpsolve('set_obj_fn', self.__lp, objectif)
+
+    def setBounds(self, index : int, lowerBound : Fraction = None, upperBound : Fraction = None):
+        """
+        Method used to change the bounds of one of the variables of the problem, without changing the
+        `olaaaf.variable.variable.Variable` itself.
+
+        Parameters
+        ----------
+        index : int
+            Index of the variable in the list given at the creation of the problem.
+        lowerBound, upperBound : `fraction.Fraction`, optional
+            The new bounds of the variable. If not defined, it is considered as if the variable is unbounded.
+        """
+
+        if(lowerBound is None and upperBound is None):
+            lp_solve.lpsolve('set_unbounded', self.__lp, index+1)
+        else:
+            infinite = lp_solve.lpsolve("get_infinite", self.__lp)
+            if(lowerBound is None): lowerBound = -infinite
+            if(upperBound is None): upperBound = infinite
+            lp_solve.lpsolve('set_bounds', self.__lp, index+1, float(lowerBound), float(upperBound))
+
+    def solve(self, cutoff : Fraction = None, timeLimit : float = None) -> tuple[OptimizationValues, list[Fraction], Fraction]:
+        """
+        Method returning the result of the current state of the problem.
+
+        Parameters
+        ----------
+        cutoff : fractions.Fraction, optional
+            Only the solutions whose objective value is at most `cutoff` are of interest, allowing the solver to abandon the search
+            as soon as it can't find any. If there is none, the problem is considered infeasible. By default, set to `None`.
+        timeLimit : float, optional
+            Maximum time, in seconds, given to the solver. If it is reached before the end of the optimization,
+            `olaaaf.mlo_solver.optimizationValues.OptimizationValues.TIMEOUT` is returned. By default, set to `None` (no limit).
+
+        Returns
+        -------
+        olaaaf.mlo_solver.optimizationValues.OptimizationValues
+            Information of the final state of the problem.
+        list of fractions.Fraction
+            The point at the optimal, if found.
+        fractions.Fraction
+            The optimal value, if found.
+        """
+
+        # lp_solve's model is kept between resolutions, the previous cutoff is always overwritten
+        lp_solve.lpsolve('set_obj_bound', self.__lp, lp_solve.lpsolve("get_infinite", self.__lp) if cutoff is None else self._solver._relaxedCutoff(cutoff))
+        # lp_solve's timeout is in whole seconds, 0 meaning no limit
+        lp_solve.lpsolve('set_timeout', self.__lp, 0 if timeLimit is None else max(math.ceil(timeLimit), 1))
+
+        tmp = lp_solve.lpsolve('solve', self.__lp)
+        # TIMEOUT (7), or SUBOPTIMAL (1) when lp_solve stops at its first solution, only come from the timeout if one was set
+        if timeLimit is not None and (tmp == 7 or tmp == 1):
+            res = (OptimizationValues.TIMEOUT, [], 0)
+        elif tmp not in [0,3]:
+            res = (OptimizationValues.INFEASIBLE, [], 0)
+        elif tmp == 3:
+            val = lp_solve.lpsolve('get_variables', self.__lp)[0]
+            res = (OptimizationValues.UNBOUNDED, val, lp_solve.lpsolve('get_objective', self.__lp))
+        else:
+            res = (OptimizationValues.OPTIMAL, lp_solve.lpsolve('get_variables', self.__lp)[0], lp_solve.lpsolve('get_objective', self.__lp))
+        return self._solver._formatResult(self._solver._checkCutoff(res, cutoff))
+
+    def close(self):
+        """
+        Method used to free the lp_solve handle held by the problem. The problem can't be used afterwards.
+        """
+
+        if self.__lp is not None:
+            lp_solve.lpsolve('delete_lp', self.__lp)
+            self.__lp = None
+
+    def __del__(self):
+        if getattr(self, "_LPModel__lp", None) is not None:
+            self.close()
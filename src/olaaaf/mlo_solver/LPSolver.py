@@ -8,9 +8,9 @@ from ..formula.nullaryFormula.constraint.constraintOperator import ConstraintOpe
 from ..variable import Variable
 from .optimizationValues import OptimizationValues
 from .MLOSolver import MLOSolver
+from .LPModel import LPModel
 
 from fractions import Fraction
-import lpsolve55 as lp_solve
 
 class LPSolver(MLOSolver):
     """
@@ -20,8 +20,8 @@ class LPSolver(MLOSolver):
     def __init__(self):
         pass
         
-    def solve(self, variables : list[Variable], objectif : list[Fraction], constraints : list[tuple[list[Fraction], ConstraintOperator, Fraction]])\
-        -> tuple[OptimizationValues, list[Fraction], Fraction]:
+    def solve(self, variables : list[Variable], objectif : list[Fraction], constraints : list[tuple[list[Fraction], ConstraintOperator, Fraction]],
+              cutoff : Fraction = None, timeLimit : float = None) -> tuple[OptimizationValues, list[Fraction], Fraction]:
         """
         Method returning the result of a mixed linear problem.
 
@@ -33,6 +33,12 @@ class LPSolver(MLOSolver):
             Weights of the objective function to optimize.
         constraints : list of tuple of the form (list of fractions.Fraction, olaaaf.formula.nullaryFormula.constraint.constraintOperator.ConstraintOperator, fractions.Fraction)
             Each tuple represents a linear constraint, with the first element being the weights, the second the operator and the third the bound.
+        cutoff : fractions.Fraction, optional
+            Only the solutions whose objective value is at most `cutoff` are of interest, allowing the solver to abandon the search
+            as soon as it can't find any. If there is none, the problem is considered infeasible. By default, set to `None`.
+        timeLimit : float, optional
+            Maximum time, in seconds, given to the solver. If it is reached before the end of the optimization,
+            `olaaaf.mlo_solver.optimizationValues.OptimizationValues.TIMEOUT` is returned. By default, set to `None` (no limit).
 
         Returns
         -------
@@ -44,36 +50,32 @@ class LPSolver(MLOSolver):
             The optimal value, if found.
         """
         
-        lp = lp_solve.lpsolve('make_lp', 0, len(variables))
-        lp_solve.lpsolve('set_verbose', lp, lp_solve.IMPORTANT)
+        with self.createModel(variables, objectif, constraints) as model:
+            return model.solve(cutoff, timeLimit)
 
-        infinite = lp_solve.lpsolve("get_infinite", lp)
+    def createModel(self, variables : list[Variable], objectif : list[Fraction], constraints : list[tuple[list[Fraction], ConstraintOperator, Fraction]] = [])\
+        -> LPModel:
+        """
+        Method returning a mixed linear problem kept in memory by lp_solve, meant to be solved multiple times while being modified in place
+        (see `olaaaf.mlo_solver.LPModel.LPModel`).
 
-        for i in range(0,len(variables)):
-            if(variables[i].isInteger()): 
-                lp_solve.lpsolve('set_int', lp,i+1, 1)
+        Parameters
+        ----------
+        variables : list of olaaaf.variable.variable.Variable
+            Variables used in constraints.
+        objectif : list of fractions.Fraction
+            Weights of the objective function to optimize.
+        constraints : list of tuple of the form (list of fractions.Fraction, olaaaf.formula.nullaryFormula.constraint.constraintOperator.ConstraintOperator, fractions.Fraction), optional
+            Initial constraints of the problem, each tuple represents a linear constraint, with the first element being the weights,
+            the second the operator and the third the bound.
+
+        Returns
+        -------
+        olaaaf.mlo_solver.LPModel.LPModel
+            The problem, to be freed with its `close` method once it isn't used anymore.
+        """
 
-            getBoundL, getBoundR = variables[i].getBounds()
-            if(not getBoundL and not getBoundR):
-                lp_solve.lpsolve('set_unbounded', lp, i+1)
-            else:
-                lower, upper = variables[i].getBounds()
-                if(lower == None): lower = -infinite
-                if(upper == None): upper = infinite
-                lp_solve.lpsolve('set_bounds', lp, i+1, float(lower), float(upper))
+        return LPModel(self, variables, objectif, constraints)
 
-        lp_solve.lpsolve('set_obj', lp, objectif)
-        for constraint in constraints:
-            comp = lp_solve.LE
-            if(constraint[1] == ConstraintOperator.EQ):
-                comp = lp_solve.EQ
-            elif (constraint[1] == ConstraintOperator.GEQ):
-                comp = lp_solve.GE
-            lp_solve.lpsolve('add_constraint', lp, constraint[0], comp, constraint[2])
-        tmp = lp_solve.lpsolve('solve', lp)
-        if tmp not in [0,3]:
-            return (OptimizationValues.INFEASIBLE, [], 0)
-        if tmp == 3:
-            val = lp_solve.lpsolve('get_variables', lp)[0]
-            return (OptimizationValues.UNBOUNDED, val, lp_solve.lpsolve('get_objective', lp))
-        return (OptimizationValues.OPTIMAL, lp_solve.lpsolve('get_variables', lp)[0], lp_solve.lpsolve('get_objective', lp))
\ No newline at end of file
+    def _formatResult(self, res : tuple[OptimizationValues, list[Fraction], Fraction]) -> tuple[OptimizationValues, list[Fraction], Fraction]:
+        return res
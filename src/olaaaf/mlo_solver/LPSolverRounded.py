@@ -5,10 +5,9 @@ Rounded approximation of `olaaaf.mlo_solver.LPSolver.LPSolver`, reducing floatin
 from __future__ import annotations
 
 from .LPSolver import LPSolver
-from ..formula.nullaryFormula.constraint import ConstraintOperator
-from ..variable import Variable
 from .optimizationValues import OptimizationValues
-from math import isnan
+from .decimalRounding import roundDecimals
+from math import isnan, isinf
 
 from fractions import Fraction
 
@@ -20,43 +19,28 @@ class LPSolverRounded(LPSolver):
     ----------
     round: int
         The decimal to which all numbers are rounded.
+    vectorized: bool
+        Whether the solution vector is rounded as a whole with Numpy (`True`), or value by value with exact arithmetic (`False`).
+        Both give the same results, see `olaaaf.mlo_solver.decimalRounding.roundDecimals`.
     """
 
     __round: int
+    __vectorized: bool
 
-    def __init__(self, round: int = 12):
+    def __init__(self, round: int = 12, vectorized: bool = True):
         self.__round = round
+        self.__vectorized = vectorized
         
-    def solve(self, variables : list[Variable], objectif : list[Fraction], constraints : list[tuple[list[Fraction], ConstraintOperator, Fraction]])\
-        -> tuple[OptimizationValues, list[Fraction], Fraction]:
-        """
-        Method returning the result of a mixed linear problem.
-
-        Parameters
-        ----------
-        variables : list of olaaaf.variable.variable.Variable
-            Variables used in constraints.
-        objectif : list of fractions.Fraction
-            Weights of the objective function to optimize.
-        constraints : list of tuple of the form (list of fractions.Fraction, olaaaf.formula.nullaryFormula.constraint.constraintOperator.ConstraintOperator, fractions.Fraction)
-            Each tuple represents a linear constraint, with the first element being the weights, the second the operator and the third the bound.
-
-        Returns
-        -------
-        olaaaf.mlo_solver.optimizationValues.OptimizationValues
-            Information of the final state of the problem.
-        list of fractions.Fraction
-            The point at the optimal, if found.
-        fractions.Fraction
-            The optimal value, if found.
-        """
-
-        LPsolverRes = super().solve(variables, objectif, constraints)
-        
+    def _formatResult(self, LPsolverRes : tuple[OptimizationValues, list[Fraction], Fraction]) -> tuple[OptimizationValues, list[Fraction], Fraction]:
         res = []
 
         res.append(LPsolverRes[0])
-        res.append([Fraction(0) if isnan(x) else round(Fraction(x), self.__round) for x in LPsolverRes[1]])
-        res.append(round(Fraction(LPsolverRes[2]), self.__round))
+        res.append(roundDecimals([0 if isnan(x) else x for x in LPsolverRes[1]], self.__round, self.__vectorized))
+
+        # Problems pruned by their cutoff have an infinite optimal value, which can't be rounded
+        if isinf(LPsolverRes[2]):
+            res.append(LPsolverRes[2])
+        else:
+            res.append(round(Fraction(LPsolverRes[2]), self.__round))
 
-        return res
\ No newline at end of file
+        return res
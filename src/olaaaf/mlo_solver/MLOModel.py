@@ -0,0 +1,152 @@
+"""
+Mixed linear problem kept in memory between resolutions, allowing it to be modified in place.
+"""
+
+from __future__ import annotations
+
+from ..variable import Variable
+from ..formula import ConstraintOperator
+from .optimizationValues import OptimizationValues
+
+from fractions import Fraction
+
+# Typing only imports
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .MLOSolver import MLOSolver
+
+class MLOModel:
+    """
+    Mixed linear problem kept in memory between resolutions, allowing to add and remove constraints, change the objective function
+    and the bounds of the variables without rebuilding the whole problem.
+    Should be obtained through `olaaaf.mlo_solver.MLOSolver.MLOSolver.createModel` and freed with `close`, or used as a context manager.
+
+    This default implementation stores the problem and gives it to its `olaaaf.mlo_solver.MLOSolver.MLOSolver`'s `solve` method
+    at each resolution. Solvers able to keep a problem in memory should return their own subclass.
+
+    Parameters
+    ----------
+    solver : olaaaf.mlo_solver.MLOSolver.MLOSolver
+        The solver used to solve the problem.
+    variables : list of olaaaf.variable.variable.Variable
+        Variables used in constraints.
+    objectif : list of fractions.Fraction
+        Weights of the objective function to optimize.
+    constraints : list of tuple of the form (list of fractions.Fraction, olaaaf.formula.nullaryFormula.constraint.constraintOperator.ConstraintOperator, fractions.Fraction), optional
+        Initial constraints of the problem, each tuple represents a linear constraint, with the first element being the weights,
+        the second the operator and the third the bound.
+    """
+
+    def __init__(self, solver : MLOSolver, variables : list[Variable], objectif : list[Fraction],
+                 constraints : list[tuple[list[Fraction], ConstraintOperator, Fraction]] = []):
+        self._solver = solver
+        self._variables = list(variables)
+        self._objectif = list(objectif)
+        self._constraints = dict()
+        self._nextId = 0
+
+        for constraint in constraints:
+            self.addConstraint(*constraint)
+
+    def addConstraint(self, weights : list[Fraction], operator : ConstraintOperator, bound : Fraction) -> int:
+        """
+        Method used to add a constraint to the problem.
+
+        Parameters
+        ----------
+        weights : list of fractions.Fraction
+            The weights of the constraint, one per variable.
+        operator : olaaaf.formula.nullaryFormula.constraint.constraintOperator.ConstraintOperator
+            The operator of the constraint.
+        bound : fractions.Fraction
+            The bound of the constraint.
+
+        Returns
+        -------
+        int
+            Identifier of the constraint, used to remove it with `removeConstraint`.
+        """
+
+        constraintId = self._nextId
+        self._nextId += 1
+        self._constraints[constraintId] = (list(weights), operator, bound)
+        return constraintId
+
+    def removeConstraint(self, constraintId : int):
+        """
+        Method used to remove a constraint from the problem.
+
+        Parameters
+        ----------
+        constraintId : int
+            Identifier of the constraint, as returned by `addConstraint`.
+        """
+
+        del self._constraints[constraintId]
+
+    def setObjective(self, objectif : list[Fraction]):
+        """
+        Method used to change the objective function of the problem.
+
+        Parameters
+        ----------
+        objectif : list of fractions.Fraction
+            Weights of the new objective function to optimize.
+        """
+
+        self._objectif = list(objectif)
+
+    def setBounds(self, index : int, lowerBound : Fraction = None, upperBound : Fraction = None):
+        """
+        Method used to change the bounds of one of the variables of the problem, without changing the
+        `olaaaf.variable.variable.Variable` itself.
+
+        Parameters
+        ----------
+        index : int
+            Index of the variable in the list given at the creation of the problem.
+        lowerBound, upperBound : `fraction.Fraction`, optional
+            The new bounds of the variable. If not defined, it is considered as if the variable is unbounded.
+        """
+
+        # A copy of the variable holds the new bounds, its name keeping it equal to the original one
+        variable = self._variables[index]
+        self._variables[index] = variable.__class__(variable.name, lowerBound, upperBound)
+
+    def solve(self, cutoff : Fraction = None, timeLimit : float = None) -> tuple[OptimizationValues, list[Fraction], Fraction]:
+        """
+        Method returning the result of the current state of the problem.
+
+        Parameters
+        ----------
+        cutoff : fractions.Fraction, optional
+            Only the solutions whose objective value is at most `cutoff` are of interest, allowing the solver to abandon the search
+            as soon as it can't find any. If there is none, the problem is considered infeasible. By default, set to `None`.
+        timeLimit : float, optional
+            Maximum time, in seconds, given to the solver. If it is reached before the end of the optimization,
+            `olaaaf.mlo_solver.optimizationValues.OptimizationValues.TIMEOUT` is returned. By default, set to `None` (no limit).
+
+        Returns
+        -------
+        olaaaf.mlo_solver.optimizationValues.OptimizationValues
+            Information of the final state of the problem.
+        list of fractions.Fraction
+            The point at the optimal, if found.
+        fractions.Fraction
+            The optimal value, if found.
+        """
+
+        return self._solver.solve(self._variables, list(self._objectif), list(self._constraints.values()), cutoff, timeLimit)
+
+    def close(self):
+        """
+        Method used to free the resources held by the problem. The problem can't be used afterwards.
+        """
+
+        self._constraints = dict()
+
+    def __enter__(self) -> MLOModel:
+        return self
+
+    def __exit__(self, *args):
+        self.close()
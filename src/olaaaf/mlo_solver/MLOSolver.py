@@ -7,9 +7,29 @@ from __future__ import annotations
 from ..variable import Variable
 from ..formula import ConstraintOperator
 from .optimizationValues import OptimizationValues
+from .MLOModel import MLOModel
 
 from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
 from fractions import Fraction
+from functools import partial
+import math
+import os
+
+# Typing only imports
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    import numpy as np
+
+# Solver used by each worker process of olaaaf.mlo_solver.MLOSolver.MLOSolver.solveMany
+_workerSolver = None
+
+def _initWorker(solver):
+    global _workerSolver
+    _workerSolver = solver
+
+def _solveInWorker(method, problem):
+    return getattr(_workerSolver, method)(*problem)
 
 class MLOSolver(ABC):
     """
@@ -17,8 +37,8 @@ class MLOSolver(ABC):
     """
     
     @abstractmethod
-    def solve(self, variables : list[Variable], objectif : list[Fraction], constraints : list[tuple[list[Fraction], ConstraintOperator, Fraction]])\
-        -> tuple[OptimizationValues, list[Fraction], Fraction]:
+    def solve(self, variables : list[Variable], objectif : list[Fraction], constraints : list[tuple[list[Fraction], ConstraintOperator, Fraction]],
+              cutoff : Fraction = None, timeLimit : float = None) -> tuple[OptimizationValues, list[Fraction], Fraction]:
         """
         Method returning the result of a mixed linear problem.
 
@@ -30,6 +50,12 @@ class MLOSolver(ABC):
             Weights of the objective function to optimize.
         constraints : list of tuple of the form (list of fractions.Fraction, olaaaf.formula.nullaryFormula.constraint.constraintOperator.ConstraintOperator, fractions.Fraction)
             Each tuple represents a linear constraint, with the first element being the weights, the second the operator and the third the bound.
+        cutoff : fractions.Fraction, optional
+            Only the solutions whose objective value is at most `cutoff` are of interest, allowing the solver to abandon the search
+            as soon as it can't find any. If there is none, the problem is considered infeasible. By default, set to `None`.
+        timeLimit : float, optional
+            Maximum time, in seconds, given to the solver. If it is reached before the end of the optimization,
+            `olaaaf.mlo_solver.optimizationValues.OptimizationValues.TIMEOUT` is returned. By default, set to `None` (no limit).
 
         Returns
         -------
@@ -40,4 +66,339 @@ class MLOSolver(ABC):
         fractions.Fraction
             The optimal value, if found.
         """
-        pass
\ No newline at end of file
+        pass
+
+    def solveSparse(self, variables : list[Variable], objectif : list[Fraction], matrix : tuple[list[int], list[int], list[Fraction]],
+                    operators : list[ConstraintOperator], bounds : list[Fraction], cutoff : Fraction = None, timeLimit : float = None)\
+        -> tuple[OptimizationValues, list[Fraction], Fraction]:
+        """
+        Method returning the result of a mixed linear problem whose constraints are given as a sparse matrix in coordinate (COO) format,
+        meaning that only the non-zero weights are given.
+
+        By default, the matrix is expanded and given to `olaaaf.mlo_solver.MLOSolver.MLOSolver.solve`,
+        solvers able to work on sparse matrices should override this method.
+
+        Parameters
+        ----------
+        variables : list of olaaaf.variable.variable.Variable
+            Variables used in constraints.
+        objectif : list of fractions.Fraction
+            Weights of the objective function to optimize.
+        matrix : tuple of the form (list of int, list of int, list of fractions.Fraction)
+            The non-zero weights of the constraints, with the first element being their row (i.e. the constraint's index),
+            the second their column (i.e. the variable's index) and the third their value.
+            Duplicate entries are summed.
+        operators : list of olaaaf.formula.nullaryFormula.constraint.constraintOperator.ConstraintOperator
+            The operator of each constraint.
+        bounds : list of fractions.Fraction
+            The bound of each constraint.
+        cutoff : fractions.Fraction, optional
+            Only the solutions whose objective value is at most `cutoff` are of interest, allowing the solver to abandon the search
+            as soon as it can't find any. If there is none, the problem is considered infeasible. By default, set to `None`.
+        timeLimit : float, optional
+            Maximum time, in seconds, given to the solver. If it is reached before the end of the optimization,
+            `olaaaf.mlo_solver.optimizationValues.OptimizationValues.TIMEOUT` is returned. By default, set to `None` (no limit).
+
+        Returns
+        -------
+        olaaaf.mlo_solver.optimizationValues.OptimizationValues
+            Information of the final state of the problem.
+        list of fractions.Fraction
+            The point at the optimal, if found.
+        fractions.Fraction
+            The optimal value, if found.
+        """
+
+        rows, columns, values = matrix
+        tab = [[0] * len(variables) for _ in range(len(bounds))]
+        for row, column, value in zip(rows, columns, values):
+            tab[row][column] += value
+
+        return self.solve(variables, objectif, list(zip(tab, operators, bounds)), cutoff, timeLimit)
+
+    def solveArrays(self, c, A, lb, ub, colLb, colUb, integrality, cutoff : float = None, timeLimit : float = None, exact : bool = False)\
+        -> tuple[OptimizationValues, np.ndarray, float]:
+        r"""
+        Method returning the result of a mixed linear problem given as floating point arrays, of the following form:
+
+        \[
+            \begin{cases}
+                lb \leq Ax \leq ub \\
+                colLb \leq x \leq colUb \\
+                \text{minimize } c^Tx
+            \end{cases}
+        \]
+
+        By default, the problem is given to `olaaaf.mlo_solver.MLOSolver.MLOSolver.solveSparse`, each column being an anonymous variable
+        declared once per solver for its bounds and type. Solvers working on floating point arrays should override this method.
+
+        Parameters
+        ----------
+        c : numpy.ndarray
+            Weights of the objective function to optimize, of shape (n,).
+        A : numpy.ndarray or scipy.sparse.sparray
+            Weights of the constraints, of shape (m, n).
+        lb, ub : numpy.ndarray
+            Lower and upper bounds of each constraint, of shape (m,). Infinite values are used for unbounded sides,
+            and equal values for equality constraints.
+        colLb, colUb : numpy.ndarray
+            Lower and upper bounds of each variable, of shape (n,). Infinite values are used for unbounded sides.
+        integrality : numpy.ndarray
+            Whether each variable is an integer, of shape (n,).
+        cutoff : float, optional
+            Only the solutions whose objective value is at most `cutoff` are of interest, allowing the solver to abandon the search
+            as soon as it can't find any. If there is none, the problem is considered infeasible. By default, set to `None`.
+        timeLimit : float, optional
+            Maximum time, in seconds, given to the solver. If it is reached before the end of the optimization,
+            `olaaaf.mlo_solver.optimizationValues.OptimizationValues.TIMEOUT` is returned. By default, set to `None` (no limit).
+        exact : bool, optional
+            Whether the point and the optimal value are given as `fractions.Fraction`, reconstructed from the floating point ones
+            as done by `olaaaf.mlo_solver.MLOSolver.MLOSolver.solve`. By default, set to `False`.
+
+        Returns
+        -------
+        olaaaf.mlo_solver.optimizationValues.OptimizationValues
+            Information of the final state of the problem.
+        numpy.ndarray or list of fractions.Fraction
+            The point at the optimal, if found.
+        float or fractions.Fraction
+            The optimal value, if found.
+        """
+
+        import numpy as np
+
+        variables = [self.__arrayColumn(bool(integer), None if np.isinf(lower) else Fraction(float(lower)),
+                                        None if np.isinf(upper) else Fraction(float(upper)))
+                     for lower, upper, integer in zip(colLb, colUb, integrality)]
+
+        if hasattr(A, "tocoo"):
+            A = A.tocoo()
+            entries = (A.row, A.col, A.data)
+        else:
+            A = np.asarray(A, dtype=np.float64).reshape(len(lb), len(c))
+            rows, columns = np.nonzero(A)
+            entries = (rows, columns, A[rows, columns])
+
+        # Each side of a ranged constraint becomes its own constraint
+        sides = [[] for _ in range(len(lb))]
+        operators = []
+        bounds = []
+        for row, (lower, upper) in enumerate(zip(lb, ub)):
+            if lower == upper:
+                sides[row].append(len(bounds))
+                operators.append(ConstraintOperator.EQ)
+                bounds.append(Fraction(float(lower)))
+                continue
+            if not np.isinf(lower):
+                sides[row].append(len(bounds))
+                operators.append(ConstraintOperator.GEQ)
+                bounds.append(Fraction(float(lower)))
+            if not np.isinf(upper):
+                sides[row].append(len(bounds))
+                operators.append(ConstraintOperator.LEQ)
+                bounds.append(Fraction(float(upper)))
+
+        matrix = ([], [], [])
+        for row, column, value in zip(*entries):
+            for side in sides[row]:
+                matrix[0].append(side)
+                matrix[1].append(int(column))
+                matrix[2].append(Fraction(float(value)))
+
+        res = self.solveSparse(variables, [Fraction(float(weight)) for weight in c], matrix, operators, bounds,
+                               None if cutoff is None else Fraction(cutoff), timeLimit)
+        if exact:
+            return res
+        return (res[0], np.array(res[1], dtype=np.float64), float(res[2]))
+
+    def __arrayColumn(self, integer : bool, lower : Fraction, upper : Fraction) -> Variable:
+
+        # Columns with the same bounds and type share the same anonymous variable, keeping their names stable from one call to another
+        from ..variable import RealVariable, IntegerVariable
+
+        columns = self.__dict__.setdefault("_MLOSolver__arrayColumns", dict())
+        variable = columns.get((integer, lower, upper))
+        if variable is None:
+            variable = columns.setdefault((integer, lower, upper),
+                                          (IntegerVariable if integer else RealVariable).declareAnonymous(lowerBound=lower, upperBound=upper))
+        return variable
+
+    def isFeasible(self, variables : list[Variable], constraints : list[tuple[list[Fraction], ConstraintOperator, Fraction]], timeLimit : float = None) -> bool:
+        """
+        Method used to verify the feasibility of a set of constraints, without optimizing anything.
+
+        By default, the problem is given to `olaaaf.mlo_solver.MLOSolver.MLOSolver.solve` with a null objective function,
+        so that the first solution found is optimal.
+
+        Parameters
+        ----------
+        variables : list of olaaaf.variable.variable.Variable
+            Variables used in constraints.
+        constraints : list of tuple of the form (list of fractions.Fraction, olaaaf.formula.nullaryFormula.constraint.constraintOperator.ConstraintOperator, fractions.Fraction)
+            Each tuple represents a linear constraint, with the first element being the weights, the second the operator and the third the bound.
+        timeLimit : float, optional
+            Maximum time, in seconds, given to the solver. By default, set to `None` (no limit).
+
+        Returns
+        -------
+        bool
+            `True` if there is at least one point satisfying every constraint, `False` otherwise or if the time limit was reached
+            before finding one.
+        """
+
+        if len(variables) == 0:
+            # Without any variable, every constraint is only a comparison between 0 and its bound
+            return all((operator == ConstraintOperator.LEQ and 0 <= bound) or (operator == ConstraintOperator.GEQ and 0 >= bound)
+                       or (operator == ConstraintOperator.EQ and 0 == bound) for _, operator, bound in constraints)
+
+        res = self.solve(variables, [Fraction(0)] * len(variables), constraints, timeLimit=timeLimit)
+        return res[0] == OptimizationValues.OPTIMAL or res[0] == OptimizationValues.UNBOUNDED
+
+    def isFeasibleArrays(self, A, lb, ub, colLb, colUb, integrality, timeLimit : float = None, exact : bool = False)\
+        -> tuple[OptimizationValues, np.ndarray]:
+        """
+        Method used to verify the feasibility of constraints given as floating point arrays, as expected by
+        `olaaaf.mlo_solver.MLOSolver.MLOSolver.solveArrays`, without optimizing anything.
+
+        By default, the problem is given to `olaaaf.mlo_solver.MLOSolver.MLOSolver.solveArrays` with a null objective function,
+        so that the first solution found is optimal. Solvers with a faster way to find a feasible point should override this method.
+
+        Parameters
+        ----------
+        A : numpy.ndarray or scipy.sparse.sparray
+            Weights of the constraints, of shape (m, n).
+        lb, ub : numpy.ndarray
+            Lower and upper bounds of each constraint, of shape (m,). Infinite values are used for unbounded sides,
+            and equal values for equality constraints.
+        colLb, colUb : numpy.ndarray
+            Lower and upper bounds of each variable, of shape (n,). Infinite values are used for unbounded sides.
+        integrality : numpy.ndarray
+            Whether each variable is an integer, of shape (n,).
+        timeLimit : float, optional
+            Maximum time, in seconds, given to the solver. If it is reached before finding a point,
+            `olaaaf.mlo_solver.optimizationValues.OptimizationValues.TIMEOUT` is returned. By default, set to `None` (no limit).
+        exact : bool, optional
+            Whether the point is given as `fractions.Fraction`. By default, set to `False`.
+
+        Returns
+        -------
+        olaaaf.mlo_solver.optimizationValues.OptimizationValues
+            Information of the final state of the problem, `olaaaf.mlo_solver.optimizationValues.OptimizationValues.OPTIMAL`
+            if a point satisfying every constraint was found.
+        numpy.ndarray or list of fractions.Fraction
+            The point found, if any.
+        """
+
+        import numpy as np
+
+        res = self.solveArrays(np.zeros(len(colLb)), A, lb, ub, colLb, colUb, integrality, timeLimit=timeLimit, exact=exact)
+        return (res[0], res[1])
+
+    def createModel(self, variables : list[Variable], objectif : list[Fraction], constraints : list[tuple[list[Fraction], ConstraintOperator, Fraction]] = [])\
+        -> MLOModel:
+        """
+        Method returning a mixed linear problem kept in memory, meant to be solved multiple times while being modified in place
+        (see `olaaaf.mlo_solver.MLOModel.MLOModel`).
+
+        Parameters
+        ----------
+        variables : list of olaaaf.variable.variable.Variable
+            Variables used in constraints.
+        objectif : list of fractions.Fraction
+            Weights of the objective function to optimize.
+        constraints : list of tuple of the form (list of fractions.Fraction, olaaaf.formula.nullaryFormula.constraint.constraintOperator.ConstraintOperator, fractions.Fraction), optional
+            Initial constraints of the problem, each tuple represents a linear constraint, with the first element being the weights,
+            the second the operator and the third the bound.
+
+        Returns
+        -------
+        olaaaf.mlo_solver.MLOModel.MLOModel
+            The problem, to be freed with its `close` method once it isn't used anymore.
+        """
+
+        return MLOModel(self, variables, objectif, constraints)
+
+    def _relaxedCutoff(self, cutoff : Fraction) -> float:
+
+        # Solutions exactly at the cutoff must be kept, despite the floating point errors of the solvers:
+        # the cutoff row is only satisfied up to their feasibility tolerance, about 1e-7
+        return float(cutoff) + 1e-6 * max(1, abs(float(cutoff)))
+
+    def _checkCutoff(self, res : tuple[OptimizationValues, list[Fraction], Fraction], cutoff : Fraction)\
+        -> tuple[OptimizationValues, list[Fraction], Fraction]:
+
+        # Solvers may only use the cutoff to prune their search, the result is checked against it afterwards
+        if cutoff is not None and res[0] == OptimizationValues.OPTIMAL and res[2] > self._relaxedCutoff(cutoff):
+            return (OptimizationValues.INFEASIBLE, [], float("inf"))
+        return res
+
+    def solveMany(self, problems : list[tuple[list[Variable], list[Fraction], list[tuple[list[Fraction], ConstraintOperator, Fraction]]]],
+                  workers : int = None, chunkSize : int = None, method : str = "solve") -> list[tuple[OptimizationValues, list[Fraction], Fraction]]:
+        """
+        Method returning the results of multiple independent mixed linear problems, solved in parallel by a pool of processes
+        each holding a copy of this solver.
+
+        The pool is created on the first call and kept alive for the next ones, until `olaaaf.mlo_solver.MLOSolver.MLOSolver.shutdown`
+        is called or the number of workers changes.
+
+        Parameters
+        ----------
+        problems : list of tuple of the form (list of olaaaf.variable.variable.Variable, list of fractions.Fraction, list of constraints)
+            Each tuple represents a problem, given as the parameters of `olaaaf.mlo_solver.MLOSolver.MLOSolver.solve`
+            (or of the method given by `method`).
+        workers : int, optional
+            Number of processes used. If set to `None`, the number of CPUs is used. If set to 1, problems are solved in the current process.
+        chunkSize : int, optional
+            Number of problems sent at once to a process, sending small problems together to reduce the communication cost.
+            If set to `None`, problems are split in about four chunks per process.
+        method : str, optional
+            Name of the method solving each problem, e.g. `"solveSparse"` for problems given as the parameters of
+            `olaaaf.mlo_solver.MLOSolver.MLOSolver.solveSparse`, which are sent to the processes without being expanded.
+            By default, set to `"solve"`.
+
+        Returns
+        -------
+        list of tuple of the form (olaaaf.mlo_solver.optimizationValues.OptimizationValues, list of fractions.Fraction, fractions.Fraction)
+            The result of each problem, in the same order as `problems`.
+        """
+
+        problems = list(problems)
+        if workers is None:
+            workers = os.cpu_count() or 1
+
+        if workers <= 1 or len(problems) <= 1:
+            return [getattr(self, method)(*problem) for problem in problems]
+
+        if chunkSize is None:
+            chunkSize = max(1, math.ceil(len(problems) / (4 * workers)))
+
+        return list(self.__getPool(workers).map(partial(_solveInWorker, method), problems, chunksize=chunkSize))
+
+    def shutdown(self):
+        """
+        Method stopping the pool of processes used by `olaaaf.mlo_solver.MLOSolver.MLOSolver.solveMany`, if any.
+        """
+
+        pool = self.__dict__.pop("_MLOSolver__pool", None)
+        if pool is not None:
+            pool[1].shutdown()
+
+    def __getPool(self, workers):
+
+        pool = self.__dict__.get("_MLOSolver__pool")
+        if pool is not None and pool[0] != workers:
+            self.shutdown()
+            pool = None
+
+        if pool is None:
+            pool = (workers, ProcessPoolExecutor(max_workers=workers, initializer=_initWorker, initargs=(self,)))
+            self.__pool = pool
+
+        return pool[1]
+
+    def __getstate__(self):
+
+        # The pool can't be sent to other processes
+        state = self.__dict__.copy()
+        state.pop("_MLOSolver__pool", None)
+        return state
@@ -3,8 +3,11 @@ Representation of interfacing with MLO solvers, used to solve MLO problems.
 """
 
 from .MLOSolver import MLOSolver
+from .MLOModel import MLOModel
+from .cachedMLOSolver import CachedMLOSolver
 
 try:
+    from .LPModel import LPModel
     from .LPSolver import LPSolver
     from .LPSolverRounded import LPSolverRounded
 except ModuleNotFoundError:
@@ -12,7 +15,7 @@ except ModuleNotFoundError:
     from ..constants import Constants
     
     if Constants.DISPLAY_DEPENDENCIES_WARNING:
-        print("Missing lpsolve55 dependency: LPSolver and LPSolverRounded cannot be used without it. If you wish to disable these warnings, set the DISPLAY_DEPENDENCIES_WARNING constant to False.")
+        print("Missing lpsolve55 dependency: LPModel, LPSolver and LPSolverRounded cannot be used without it. If you wish to disable these warnings, set the DISPLAY_DEPENDENCIES_WARNING constant to False.")
 
 try:
     from .scipySolver import ScipySolver
@@ -0,0 +1,339 @@
+"""
+Decorator of a `olaaaf.mlo_solver.MLOSolver.MLOSolver`, storing the results of the problems it already solved.
+"""
+
+from __future__ import annotations
+
+from ..formula.nullaryFormula.constraint.constraintOperator import ConstraintOperator
+from ..variable import Variable
+from .optimizationValues import OptimizationValues
+from .MLOSolver import MLOSolver
+
+from collections import OrderedDict
+from fractions import Fraction
+import threading
+
+# Typing only imports
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    import numpy as np
+
+class CachedMLOSolver(MLOSolver):
+    """
+    Decorator of a `olaaaf.mlo_solver.MLOSolver.MLOSolver`, storing the results of the problems it already solved
+    so that exact repeats aren't solved again.
+
+    Problems are identified by a canonical form of their variables (name, type and bounds), objective function, constraints
+    and constraints' bounds, which doesn't depend on the order of the variables nor the order of the constraints.
+    Problems given as floating point arrays to `solveArrays` are identified by the bytes of their arrays instead.
+    Results of problems stopped by their time limit aren't stored.
+    Only the least recently used results are evicted once the cache is full.
+    The cache can be shared by multiple threads, the problems themselves being solved outside of its lock.
+
+    Parameters
+    ----------
+    solver : olaaaf.mlo_solver.MLOSolver.MLOSolver
+        The solver used for the problems that aren't stored yet.
+    maxSize : int, optional
+        The maximum number of results stored. If set to `None`, the cache is unbounded. By default, set to 4096.
+
+    Attributes
+    ----------
+    hits : int
+        Number of problems whose result was found in the cache.
+    misses : int
+        Number of problems that had to be given to the decorated solver.
+    """
+
+    hits: int
+    misses: int
+
+    def __init__(self, solver : MLOSolver, maxSize : int = 4096):
+        self.__solver = solver
+        self.__maxSize = maxSize
+        self.__cache = OrderedDict()
+        self.__lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def solve(self, variables : list[Variable], objectif : list[Fraction], constraints : list[tuple[list[Fraction], ConstraintOperator, Fraction]],
+              cutoff : Fraction = None, timeLimit : float = None) -> tuple[OptimizationValues, list[Fraction], Fraction]:
+        """
+        Method returning the result of a mixed linear problem, either from the cache or from the decorated solver.
+
+        Parameters
+        ----------
+        variables : list of olaaaf.variable.variable.Variable
+            Variables used in constraints.
+        objectif : list of fractions.Fraction
+            Weights of the objective function to optimize.
+        constraints : list of tuple of the form (list of fractions.Fraction, olaaaf.formula.nullaryFormula.constraint.constraintOperator.ConstraintOperator, fractions.Fraction)
+            Each tuple represents a linear constraint, with the first element being the weights, the second the operator and the third the bound.
+        cutoff : fractions.Fraction, optional
+            Only the solutions whose objective value is at most `cutoff` are of interest, allowing the solver to abandon the search
+            as soon as it can't find any. If there is none, the problem is considered infeasible. By default, set to `None`.
+        timeLimit : float, optional
+            Maximum time, in seconds, given to the solver. If it is reached before the end of the optimization,
+            `olaaaf.mlo_solver.optimizationValues.OptimizationValues.TIMEOUT` is returned. By default, set to `None` (no limit).
+
+        Returns
+        -------
+        olaaaf.mlo_solver.optimizationValues.OptimizationValues
+            Information of the final state of the problem.
+        list of fractions.Fraction
+            The point at the optimal, if found.
+        fractions.Fraction
+            The optimal value, if found.
+        """
+
+        rows = [[(column, weight) for column, weight in enumerate(constraint[0]) if weight != 0] for constraint in constraints]
+
+        return self.__cached(variables, objectif, rows, [constraint[1] for constraint in constraints], [constraint[2] for constraint in constraints],
+                             cutoff, lambda: self.__solver.solve(variables, objectif, constraints, cutoff, timeLimit))
+
+    def solveSparse(self, variables : list[Variable], objectif : list[Fraction], matrix : tuple[list[int], list[int], list[Fraction]],
+                    operators : list[ConstraintOperator], bounds : list[Fraction], cutoff : Fraction = None, timeLimit : float = None)\
+        -> tuple[OptimizationValues, list[Fraction], Fraction]:
+        """
+        Method returning the result of a mixed linear problem whose constraints are given as a sparse matrix in coordinate (COO) format,
+        either from the cache or from the decorated solver.
+        Problems given to `solve` and `solveSparse` share the same cache.
+
+        Parameters
+        ----------
+        variables : list of olaaaf.variable.variable.Variable
+            Variables used in constraints.
+        objectif : list of fractions.Fraction
+            Weights of the objective function to optimize.
+        matrix : tuple of the form (list of int, list of int, list of fractions.Fraction)
+            The non-zero weights of the constraints, with the first element being their row (i.e. the constraint's index),
+            the second their column (i.e. the variable's index) and the third their value.
+            Duplicate entries are summed.
+        operators : list of olaaaf.formula.nullaryFormula.constraint.constraintOperator.ConstraintOperator
+            The operator of each constraint.
+        bounds : list of fractions.Fraction
+            The bound of each constraint.
+        cutoff : fractions.Fraction, optional
+            Only the solutions whose objective value is at most `cutoff` are of interest, allowing the solver to abandon the search
+            as soon as it can't find any. If there is none, the problem is considered infeasible. By default, set to `None`.
+        timeLimit : float, optional
+            Maximum time, in seconds, given to the solver. If it is reached before the end of the optimization,
+            `olaaaf.mlo_solver.optimizationValues.OptimizationValues.TIMEOUT` is returned. By default, set to `None` (no limit).
+
+        Returns
+        -------
+        olaaaf.mlo_solver.optimizationValues.OptimizationValues
+            Information of the final state of the problem.
+        list of fractions.Fraction
+            The point at the optimal, if found.
+        fractions.Fraction
+            The optimal value, if found.
+        """
+
+        weights = [dict() for _ in bounds]
+        for row, column, value in zip(*matrix):
+            weights[row][column] = weights[row].get(column, 0) + value
+        rows = [[(column, weight) for column, weight in row.items() if weight != 0] for row in weights]
+
+        return self.__cached(variables, objectif, rows, operators, bounds,
+                             cutoff, lambda: self.__solver.solveSparse(variables, objectif, matrix, operators, bounds, cutoff, timeLimit))
+
+    def solveArrays(self, c, A, lb, ub, colLb, colUb, integrality, cutoff : float = None, timeLimit : float = None, exact : bool = False)\
+        -> tuple[OptimizationValues, np.ndarray, float]:
+        r"""
+        Method returning the result of a mixed linear problem given as floating point arrays, either from the cache or from the decorated solver,
+        the arrays being given to it as they are.
+
+        Problems given as arrays have their own entries in the cache, identified by the bytes of the arrays, so only the repeats of the
+        exact same arrays are found (the order of the columns and of the constraints matters).
+
+        Parameters
+        ----------
+        c : numpy.ndarray
+            Weights of the objective function to optimize, of shape (n,).
+        A : numpy.ndarray or scipy.sparse.sparray
+            Weights of the constraints, of shape (m, n).
+        lb, ub : numpy.ndarray
+            Lower and upper bounds of each constraint, of shape (m,). Infinite values are used for unbounded sides,
+            and equal values for equality constraints.
+        colLb, colUb : numpy.ndarray
+            Lower and upper bounds of each variable, of shape (n,). Infinite values are used for unbounded sides.
+        integrality : numpy.ndarray
+            Whether each variable is an integer, of shape (n,).
+        cutoff : float, optional
+            Only the solutions whose objective value is at most `cutoff` are of interest, allowing the solver to abandon the search
+            as soon as it can't find any. If there is none, the problem is considered infeasible. By default, set to `None`.
+        timeLimit : float, optional
+            Maximum time, in seconds, given to the solver. If it is reached before the end of the optimization,
+            `olaaaf.mlo_solver.optimizationValues.OptimizationValues.TIMEOUT` is returned. By default, set to `None` (no limit).
+        exact : bool, optional
+            Whether the point and the optimal value are given as `fractions.Fraction`. By default, set to `False`.
+
+        Returns
+        -------
+        olaaaf.mlo_solver.optimizationValues.OptimizationValues
+            Information of the final state of the problem.
+        numpy.ndarray or list of fractions.Fraction
+            The point at the optimal, if found.
+        float or fractions.Fraction
+            The optimal value, if found.
+        """
+
+        import numpy as np
+
+        key, A = self.__arraysKey(A, lb, ub, colLb, colUb, integrality)
+        key = ("arrays", exact, np.ascontiguousarray(c, dtype=np.float64).tobytes(), key, None if cutoff is None else float(cutoff))
+
+        res = self.__lookup(key)
+        if res is None:
+            res = self.__solver.solveArrays(c, A, lb, ub, colLb, colUb, integrality, cutoff, timeLimit, exact)
+            res = (res[0], list(res[1]) if exact else np.array(res[1], dtype=np.float64), res[2])
+            self.__store(key, res)
+
+        # The stored point is never given itself, so that callers can modify theirs
+        return (res[0], list(res[1]) if exact else res[1].copy(), res[2])
+
+    def isFeasibleArrays(self, A, lb, ub, colLb, colUb, integrality, timeLimit : float = None, exact : bool = False)\
+        -> tuple[OptimizationValues, np.ndarray]:
+        """
+        Method used to verify the feasibility of constraints given as floating point arrays, either from the cache or from
+        the decorated solver's own `olaaaf.mlo_solver.MLOSolver.MLOSolver.isFeasibleArrays`.
+        As for `solveArrays`, the problems are identified by the bytes of their arrays.
+
+        Parameters
+        ----------
+        A : numpy.ndarray or scipy.sparse.sparray
+            Weights of the constraints, of shape (m, n).
+        lb, ub : numpy.ndarray
+            Lower and upper bounds of each constraint, of shape (m,). Infinite values are used for unbounded sides,
+            and equal values for equality constraints.
+        colLb, colUb : numpy.ndarray
+            Lower and upper bounds of each variable, of shape (n,). Infinite values are used for unbounded sides.
+        integrality : numpy.ndarray
+            Whether each variable is an integer, of shape (n,).
+        timeLimit : float, optional
+            Maximum time, in seconds, given to the solver. If it is reached before finding a point,
+            `olaaaf.mlo_solver.optimizationValues.OptimizationValues.TIMEOUT` is returned. By default, set to `None` (no limit).
+        exact : bool, optional
+            Whether the point is given as `fractions.Fraction`. By default, set to `False`.
+
+        Returns
+        -------
+        olaaaf.mlo_solver.optimizationValues.OptimizationValues
+            Information of the final state of the problem, `olaaaf.mlo_solver.optimizationValues.OptimizationValues.OPTIMAL`
+            if a point satisfying every constraint was found.
+        numpy.ndarray or list of fractions.Fraction
+            The point found, if any.
+        """
+
+        import numpy as np
+
+        key, A = self.__arraysKey(A, lb, ub, colLb, colUb, integrality)
+        key = ("feasibility", exact, key)
+
+        res = self.__lookup(key)
+        if res is None:
+            res = self.__solver.isFeasibleArrays(A, lb, ub, colLb, colUb, integrality, timeLimit, exact)
+            res = (res[0], list(res[1]) if exact else np.array(res[1], dtype=np.float64))
+            self.__store(key, res)
+
+        return (res[0], list(res[1]) if exact else res[1].copy())
+
+    def clear(self):
+        """
+        Method used to empty the cache and reset its counters.
+        """
+
+        with self.__lock:
+            self.__cache.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __cached(self, variables, objectif, rows, operators, bounds, cutoff, solve):
+
+        # Canonical order of the columns, variables sharing the same name being told apart by their order of appearance
+        occurrences = dict()
+        columnKeys = []
+        for variable in variables:
+            occurrence = occurrences.get(variable.name, 0)
+            occurrences[variable.name] = occurrence + 1
+            columnKeys.append((variable.name, occurrence, variable.isInteger(), variable.getBounds()))
+        order = sorted(range(len(variables)), key=lambda i: columnKeys[i][:2])
+        position = [0] * len(variables)
+        for canonical, column in enumerate(order):
+            position[column] = canonical
+
+        key = (tuple(columnKeys[column] for column in order),
+               tuple(objectif[column] for column in order),
+               tuple(sorted((tuple(sorted((position[column], weight) for column, weight in row)), operator.value, bound)
+                            for row, operator, bound in zip(rows, operators, bounds))),
+               cutoff)
+
+        cached = self.__lookup(key)
+        if cached is not None:
+            status, point, value = cached
+        else:
+            res = solve()
+            status, value = res[0], res[2]
+            point = [res[1][column] for column in order] if len(res[1]) == len(variables) else list(res[1])
+            self.__store(key, (status, point, value))
+
+        if len(point) == len(variables):
+            point = [point[position[column]] for column in range(len(variables))]
+        else:
+            point = list(point)
+
+        return (status, point, value)
+
+    def __arraysKey(self, A, lb, ub, colLb, colUb, integrality):
+
+        import numpy as np
+
+        def toBytes(array):
+            return np.ascontiguousarray(array, dtype=np.float64).tobytes()
+
+        # The matrix is keyed on its canonical form, and given in this form to the decorated solver
+        if hasattr(A, "tocsr"):
+            A = A.tocsr()
+            if not A.has_canonical_format:
+                A = A.copy()
+                A.sum_duplicates()
+            matrixKey = ("sparse", A.shape, toBytes(A.data), np.ascontiguousarray(A.indices, dtype=np.int64).tobytes(),
+                         np.ascontiguousarray(A.indptr, dtype=np.int64).tobytes())
+        else:
+            A = np.asarray(A, dtype=np.float64).reshape(len(lb), len(colLb))
+            matrixKey = ("dense", A.shape, toBytes(A))
+
+        return (matrixKey, toBytes(lb), toBytes(ub), toBytes(colLb), toBytes(colUb), np.ascontiguousarray(integrality, dtype=bool).tobytes()), A
+
+    def __lookup(self, key):
+
+        with self.__lock:
+            cached = self.__cache.get(key)
+            if cached is not None:
+                self.hits += 1
+                self.__cache.move_to_end(key)
+            else:
+                self.misses += 1
+        return cached
+
+    def __store(self, key, res):
+
+        # A problem stopped by its time limit could have another result with more time
+        if res[0] == OptimizationValues.TIMEOUT:
+            return
+        with self.__lock:
+            self.__cache[key] = res
+            if self.__maxSize is not None and len(self.__cache) > self.__maxSize:
+                self.__cache.popitem(last=False)
+
+    def __getstate__(self):
+
+        # The lock can't be sent to other processes, each copy of the solver gets its own
+        state = super().__getstate__()
+        state.pop("_CachedMLOSolver__lock", None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.__lock = threading.Lock()
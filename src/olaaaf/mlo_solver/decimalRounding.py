@@ -0,0 +1,82 @@
+"""
+Rounding of whole solution vectors to a given decimal, used by `olaaaf.mlo_solver.scipySolverRounded.ScipySolverRounded`
+and `olaaaf.mlo_solver.LPSolverRounded.LPSolverRounded`, and snapping of optimal values to the multiples of a step,
+used by `olaaaf.revision.Revision` for the distances it discretizes.
+"""
+
+from __future__ import annotations
+
+from fractions import Fraction
+
+def roundDecimals(values : list[float], decimals : int, vectorized : bool = True) -> list[Fraction]:
+    r"""
+    Function rounding every value to the given decimal, giving exactly the same `fractions.Fraction` as `round(Fraction(x), decimals)`.
+
+    When `vectorized` is set to `True`, the values are scaled by \(10^{decimals}\) and rounded as a whole with Numpy.
+    Only the values too close to a tie, or too large for the scaling to be exact enough, are rounded with exact arithmetic.
+
+    Parameters
+    ----------
+    values : list of float
+        The values to round.
+    decimals : int
+        The decimal to which all values are rounded.
+    vectorized : bool, optional
+        Whether the values are rounded as a whole (`True`) or one by one with exact arithmetic (`False`). By default, set to `True`.
+
+    Returns
+    -------
+    list of fractions.Fraction
+        The rounded values.
+    """
+
+    # 10**22 is the largest power of 10 that a float can represent exactly
+    if not vectorized or decimals < 0 or decimals > 22:
+        return [round(Fraction(x), decimals) for x in values]
+
+    import numpy as np
+
+    values = np.asarray(values, dtype=np.float64)
+    scale = 10 ** decimals
+
+    with np.errstate(over="ignore", invalid="ignore"):
+        scaled = values * float(scale)
+        # The scaled values may differ from the exact ones by one rounding error, which only matters near a tie
+        unsure = ~(np.abs(scaled) < 2.0**52) | (np.abs(np.abs(scaled - np.floor(scaled)) - 0.5) <= np.abs(scaled) * 2.0**-52)
+
+    rounded = np.rint(np.where(unsure, 0, scaled))
+    res = [Fraction(int(x), scale) for x in rounded.tolist()]
+    for i in np.flatnonzero(unsure).tolist():
+        res[i] = round(Fraction(float(values[i])), decimals)
+
+    return res
+
+def snapToMultiple(value : Fraction, step : Fraction) -> Fraction:
+    r"""
+    Function snapping a value found by a floating point resolution to the closest multiple of `step`, if it is one up to the solver's
+    precision, so that the value doesn't depend on the problem the solver was given.
+
+    The value is snapped when it is at most \(\min(10^{-8} \cdot \max(1, |m|), step / 100)\) away from the closest multiple \(m\).
+    The first term follows the precision of the solvers' optimal values, which is relative to them.
+    The second one keeps the tolerance far below the step, so that a value is only ever snapped to its closest multiple, and a value
+    really lying between two multiples is changed by at most 1% of the step.
+    It can't be much smaller: with a step of \(10^{-4}\), HiGHS gives distances of about \(10^4\) off by a few \(10^{-7}\),
+    which \(step / 1000\) doesn't cover.
+
+    Parameters
+    ----------
+    value : fractions.Fraction
+        The value to snap.
+    step : fractions.Fraction
+        The step whose multiples are snapped to, e.g. the epsilon of a `olaaaf.distance.distance_function.discreteL1DistanceFunction.DiscreteL1DistanceFunction`.
+
+    Returns
+    -------
+    fractions.Fraction
+        The closest multiple of `step` if `value` is close enough to it, `value` otherwise.
+    """
+
+    nearest = step * round(value / step)
+    if abs(value - nearest) <= min(Fraction(1, 10**8) * max(1, abs(nearest)), step / 100):
+        return nearest
+    return value
@@ -13,4 +13,5 @@ class OptimizationValues(enum.Enum):
 
     INFEASIBLE = -1 #: If the problem is infeasible.
     OPTIMAL = 0 #: If an optimum was found.
-    UNBOUNDED = 1 #: If the optimum is at infinite.
\ No newline at end of file
+    UNBOUNDED = 1 #: If the optimum is at infinite.
+    TIMEOUT = 2 #: If the time limit was reached before the end of the optimization.
\ No newline at end of file
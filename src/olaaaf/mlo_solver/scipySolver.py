@@ -9,11 +9,14 @@ from .optimizationValues import OptimizationValues
 from ..variable import Variable
 from .optimizationValues import OptimizationValues
 from .MLOSolver import MLOSolver
+from ..constants import Constants
 
 from fractions import Fraction
 import numpy as np
+import time
 import warnings
 from scipy.optimize import milp, Bounds, LinearConstraint
+from scipy.sparse import csr_array, coo_array
 
 class ScipySolver(MLOSolver) :
     """
@@ -23,8 +26,8 @@ class ScipySolver(MLOSolver) :
     def __init__(self):
         pass
         
-    def solve(self, variables : list[Variable], objectif : list[Fraction], constraints : list[tuple[list[Fraction], ConstraintOperator, Fraction]])\
-        -> tuple[OptimizationValues, list[Fraction], Fraction]:
+    def solve(self, variables : list[Variable], objectif : list[Fraction], constraints : list[tuple[list[Fraction], ConstraintOperator, Fraction]],
+              cutoff : Fraction = None, timeLimit : float = None) -> tuple[OptimizationValues, list[Fraction], Fraction]:
         """
         Method returning the result of a mixed linear problem.
 
@@ -36,6 +39,56 @@ class ScipySolver(MLOSolver) :
             Weights of the objective function to optimize.
         constraints : list of tuple of the form (list of fractions.Fraction, olaaaf.formula.nullaryFormula.constraint.constraintOperator.ConstraintOperator, fractions.Fraction)
             Each tuple represents a linear constraint, with the first element being the weights, the second the operator and the third the bound.
+        cutoff : fractions.Fraction, optional
+            Only the solutions whose objective value is at most `cutoff` are of interest, allowing the solver to abandon the search
+            as soon as it can't find any. If there is none, the problem is considered infeasible. By default, set to `None`.
+        timeLimit : float, optional
+            Maximum time, in seconds, given to the solver. If it is reached before the end of the optimization,
+            `olaaaf.mlo_solver.optimizationValues.OptimizationValues.TIMEOUT` is returned. By default, set to `None` (no limit).
+
+        Returns
+        -------
+        olaaaf.mlo_solver.optimizationValues.OptimizationValues
+            Information of the final state of the problem.
+        list of fractions.Fraction
+            The point at the optimal, if found.
+        fractions.Fraction
+            The optimal value, if found.
+        """
+
+        tab = csr_array(np.array([constraint[0] for constraint in constraints], dtype=np.float64).reshape(len(constraints), len(variables)))
+
+        return self._solveMatrix(variables, objectif, tab, [constraint[1] for constraint in constraints], [constraint[2] for constraint in constraints],
+                                 cutoff, timeLimit)
+
+    def solveSparse(self, variables : list[Variable], objectif : list[Fraction], matrix : tuple[list[int], list[int], list[Fraction]],
+                    operators : list[ConstraintOperator], bounds : list[Fraction], cutoff : Fraction = None, timeLimit : float = None)\
+        -> tuple[OptimizationValues, list[Fraction], Fraction]:
+        """
+        Method returning the result of a mixed linear problem whose constraints are given as a sparse matrix in coordinate (COO) format,
+        meaning that only the non-zero weights are given.
+        The matrix is directly given to HiGHS as a `scipy.sparse` matrix, without ever being expanded.
+
+        Parameters
+        ----------
+        variables : list of olaaaf.variable.variable.Variable
+            Variables used in constraints.
+        objectif : list of fractions.Fraction
+            Weights of the objective function to optimize.
+        matrix : tuple of the form (list of int, list of int, list of fractions.Fraction)
+            The non-zero weights of the constraints, with the first element being their row (i.e. the constraint's index),
+            the second their column (i.e. the variable's index) and the third their value.
+            Duplicate entries are summed.
+        operators : list of olaaaf.formula.nullaryFormula.constraint.constraintOperator.ConstraintOperator
+            The operator of each constraint.
+        bounds : list of fractions.Fraction
+            The bound of each constraint.
+        cutoff : fractions.Fraction, optional
+            Only the solutions whose objective value is at most `cutoff` are of interest, allowing the solver to abandon the search
+            as soon as it can't find any. If there is none, the problem is considered infeasible. By default, set to `None`.
+        timeLimit : float, optional
+            Maximum time, in seconds, given to the solver. If it is reached before the end of the optimization,
+            `olaaaf.mlo_solver.optimizationValues.OptimizationValues.TIMEOUT` is returned. By default, set to `None` (no limit).
 
         Returns
         -------
@@ -46,6 +99,127 @@ class ScipySolver(MLOSolver) :
         fractions.Fraction
             The optimal value, if found.
         """
+
+        rows, columns, values = matrix
+        tab = coo_array((np.array(values, dtype=np.float64), (np.array(rows, dtype=np.intc), np.array(columns, dtype=np.intc))),
+                        shape=(len(bounds), len(variables))).tocsr()
+
+        return self._solveMatrix(variables, objectif, tab, operators, bounds, cutoff, timeLimit)
+
+    def solveArrays(self, c : np.ndarray, A : np.ndarray | csr_array, lb : np.ndarray, ub : np.ndarray, colLb : np.ndarray, colUb : np.ndarray,
+                    integrality : np.ndarray, cutoff : float = None, timeLimit : float = None, exact : bool = False)\
+        -> tuple[OptimizationValues, np.ndarray, float]:
+        r"""
+        Method returning the result of a mixed linear problem given as floating point arrays, of the following form:
+
+        \[
+            \begin{cases}
+                lb \leq Ax \leq ub \\
+                colLb \leq x \leq colUb \\
+                \text{minimize } c^Tx
+            \end{cases}
+        \]
+
+        The arrays are directly given to HiGHS, without any conversion to `fractions.Fraction`.
+
+        Parameters
+        ----------
+        c : numpy.ndarray
+            Weights of the objective function to optimize, of shape (n,).
+        A : numpy.ndarray or scipy.sparse.sparray
+            Weights of the constraints, of shape (m, n).
+        lb, ub : numpy.ndarray
+            Lower and upper bounds of each constraint, of shape (m,). Infinite values are used for unbounded sides,
+            and equal values for equality constraints.
+        colLb, colUb : numpy.ndarray
+            Lower and upper bounds of each variable, of shape (n,). Infinite values are used for unbounded sides.
+        integrality : numpy.ndarray
+            Whether each variable is an integer, of shape (n,).
+        cutoff : float, optional
+            Only the solutions whose objective value is at most `cutoff` are of interest, allowing the solver to abandon the search
+            as soon as it can't find any. If there is none, the problem is considered infeasible. By default, set to `None`.
+        timeLimit : float, optional
+            Maximum time, in seconds, given to the solver. If it is reached before the end of the optimization,
+            `olaaaf.mlo_solver.optimizationValues.OptimizationValues.TIMEOUT` is returned. By default, set to `None` (no limit).
+        exact : bool, optional
+            Whether the point and the optimal value are given as `fractions.Fraction`, reconstructed from the floating point ones
+            as done by `olaaaf.mlo_solver.scipySolver.ScipySolver.solve`. By default, set to `False`.
+
+        Returns
+        -------
+        olaaaf.mlo_solver.optimizationValues.OptimizationValues
+            Information of the final state of the problem.
+        numpy.ndarray or list of fractions.Fraction
+            The point at the optimal, if found.
+        float or fractions.Fraction
+            The optimal value, if found.
+        """
+
+        A = csr_array(A)
+        # HiGHS' wrapper only takes 32 bits indices, which sparse matrices built from 64 bits ones keep
+        A.indices, A.indptr = A.indices.astype(np.intc, copy=False), A.indptr.astype(np.intc, copy=False)
+        c = np.asarray(c, dtype=np.float64)
+        bounds = Bounds(np.asarray(colLb, dtype=np.float64), np.asarray(colUb, dtype=np.float64))
+        lc = LinearConstraint(A, np.asarray(lb, dtype=np.float64), np.asarray(ub, dtype=np.float64)) if A.shape[0] > 0 else None
+
+        options ={"disp":False}
+        deadline = None if timeLimit is None else time.perf_counter() + timeLimit
+
+        if cutoff is not None:
+            # SciPy doesn't forward HiGHS' objective bound, the cutoff is given as a constraint on the objective function instead
+            cutoffLc = LinearConstraint(csr_array(c.reshape(1, -1)), -np.inf, self._relaxedCutoff(cutoff))
+            lc = cutoffLc if lc is None else [lc, cutoffLc]
+
+        with warnings.catch_warnings(action="ignore"):
+            result = milp(c=c, integrality=integrality, constraints=lc, bounds=bounds, options=self.__timed(options, deadline))
+
+        status = result.status
+        if status == 4 and not np.any(c):
+            # HiGHS' presolve can find that the problem is either infeasible or unbounded without telling which,
+            # but a problem with a null objective function, such as the ones of isFeasibleArrays, can't be unbounded
+            status = 2
+        elif status == 0 and not np.all(np.isfinite(result.x)):
+            # HiGHS' presolve can also find an unbounded problem optimal, at a point with infinite values
+            status = 4
+        elif status == 0 and not self.__isFeasiblePoint(result.x, A, lb, ub, bounds):
+            # HiGHS' presolve can also return a point that violates the constraints, the problem is then solved again without it
+            with warnings.catch_warnings(action="ignore"):
+                result = milp(c=c, integrality=integrality, constraints=lc, bounds=bounds,
+                              options=self.__timed(dict(options, presolve=False), deadline))
+            status = result.status
+
+        if status == 4:
+            # HiGHS' presolve can find that the problem is either infeasible or unbounded without telling which.
+            # A problem with a null objective function can't be unbounded, so the problem is only checked for feasibility
+            with warnings.catch_warnings(action="ignore"):
+                check = milp(c=np.zeros(len(c)), integrality=integrality, constraints=lc, bounds=bounds, options=self.__timed(options, deadline))
+            status = {0: 3, 1: 1}.get(check.status, 2)
+
+        if status == 2 and cutoff is None and np.any(np.asarray(integrality) != 0):
+            # HiGHS' presolve sometimes wrongly finds feasible mixed problems infeasible, they are solved once more without it.
+            # Branching without presolve can take very long to prove infeasibility, so it is capped and presolve trusted beyond
+            with warnings.catch_warnings(action="ignore"):
+                retry = milp(c=c, integrality=integrality, constraints=lc, bounds=bounds,
+                             options=self.__timed(dict(options, presolve=False, node_limit=Constants.PRESOLVE_FREE_NODE_LIMIT), deadline))
+            if retry.status == 0 or retry.status == 3:
+                result, status = retry, retry.status
+            elif retry.status == 1 and deadline is not None and time.perf_counter() >= deadline:
+                status = 1
+
+        res : tuple
+        if status == 1:
+            # The time limit was reached
+            res = (OptimizationValues.TIMEOUT, np.empty(0), float(np.inf))
+        elif status == 0:
+            res = (OptimizationValues.OPTIMAL, result.x, result.fun)
+        elif status == 3:
+            res = (OptimizationValues.UNBOUNDED, np.empty(0), float(np.inf))
+        else: res = (OptimizationValues.INFEASIBLE, np.empty(0), float(np.inf))
+        res = self._checkCutoff(res, cutoff)
+        return self._formatResult(res) if exact else res
+
+    def _solveMatrix(self, variables : list[Variable], objectif : list[Fraction], tab : csr_array, operators : list[ConstraintOperator], bounds : list[Fraction],
+                     cutoff : Fraction = None, timeLimit : float = None) -> tuple[OptimizationValues, list[Fraction], Fraction]:
         
         integers = []
         boundsLower = []
@@ -57,43 +231,39 @@ class ScipySolver(MLOSolver) :
             if(upper == None): upper = np.inf
             boundsLower.append(float(lower))
             boundsUpper.append(float(upper))
-        tab = []
+
         limitInf = []
         limitUp = []
-        for constraint in constraints:
-            tab.append(constraint[0])
-            if constraint[1] == ConstraintOperator.LEQ:
+        for operator, bound in zip(operators, bounds):
+            if operator == ConstraintOperator.LEQ:
                 limitInf.append(-np.inf)
-                limitUp.append(constraint[2])
-            elif constraint[1] == ConstraintOperator.GEQ:
-                limitInf.append(constraint[2])
+                limitUp.append(bound)
+            elif operator == ConstraintOperator.GEQ:
+                limitInf.append(bound)
                 limitUp.append(np.inf)
-            elif constraint[1] == ConstraintOperator.EQ:
-                limitInf.append(constraint[2])
-                limitUp.append(constraint[2])
+            elif operator == ConstraintOperator.EQ:
+                limitInf.append(bound)
+                limitUp.append(bound)
 
-        lc = LinearConstraint(tab, limitInf, limitUp)
+        return self.solveArrays(np.array(objectif, dtype=np.float64), tab, np.array(limitInf, dtype=np.float64), np.array(limitUp, dtype=np.float64),
+                                np.array(boundsLower), np.array(boundsUpper), np.array(integers), cutoff, timeLimit, exact=True)
 
-        options ={"presolve":False,
-                  "output_flag":False}
+    def __isFeasiblePoint(self, x : np.ndarray, A : csr_array, lb : np.ndarray, ub : np.ndarray, bounds : Bounds) -> bool:
 
-        # presolve at false to fixed status 4
-        with warnings.catch_warnings(action="ignore"):
-            result = milp(c=objectif, integrality=integers, constraints=lc, bounds=Bounds(boundsLower, boundsUpper), options=options)
-        res : tuple
-        if result.status == 0:
-            res = (OptimizationValues.OPTIMAL, [Fraction(x) for x in result.x], result.fun)
-        elif result.status == 3:
-            res = (OptimizationValues.UNBOUNDED, [], float(np.inf))
-        elif result.status == 4:
-            # in fact status 4 can be return
-            # to detect if the problem is unbounded we test if the objectiv function * -1 is unbounded
-            # if it's not, the problem is infeasible
-            for i in range(0,len(objectif)): objectif[i] *= -1
-            with warnings.catch_warnings(action="ignore"):
-                result = milp(c=objectif, integrality=integers, constraints=lc, bounds=Bounds(boundsLower, boundsUpper), options=options)
-            if result.status == 0 or result.status == 3:
-                res = (OptimizationValues.UNBOUNDED, [], float(np.inf))
-            else: res = (OptimizationValues.INFEASIBLE, [], float(np.inf))
-        else: res = (OptimizationValues.INFEASIBLE, [], float(np.inf))
-        return res
\ No newline at end of file
+        # The tolerance is the one of HiGHS' primal feasibility, relative to the bounds
+        tolerance = 1e-6
+        values = A @ x if A.shape[0] > 0 else np.empty(0)
+        lb, ub = np.asarray(lb, dtype=np.float64), np.asarray(ub, dtype=np.float64)
+        return bool(np.all(values >= lb - tolerance * np.maximum(1, np.abs(lb))) and np.all(values <= ub + tolerance * np.maximum(1, np.abs(ub)))
+                    and np.all(x >= bounds.lb - tolerance * np.maximum(1, np.abs(bounds.lb)))
+                    and np.all(x <= bounds.ub + tolerance * np.maximum(1, np.abs(bounds.ub))))
+
+    def __timed(self, options : dict, deadline : float) -> dict:
+
+        # HiGHS' time limit is given for each resolution, from what remains before the deadline
+        if deadline is None:
+            return options
+        return dict(options, time_limit=max(deadline - time.perf_counter(), 0))
+
+    def _formatResult(self, res : tuple[OptimizationValues, np.ndarray, float]) -> tuple[OptimizationValues, list[Fraction], Fraction]:
+        return (res[0], [Fraction(x) for x in res[1]], res[2])
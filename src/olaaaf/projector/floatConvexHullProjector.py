@@ -8,7 +8,7 @@ from __future__ import annotations
 from ..formula import And, LinearConstraint, Not, ConstraintOperator
 from ..simplificator import Simplificator
 from .projector import Projector
-from ..variable import Variable
+from ..variable import Variable, VariableManager
 
 import itertools
 import numpy as np
@@ -79,24 +79,21 @@ class FloatConvexHullProjector (Projector):
 
         # Third step: Get all hyperplanes
         hyperplanes = list()
+        columns = VariableManager.getColumns({var: i for i, var in enumerate(allVariables)})
 
         for miniPhi in phi.children:
 
-            hypVar = [np.array([])]
-
             if (isinstance(miniPhi, Not)):
-                c = miniPhi.children.clone()
+                c = miniPhi.children
             else:
-                c = miniPhi.clone()
-            
-            for var in allVariables:
-                v = c.variables.get(var)
-                if (v):
-                    hypVar = np.append(hypVar, v)
-                else:
-                    hypVar = np.append(hypVar, Fraction(0))
+                c = miniPhi
 
-            hyperplanes.append((hypVar, c.bound))
+            # The vertices are computed with floats, the hyperplanes are kept as such
+            ids, numerators, denominator = c.getArrays()
+            hypVar = np.zeros(len(allVariables))
+            hypVar[columns[ids]] = (numerators / denominator).astype(float)
+
+            hyperplanes.append((hypVar, float(c.bound)))
 
         #for h in hyperplanes:
             #print([float(a) for a in h[0]])
@@ -132,12 +129,8 @@ class FloatConvexHullProjector (Projector):
 
         for comb in nonParallelCombinations:
 
-            a = []
-            b = []
-
-            for hyperplane in comb:
-                a.append([float(x) for x in hyperplane[0]])
-                b.append(float(hyperplane[1]))
+            a = np.array([hyperplane[0] for hyperplane in comb])
+            b = np.array([hyperplane[1] for hyperplane in comb])
 
             try:
                 vertices.append(np.linalg.solve(a, b))
@@ -6,22 +6,52 @@ Main class of the module, allowing the user to make the knowledge revision betwe
 from __future__ import annotations
 
 
-from .formula import Formula, Or, And, UnaryFormula, NullaryFormula, LinearConstraint, Not, ConstraintOperator, PropositionalVariable, EnumeratedType
+from .formula import Formula, Or, And, UnaryFormula, NullaryFormula, LinearConstraint, Not, ConstraintOperator, PropositionalVariable, EnumeratedType, ConstraintPool
 from .formulaInterpreter import FormulaInterpreter
 from .mlo_solver import MLOSolver
+from .mlo_solver.decimalRounding import snapToMultiple
 from .distance import DistanceFunction
 from .constants import Constants
 from .simplificator import Simplificator
 from .projector import Projector
 from .variable import IntegerVariable
+from .timeBudget import TimeBudget
+from .coupleSession import CoupleSession
 
 from fractions import Fraction
 from tqdm import tqdm
 import time
 from contextlib import ExitStack
+from functools import partial
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+import multiprocessing
 
+import heapq
 import math
 
+# Revision, best distance shared between workers and open sessions of each worker process of olaaaf.revision.Revision.execute
+_workerRevision = None
+_workerIncumbent = None
+_workerSatMu = None
+_workerStack = None
+_workerSessions = None
+_workerPool = None
+
+def _initWorker(revision, incumbent = None, satMu = None, pool = None):
+    global _workerRevision, _workerIncumbent, _workerSatMu, _workerStack, _workerSessions, _workerPool
+    _workerRevision = revision
+    _workerIncumbent = incumbent
+    _workerSatMu = satMu
+    _workerPool = pool
+    _workerStack = ExitStack()
+    _workerSessions = dict()
+
+def _executeInWorker(pair):
+    return _workerRevision._executeShared(*pair)
+
+def _satInWorker(chunk):
+    return _workerRevision._satChunk(_workerPool, chunk)
+
 class Revision:
     r"""
     Main class of the module, allowing the user to make the knowledge revision between two `olaaaf.formula.formula.Formula`
@@ -46,6 +76,10 @@ class Revision:
         By default, this constant is set to whichever one was chosen in `olaaaf.constants.Constants`.
     projector : boolean, optional
         Projector algorithm to use, only necessary if `onlyOneSolution` is set to `False`.
+    disjunctive : boolean, optional
+        If set to `True`, \(\psi\) and \(\mu\) aren't put in Disjunctive Normal Form: their disjunctions are encoded in a single
+        mixed linear problem by `olaaaf.formulaInterpreter.FormulaInterpreter.optimizeFormulas`, instead of one problem per combination
+        of their conjunctions. Only available if `onlyOneSolution` is set to `True`. By default, set to `False`.
     """
     
     __distance : DistanceFunction
@@ -53,7 +87,11 @@ class Revision:
     __e2bConstraints: set[Formula]
     _onlyOneSolution: bool
 
-    def __init__(self, solverInit : MLOSolver, distance : DistanceFunction, simplifiers : list[Simplificator] = [], onlyOneSolution: bool = Constants.ONLY_ONE_SOLUTION, verbose: bool = Constants.SET_VERBOSE, projector: Projector = None) -> None:        
+    def __init__(self, solverInit : MLOSolver, distance : DistanceFunction, simplifiers : list[Simplificator] = [], onlyOneSolution: bool = Constants.ONLY_ONE_SOLUTION, verbose: bool = Constants.SET_VERBOSE, projector: Projector = None,
+                 disjunctive: bool = False) -> None:
+        if disjunctive and not onlyOneSolution:
+            raise(AttributeError("The disjunctive revision can only find one solution"))
+
         self.__distance = distance 
         self.__interpreter = FormulaInterpreter(solverInit, distance, simplifiers)
         self._onlyOneSolution = onlyOneSolution
@@ -62,6 +100,7 @@ class Revision:
         self.__e2bConstraints = set()
 
         self.__projector = projector
+        self.__disjunctive = disjunctive
 
     def preload(self):
         r"""
@@ -94,7 +133,7 @@ class Revision:
         self.boolToInt[var] = intVar
         weights[intVar] = weights[var]
 
-    def execute(self, psi : Formula, mu : Formula, withTableaux = True, withMaxDist = True) -> tuple[Fraction, Formula]:
+    def execute(self, psi : Formula, mu : Formula, withTableaux = True, withMaxDist = True, timeLimit : float | TimeBudget = None, workers : int = 1, threads : bool = False) -> tuple[Fraction, Formula]:
         r"""
         Execute the revision of \(\psi\) by \(\mu\).
 
@@ -108,6 +147,17 @@ class Revision:
             Wether the analytic tableaux method should be used to prune unsatisfiable branches. By default, set to `True`.
         withMaxDist: `boolean`
             Wether the currently known maximum distance should be used during the revision process. By default, set to `True`.
+        timeLimit: `float` or `olaaaf.timeBudget.TimeBudget`
+            Time, in seconds, or `olaaaf.timeBudget.TimeBudget` shared by every optimization problem solved during the revision process.
+            By default, set to `None` (no limit).
+        workers: `int`
+            Number of processes revising the combinations of conjunctions of \(\psi\) and \(\mu\) at the same time,
+            sharing the best distance found to prune the others. Whatever the order in which they end, ties between combinations
+            are broken as if they were revised one after the other. The satisfiability of the children of \(\psi\) and \(\mu\)
+            is also tested by this many workers. By default, set to 1 (everything is done in the current process).
+        threads: `boolean`
+            Wether the satisfiability of the children of \(\psi\) and \(\mu\) is tested by threads instead of processes,
+            the combinations are always revised by processes. By default, set to `False`.
             
         Returns
         -------
@@ -116,9 +166,20 @@ class Revision:
             given at the initialization of the class) between \(\psi\) and \(\mu\).
         `olaaaf.formula.formula.Formula`
             Result of the knowledge revison of \(\psi\) by \(\mu\).
+
+        Raises
+        ------
+        olaaaf.timeLimitException.TimeLimitException
+            If the time budget is exhausted before the end of the revision.
         """
 
         self.__withMaxDist = withMaxDist
+        self.__workers = workers
+        self.__threads = threads
+
+        if timeLimit is not None and not isinstance(timeLimit, TimeBudget):
+            timeLimit = TimeBudget(timeLimit)
+        self.__interpreter.setBudget(timeLimit)
 
         self.__timeStart = time.perf_counter()
 
@@ -126,27 +187,36 @@ class Revision:
             psi &= And(*self.__e2bConstraints)
             mu &= And(*self.__e2bConstraints)
 
-        if self.__verbose:
-            print("\n" + self.__getTime(), "Transforming Psi in DNF form")
+        if self.__disjunctive:
+            res = self.__executeDisjunctive(psi.toPCMLC(self.boolToInt).toLessOrEqConstraint(), mu.toPCMLC(self.boolToInt).toLessOrEqConstraint())
 
-        if withTableaux:
-            psiDNF = psi.toDNFWithTableaux().toPCMLC(self.boolToInt).toLessOrEqConstraint().toDNFWithTableaux()
-            if not psiDNF:
-                raise(AttributeError("Psi is not satisfiable"))
         else:
-            psiDNF = psi.toPCMLC(self.boolToInt).toLessOrEqConstraint().toDNF()
+            # Litterals are shared by all the conjunctions of Psi and Mu, each conjunction only keeping their ids
+            pool = ConstraintPool()
 
-        if self.__verbose:
-            print("\n" + self.__getTime(), "Transforming Mu in DNF form")
+            if self.__verbose:
+                print("\n" + self.__getTime(), "Transforming Psi in DNF form")
 
-        if withTableaux:
-            muDNF = mu.toDNFWithTableaux().toPCMLC(self.boolToInt).toLessOrEqConstraint().toDNFWithTableaux()
-            if not muDNF:
-                raise(AttributeError("Mu is not satisfiable"))
-        else:
-            muDNF = mu.toPCMLC(self.boolToInt).toLessOrEqConstraint().toDNF()
+            if withTableaux:
+                psiDNF = psi.toDNFWithTableaux().toPCMLC(self.boolToInt).toLessOrEqConstraint().toDNFWithTableaux()
+                if not psiDNF:
+                    raise(AttributeError("Psi is not satisfiable"))
+            else:
+                psiDNF = psi.toPCMLC(self.boolToInt).toLessOrEqConstraint()
+            psiTerms = pool.toDNF(psiDNF)
+
+            if self.__verbose:
+                print("\n" + self.__getTime(), "Transforming Mu in DNF form")
+
+            if withTableaux:
+                muDNF = mu.toDNFWithTableaux().toPCMLC(self.boolToInt).toLessOrEqConstraint().toDNFWithTableaux()
+                if not muDNF:
+                    raise(AttributeError("Mu is not satisfiable"))
+            else:
+                muDNF = mu.toPCMLC(self.boolToInt).toLessOrEqConstraint()
+            muTerms = pool.toDNF(muDNF)
 
-        res = self.__executeDNF(self.__convertExplicit(psiDNF), self.__convertExplicit(muDNF))
+            res = self.__executeDNF(pool, psiTerms, muTerms)
 
         if self.__verbose:
             print("\n" + self.__getTime(), f"Solution found with distance of {res[0]}:\n")
@@ -157,35 +227,23 @@ class Revision:
 
         return res
         
-    def __executeDNF(self, psi: Formula, mu: Formula) -> tuple[Fraction, Formula]:
+    def __executeDNF(self, pool: ConstraintPool, psiTerms: list[int], muTerms: list[int]) -> tuple[Fraction, Formula]:
         
         res = None
         disRes = None
 
         if self.__verbose:
             print("")
-            psiIter = tqdm(psi.children, desc=f"{self.__getTime()} Testing satisfiability of every child of Psi", mininterval=0.5)
-        else:
-            psiIter = psi.children
 
-        satPsi = set()
-        for miniPsi in psiIter:
-            if self.__interpreter.sat(miniPsi):
-                satPsi.add(miniPsi)
+        satPsi = self.__filterSat(pool, psiTerms, "Psi")
 
         if len(satPsi) == 0:
             raise(AttributeError("Psi is not satisfiable"))
 
         if self.__verbose:
             print(self.__getTime(), f"{len(satPsi)} satisfiable children of Psi found\n")
-            muIter = tqdm(mu.children, desc=f"{self.__getTime()} Testing satisfiability of every child of Mu", mininterval=0.5)
-        else:
-            muIter = mu.children
-            
-        satMu = set()
-        for miniMu in muIter:
-            if self.__interpreter.sat(miniMu):
-                satMu.add(miniMu)
+
+        satMu = self.__filterSat(pool, muTerms, "Mu")
 
         if len(satMu) == 0:
             raise(AttributeError("Mu is not satisfiable"))
@@ -196,84 +254,322 @@ class Revision:
             print(self.__getTime(), f"{len(satMu)} satisfiable children of Mu found")
             print("\n" + self.__getTime(), f"{maxIter} combinations of conjunctions found")
 
-        if(self._onlyOneSolution):
+        # With a maximum distance, the most promising combinations are revised first
+        if self.__withMaxDist:
+            pairs = self.__schedulePairs(satPsi, satMu)
+        else:
+            pairs = self.__boxPairs({miniPsi: self.__interpreter.removeNot(miniPsi) for miniPsi in satPsi},
+                                    {miniMu: self.__interpreter.removeNot(miniMu) for miniMu in satMu})
 
-            with ExitStack() as stack:
+        if self.__workers > 1 and len(pairs) > 1:
+            lits = self.__executeParallel(pairs, satMu)
+        else:
+            lits = self.__executeSequential(pairs, satMu)
 
-                if self.__verbose:
-                    pbar = stack.enter_context(tqdm(total=maxIter, desc=f"{self.__getTime()} Revision of every combination", mininterval=0.5))
-
-                for miniPsi in satPsi:
-                    for miniMu in satMu:
-
-                        # print("-----------------")
-                        # print("miniPsi:", miniPsi)
-                        # print("miniMu:", miniMu)
-                        if self.__withMaxDist:      
-                            lit = self.__executeLiteral(miniPsi, miniMu, disRes)
-                        else:
-                            lit = self.__executeLiteral(miniPsi, miniMu)
-
-                        if lit is None:
-                            pass
-                        elif self.__interpreter.sat(lit[1]):
-
-                            if not (lit[0] is None):
-                                if (disRes is None):
-                                    disRes = lit[0]
-                                    res = lit[1]
-                                elif (disRes > lit[0]):
-                                    disRes = lit[0]
-                                    res = lit[1]
-                            else:
-                                if (disRes is None) & (res is None):
-                                    res = lit[1]
-                        else:
-                            print("\nWarning: one revised litteral isn't satisfiable, consider using a bigger Epsilon value for the distance function.\n")
+        # Results are folded in the order of the combinations, so that ties are always broken the same way
+        if(self._onlyOneSolution):
 
-                        if self.__verbose:
-                            pbar.update(1)
+            for lit in lits:
+
+                if lit is None:
+                    pass
+                elif not (lit[0] is None):
+                    if (disRes is None):
+                        disRes = lit[0]
+                        res = lit[1]
+                    elif (disRes > lit[0]):
+                        disRes = lit[0]
+                        res = lit[1]
+                else:
+                    if (disRes is None) & (res is None):
+                        res = lit[1]
 
         else:
 
             setRes = set()
-            
-            with ExitStack() as stack:
 
-                if self.__verbose:
-                    pbar = stack.enter_context(tqdm(total=maxIter, desc=f"{self.__getTime()} Revision of every combination", mininterval=0.5))
-
-                for miniPsi in satPsi:
-                    for miniMu in satMu:
-
-                        if self.__withMaxDist:      
-                            lit = self.__executeLiteral(miniPsi, miniMu, disRes)
-                        else:
-                            lit = self.__executeLiteral(miniPsi, miniMu)
-                        
-                        if lit is None:
-                            pass
-                        if not (lit[0] is None):
-                            if (disRes is None):
-                                disRes = lit[0]
-                                setRes = {lit[1]}
-                            elif (disRes == lit[0]):
-                                setRes.add(lit[1])
-                            elif (disRes > lit[0]):
-                                disRes = lit[0]
-                                setRes = {lit[1]}
-                        else:
-                            if (disRes is None):
-                                setRes.add(lit[1])
-
-                        if self.__verbose:
-                            pbar.update(1)
+            for lit in lits:
+
+                if lit is None:
+                    pass
+                elif not (lit[0] is None):
+                    if (disRes is None):
+                        disRes = lit[0]
+                        setRes = {lit[1]}
+                    elif (disRes == lit[0]):
+                        setRes.add(lit[1])
+                    elif (disRes > lit[0]):
+                        disRes = lit[0]
+                        setRes = {lit[1]}
+                else:
+                    if (disRes is None):
+                        setRes.add(lit[1])
 
             res = Or(*setRes).toDNF()
 
         return (disRes, self.__interpreter.simplifyMLC(res.toLessOrEqConstraint().toDNF()))
     
-    def __executeLiteral(self, psi: Formula, mu: Formula, maxDist: Fraction = None) -> tuple[Fraction, Formula]:
+    def __executeDisjunctive(self, psi: Formula, mu: Formula) -> tuple[Fraction, Formula]:
+
+        from . import InfeasableException
+
+        epsilon = self.__distance._epsilon
+
+        if self.__verbose:
+            print("\n" + self.__getTime(), "Revision of Psi by Mu in a single problem")
+
+        # Same steps as __executeLiteral, on the whole formulas
+        try:
+            dStar, psiPrime = self.__interpreter.optimizeFormulas(psi, mu)
+        except InfeasableException as e:
+            raise(AttributeError("Psi or Mu is not satisfiable"))
+
+        dStar = snapToMultiple(dStar, self.__distance._epsilon)
+
+        inMu = self.__interpreter.holds(mu, psiPrime)
+        if dStar % epsilon != 0:
+            distance = lambdaEpsilon = epsilon * math.ceil(dStar / epsilon)
+        else:
+            distance = dStar
+            lambdaEpsilon = dStar + epsilon
+
+        # The point found on the adherence of the formulas may miss their strict inequalities
+        if not inMu:
+            try:
+                psiPrime = self.__interpreter.optimizeFormulas(psi, mu, epsilon, lambdaEpsilon)[1]
+            except InfeasableException as e:
+                raise(AttributeError("Mu is not satisfiable"))
+
+        return (distance, self.__interpreter.simplifyMLC(psiPrime.toLessOrEqConstraint().toDNF()))
+
+    def __filterSat(self, pool: ConstraintPool, terms: list[int], name: str) -> list[Formula]:
+
+        # The satisfiable children are kept in their original order, whatever the order in which their tests end
+        if self.__verbose:
+            pbar = tqdm(total=len(terms), desc=f"{self.__getTime()} Testing satisfiability of every child of {name}", mininterval=0.5)
+
+        if self.__workers <= 1 or len(terms) <= 1:
+            sats = []
+            for term in terms:
+                sats.append(self.__interpreter.sat(And(*pool.getLitterals(term))))
+                if self.__verbose:
+                    pbar.update(1)
+        else:
+            # Small problems are sent together to reduce the communication cost
+            chunkSize = max(1, math.ceil(len(terms) / (4 * self.__workers)))
+            chunks = [terms[i:i + chunkSize] for i in range(0, len(terms), chunkSize)]
+            results = [None] * len(chunks)
+
+            if self.__threads:
+                executor = ThreadPoolExecutor(max_workers=self.__workers)
+                task = partial(self._satChunk, pool)
+            else:
+                executor = ProcessPoolExecutor(max_workers=self.__workers, initializer=_initWorker, initargs=(self, None, None, pool))
+                task = _satInWorker
+
+            with executor:
+                futures = {executor.submit(task, chunk): i for i, chunk in enumerate(chunks)}
+                try:
+                    for future in as_completed(futures):
+                        results[futures[future]] = future.result()
+                        if self.__verbose:
+                            pbar.update(len(chunks[futures[future]]))
+                except BaseException:
+                    executor.shutdown(cancel_futures=True)
+                    raise
+
+            sats = [sat for result in results for sat in result]
+
+        if self.__verbose:
+            pbar.close()
+        # Only the satisfiable conjunctions are built, interned so that each one is only revised once
+        return [pool.materialize(term) for term, sat in zip(terms, sats) if sat]
+
+    def _satChunk(self, pool: ConstraintPool, chunk: list[int]) -> list[bool]:
+        return [self.__interpreter.sat(And(*pool.getLitterals(term))) for term in chunk]
+
+    def __executeSequential(self, pairs: list[tuple[float, Formula, Formula]], satMu: list[Formula]) -> list[tuple[Fraction, Formula]]:
+
+        # Results are kept in the order of the combinations whatever the order of their revision, as done by __executeParallel
+        lits = [None] * len(pairs)
+        disRes = None
+
+        with ExitStack() as stack:
+
+            if self.__verbose:
+                pbar = stack.enter_context(tqdm(total=len(pairs), desc=f"{self.__getTime()} Revision of every combination", mininterval=0.5))
+
+            sessions = dict()
+            if self.__withMaxDist:
+                schedule = self.__relaxedOrder(pairs, lambda bound: self.__isDominated(bound, disRes))
+            else:
+                schedule = ((i, *pair) for i, pair in enumerate(pairs))
+            for i, bound, miniPsi, miniMu in schedule:
+
+                self.__interpreter.checkBudget()
+
+                # The distance of a combination can't be below its lower bound
+                if self.__isDominated(bound, disRes):
+                    continue
+
+                session = self.__getSession(stack, sessions, miniPsi, satMu)
+
+                if self.__withMaxDist:
+                    lit = self.__executeLiteral(miniPsi, miniMu, disRes, session)
+                else:
+                    lit = self.__executeLiteral(miniPsi, miniMu, session=session)
+                lit = self.__checkLiteral(lit)
+                lits[i] = lit
+
+                if lit is not None and lit[0] is not None and (disRes is None or lit[0] < disRes):
+                    disRes = lit[0]
+
+                if self.__verbose:
+                    pbar.update(1)
+
+            # The combinations left are the ones that were discarded
+            if self.__verbose:
+                pbar.update(pbar.total - pbar.n)
+
+        return lits
+
+    def __executeParallel(self, pairs: list[tuple[float, Formula, Formula]], satMu: list[Formula]) -> list[tuple[Fraction, Formula]]:
+
+        # The best distance found by any worker, shared to prune the combinations of all the others
+        incumbent = multiprocessing.Value("d", math.inf)
+        lits = [None] * len(pairs)
+
+        with ExitStack() as stack:
+
+            if self.__verbose:
+                pbar = stack.enter_context(tqdm(total=len(pairs), desc=f"{self.__getTime()} Revision of every combination", mininterval=0.5))
+
+            # Workers only live for this revision, their sessions are freed with them
+            executor = stack.enter_context(ProcessPoolExecutor(max_workers=self.__workers, initializer=_initWorker, initargs=(self, incumbent, satMu)))
+            futures = {executor.submit(_executeInWorker, (bound, miniPsi, miniMu)): i for i, (bound, miniPsi, miniMu) in enumerate(pairs)}
+
+            try:
+                for future in as_completed(futures):
+                    lits[futures[future]] = future.result()
+                    if self.__verbose:
+                        pbar.update(1)
+            except BaseException:
+                executor.shutdown(cancel_futures=True)
+                raise
+
+        return lits
+
+    def _executeShared(self, bound: float, miniPsi: Formula, miniMu: Formula) -> tuple[Fraction, Formula]:
+
+        self.__interpreter.checkBudget()
+
+        with _workerIncumbent.get_lock():
+            best = _workerIncumbent.value
+        disRes = None if best == math.inf else Fraction(best)
+
+        # Combinations are sent by lower bound, but the best distance may have been found meanwhile
+        if self.__isDominated(bound, disRes):
+            return None
+
+        # The bound of the linear relaxation is only computed for the combinations that the boxes don't discard
+        if self.__withMaxDist:
+            bound = self.__relaxedBound(bound, miniPsi, miniMu)
+            if bound == math.inf or self.__isDominated(bound, disRes):
+                return None
+
+        session = self.__getSession(_workerStack, _workerSessions, miniPsi, _workerSatMu)
+
+        if self.__withMaxDist:
+            lit = self.__executeLiteral(miniPsi, miniMu, disRes, session)
+        else:
+            lit = self.__executeLiteral(miniPsi, miniMu, session=session)
+        lit = self.__checkLiteral(lit)
+
+        if lit is not None and lit[0] is not None:
+            with _workerIncumbent.get_lock():
+                _workerIncumbent.value = min(_workerIncumbent.value, float(lit[0]))
+
+        return lit
+
+    def __checkLiteral(self, lit: tuple[Fraction, Formula]) -> tuple[Fraction, Formula]:
+
+        # The only point kept must satisfy mu
+        if lit is not None and self._onlyOneSolution and not self.__interpreter.sat(lit[1]):
+            print("\nWarning: one revised litteral isn't satisfiable, consider using a bigger Epsilon value for the distance function.\n")
+            return None
+        return lit
+
+    def __schedulePairs(self, satPsi: list[Formula], satMu: list[Formula]) -> list[tuple[float, Formula, Formula]]:
+
+        psiLitterals = {miniPsi: self.__interpreter.removeNot(miniPsi) for miniPsi in satPsi}
+        muLitterals = {miniMu: self.__interpreter.removeNot(miniMu) for miniMu in satMu}
+
+        # The bound of the linear relaxation is only computed once a combination is about to be revised, see __relaxedOrder
+        pairs = self.__boxPairs(psiLitterals, muLitterals)
+        pairs.sort(key=lambda pair: pair[0])
+        return pairs
+
+    def __relaxedBound(self, bound: float, miniPsi: Formula, miniMu: Formula) -> float:
+
+        # Lower bound of the linear relaxation, math.inf if the combination can't be revised
+        return max(bound, self.__interpreter.coupleLowerBound(self.__interpreter.removeNot(miniPsi), self.__interpreter.removeNot(miniMu)))
+
+    def __relaxedOrder(self, pairs: list[tuple[float, Formula, Formula]], isDominated):
+
+        # Best-first order of the combinations: the bound of the linear relaxation is only computed for the combination whose
+        # box bound is the smallest, which is put back until its own bound is the smallest of all.
+        # Once the smallest bound is dominated, so are all the others and nothing more is computed
+        heap = [(bound, i, False) for i, (bound, _, _) in enumerate(pairs)]
+        heapq.heapify(heap)
+        while len(heap) > 0 and not isDominated(heap[0][0]):
+            bound, i, relaxed = heapq.heappop(heap)
+            _, miniPsi, miniMu = pairs[i]
+            if relaxed:
+                yield i, bound, miniPsi, miniMu
+                continue
+            bound = self.__relaxedBound(bound, miniPsi, miniMu)
+            if bound != math.inf:
+                heapq.heappush(heap, (bound, i, True))
+
+    def __boxPairs(self, psiLitterals: dict[Formula, And], muLitterals: dict[Formula, And]) -> list[tuple[float, Formula, Formula]]:
+
+        import numpy as np
+
+        variables = list(set().union(*(phi.getVariables() for phi in psiLitterals.values()),
+                                     *(phi.getVariables() for phi in muLitterals.values())))
+        weights = self.__distance.getWeights()
+        w = np.array([float(weights[variable]) for variable in variables])
+
+        # One box per conjunction, found without the solver
+        psiList = list(psiLitterals)
+        muList = list(muLitterals)
+        psiBoxes = [self.__interpreter.boundingBox(psiLitterals[miniPsi], variables) for miniPsi in psiList]
+        muBoxes = [self.__interpreter.boundingBox(muLitterals[miniMu], variables) for miniMu in muList]
+        psiLower, psiUpper = (np.array([box[i] for box in psiBoxes]).reshape(len(psiList), len(variables)) for i in (0, 1))
+        muLower, muUpper = (np.array([box[i] for box in muBoxes]).reshape(len(muList), len(variables)) for i in (0, 1))
+
+        # Lower bound of each combination: the weighted gap between the boxes, of shape (psi, mu)
+        with np.errstate(invalid="ignore"):
+            gap = np.maximum(muLower[None, :, :] - psiUpper[:, None, :], psiLower[:, None, :] - muUpper[None, :, :])
+        gap = np.where(gap > 0, gap, 0)
+        lowerBounds = gap @ w
+
+        # The combinations are only discarded by their lower bound once a revised combination gives a distance that is kept,
+        # see __isDominated, since the combinations whose boxes are the closest may be rejected by __checkLiteral
+        return [(float(lowerBounds[i, j]), miniPsi, miniMu) for i, miniPsi in enumerate(psiList) for j, miniMu in enumerate(muList)]
+
+    def __isDominated(self, bound: float, disRes: Fraction) -> bool:
+
+        # The lower bound comes from a floating point resolution, hence the tolerance
+        return bound is not None and disRes is not None and bound > float(disRes) + 1e-6 * max(1, abs(float(disRes)))
+
+    def __getSession(self, stack: ExitStack, sessions: dict[Formula, CoupleSession], miniPsi: Formula, satMu: list[Formula]) -> CoupleSession:
+
+        if miniPsi not in sessions:
+            sessions[miniPsi] = stack.enter_context(self.__interpreter.createCoupleSession(self.__interpreter.removeNot(miniPsi), satMu))
+        return sessions[miniPsi]
+
+    def __executeLiteral(self, psi: Formula, mu: Formula, maxDist: Fraction = None, session: CoupleSession = None) -> tuple[Fraction, Formula]:
         
         from . import InfeasableException
 
@@ -281,10 +577,15 @@ class Revision:
 
         # second step: find dStar (and psiPrime if onlyOneSoltuion)
         try:
-            dStar, psiPrime = self.__executeConstraint(self.__interpreter.removeNot(psi), self.__interpreter.removeNot(mu), maxDist)
+            if session is None:
+                dStar, psiPrime = self.__executeConstraint(self.__interpreter.removeNot(psi), self.__interpreter.removeNot(mu), maxDist)
+            else:
+                dStar, psiPrime = session.optimize(self.__interpreter.removeNot(mu), maxDist)
         except InfeasableException as e:
             return None
 
+        dStar = snapToMultiple(dStar, self.__distance._epsilon)
+
         # third step: lambdaEpsilon
         if dStar % epsilon == 0:
             lambdaEpsilon = dStar
@@ -296,24 +597,31 @@ class Revision:
         if(not self._onlyOneSolution):
             psiPrime = self.__expand(psi, lambdaEpsilon)
     
+        # With only one solution, psiPrime is a point: whether it is in mu is checked without the solver, and if it isn't,
+        # a point at the discretized distance is found in a single problem where the strict inequalities are relaxed by epsilon
+        if self._onlyOneSolution:
+            inMu = self.__interpreter.holds(mu, psiPrime)
+        else:
+            inMu = self.__interpreter.sat(psiPrime & mu)
+
         # fifth step
         if dStar % epsilon != 0:
             # print("dStar % epsilon != 0")
-            if self._onlyOneSolution & (not self.__interpreter.sat(psiPrime & mu)):
+            if self._onlyOneSolution & (not inMu):
                 try:
-                    psiPrime = self.__interpreter.optimizeCoupleWithLimit(self.__interpreter.removeNot(psi, epsilon), self.__interpreter.removeNot(mu, epsilon), lambdaEpsilon, None)[1]
+                    psiPrime = self.__interpreter.optimizeCoupleDiscretized(psi, mu, epsilon)
                 except InfeasableException as e:
                     return None
             # print("psiPrime2:", psiPrime)
             return (lambdaEpsilon, psiPrime & mu)
-        elif self.__interpreter.sat(psiPrime & mu):
+        elif inMu:
             return (dStar, psiPrime & mu)
         else:
             # print("else")
             lambdaEpsilon = dStar + epsilon
             if (self._onlyOneSolution):
                 try:
-                    psiPrime = self.__interpreter.optimizeCoupleWithLimit(self.__interpreter.removeNot(psi, epsilon), self.__interpreter.removeNot(mu, epsilon), lambdaEpsilon, None)[1]
+                    psiPrime = self.__interpreter.optimizeCoupleDiscretized(psi, mu, epsilon)
                 except InfeasableException as e:
                     return None
             else:
@@ -324,21 +632,6 @@ class Revision:
     def __executeConstraint(self, phi: Formula, mu: Formula, maxDist: Fraction) -> tuple[Fraction, Formula]:
         return self.__interpreter.optimizeCouple(phi, mu, maxDist)
     
-    def __convertExplicit(self, phi: Formula) -> Formula:
-        
-        if isinstance(phi, And):
-            return Or(phi)
-        elif isinstance(phi, UnaryFormula) | isinstance(phi, NullaryFormula):
-            return Or(And(phi))
-        else:
-            orSet = set()
-            for miniPhi in phi.children:
-                if isinstance(miniPhi, And):
-                    orSet.add(miniPhi)
-                else:
-                    orSet.add(And(miniPhi))
-            return Or(*orSet)
-
     def __expand(self, psi: Formula, lambdaEpsilon: Fraction) -> Formula:
         
         yVariables = {v: v.__class__.declareAnonymous(ending = ("y" + str(v.name))) for v in psi.getVariables()}
@@ -52,33 +52,40 @@ class Caron(Simplificator):
         e = RealVariable("@")
         variables = list(phi.getVariables())
         variables.append(e)
-        for litteral in phi.children:
-            constraint : LinearConstraint
-            constraint = litteral.children if isinstance(litteral, Not) else litteral
-            
-            # for all litteral, want to maximise his values
-            finalConstraints.remove(litteral)
-            newPhi = And(*finalConstraints)
-            phiTab = self._toTab(newPhi, e, variables=variables) 
-            objectif = []
-            for variable in variables:
-                objectif.append(0 if not variable in constraint.variables.keys() else constraint.variables[variable]*-1)
-            res = self._solver.solve(variables, objectif, phiTab)
-            xStar = res[1]
-            if res[0] == OptimizationValues.OPTIMAL:
+
+        # A single model is kept for the whole conjunction, only the tested litteral and the objective change
+        with self._solver.createModel(variables, [0] * len(variables), [self._eRow(e, variables)]) as model:
+            rowIds = {litteral: [model.addConstraint(*row) for row in self._toRows(litteral, e, variables)] for litteral in finalConstraints}
+
+            for litteral in phi.children:
+                constraint : LinearConstraint
+                constraint = litteral.children if isinstance(litteral, Not) else litteral
+                
+                # for all litteral, want to maximise his values
+                finalConstraints.remove(litteral)
+                for rowId in rowIds[litteral]:
+                    model.removeConstraint(rowId)
+                objectif = []
+                for variable in variables:
+                    objectif.append(0 if not variable in constraint.variables.keys() else constraint.variables[variable]*-1)
+                model.setObjective(objectif)
+                res = model.solve(timeLimit=self._interpreter.getTimeLimit())
+                xStar = res[1]
                 mustBeDeleted = False
-                # if the maximum values is <= bound we deleted the litteral
-                if isinstance(constraint, NullaryFormula):
-                    sum = 0
-                    for i in range(0,len(variables)): 
-                        if variables[i] in constraint.variables: sum += xStar[i]*constraint.variables[variables[i]]
-                    mustBeDeleted = (sum <= constraint.bound)
-                else:
-                    sum = 0
-                    for i in range(0,len(variables)): 
-                        if variables[i] in constraint.variables: sum += xStar[i]*constraint.variables[variables[i]]*-1
-                    mustBeDeleted = (sum < constraint.bound)
-                if not mustBeDeleted: finalConstraints.append(litteral)
-            else : finalConstraints.append(litteral)
+                if res[0] == OptimizationValues.OPTIMAL:
+                    # if the maximum values is <= bound we deleted the litteral
+                    if isinstance(constraint, NullaryFormula):
+                        sum = 0
+                        for i in range(0,len(variables)): 
+                            if variables[i] in constraint.variables: sum += xStar[i]*constraint.variables[variables[i]]
+                        mustBeDeleted = (sum <= constraint.bound)
+                    else:
+                        sum = 0
+                        for i in range(0,len(variables)): 
+                            if variables[i] in constraint.variables: sum += xStar[i]*constraint.variables[variables[i]]*-1
+                        mustBeDeleted = (sum < constraint.bound)
+                if not mustBeDeleted:
+                    finalConstraints.append(litteral)
+                    rowIds[litteral] = [model.addConstraint(*row) for row in self._toRows(litteral, e, variables)]
 
         return And(*finalConstraints)
@@ -57,23 +57,28 @@ class Daalmans(Simplificator):
         objectivFunction = [0] * (len(variablesToAnalyse) + 1)
         index = 0
         e = RealVariable("@")
-        tabPhi = self._toTab(phi, e)
         variables = variablesToAnalyse + [e]
+        tabPhi = self._toTab(phi, e, variables=variables)
         fixedVariables = {}
 
-        # For each variable x 
-        for variable in variablesToAnalyse:
-            # We will analyse the optimal value of the variable when we wants to maximize x and minimize x
-            objectivFunction[index] = 1
-            v1 = self.__solve(variables, objectivFunction, tabPhi)
-            objectivFunction[index] = -1
-            v2 = self.__solve(variables, objectivFunction, tabPhi)
-            objectivFunction[index] = 0
-            if v1[0] == OptimizationValues.OPTIMAL and v2[0] == OptimizationValues.OPTIMAL and v1[1][index] == v2[1][index] :
-                # If x can have only one value, it is a fixed variable
-                fixedVariables[variable] = Fraction(v1[1][index])
-
-            index += 1
+        # The same model is solved for every variable, only its objective changes
+        with self._solver.createModel(variables, objectivFunction, tabPhi) as model:
+
+            # For each variable x 
+            for variable in variablesToAnalyse:
+                # We will analyse the optimal value of the variable when we wants to maximize x and minimize x
+                objectivFunction[index] = 1
+                model.setObjective(objectivFunction)
+                v1 = model.solve(timeLimit=self._interpreter.getTimeLimit())
+                objectivFunction[index] = -1
+                model.setObjective(objectivFunction)
+                v2 = model.solve(timeLimit=self._interpreter.getTimeLimit())
+                objectivFunction[index] = 0
+                if v1[0] == OptimizationValues.OPTIMAL and v2[0] == OptimizationValues.OPTIMAL and v1[1][index] == v2[1][index] :
+                    # If x can have only one value, it is a fixed variable
+                    fixedVariables[variable] = Fraction(v1[1][index])
+
+                index += 1
         return self.__removeVariables(phi, fixedVariables)
 
     def __removeVariables(self, phi : Formula, fixedVariables : dict) -> Formula:
@@ -81,14 +86,18 @@ class Daalmans(Simplificator):
             newChildren = set()
             for litteral in phi.children:
                 try:
+                    # The litterals may be shared with other formulas, they are replaced by modified copies
                     if isinstance(litteral, Not) :
+                        litteral = Not(litteral.children.clone())
                         litteral.children.replace(variable, -fixedVariables[variable])
                     else:
+                        litteral = litteral.clone()
                         litteral.replace(variable, fixedVariables[variable])
                     newChildren.add(litteral)
                 except:
                     # If the constraint is now useless, we dont keep it in the children of the formula
                     pass
+            phi = phi.clone()
             phi.children = newChildren
             
             # We adding = constraint between x and his only possible value
@@ -102,7 +111,7 @@ class Daalmans(Simplificator):
 
     def __deleteConstraint(self, phi : Formula) -> Formula:
         actualConstraints : set
-        actualConstraints = phi.children.copy()
+        actualConstraints = set(phi.children)
         for constraint in phi.children:
             neg = ~constraint.clone()
             actualConstraints.remove(constraint)
@@ -114,8 +123,3 @@ class Daalmans(Simplificator):
             actualConstraints.remove(neg)
 
         return And(*actualConstraints)
-
-    
-    def __solve(self, variables, obj, constraints):
-        return self._solver.solve(variables, obj, constraints)
-
@@ -6,6 +6,7 @@ Abstract class, representing a simplificator of conjunction of litterals (i.e `o
 from __future__ import annotations
 
 from ..formula import Formula, ConstraintOperator
+from ..variable import VariableManager
 
 from abc import ABC, abstractmethod
 
@@ -19,23 +20,29 @@ class Simplificator(ABC):
         pass
 
     def _toTab(self, formula, e, variables : list = None):
-        constraints = []
         if variables == None : 
             variables = list(formula.getVariables())
             variables.append(e)
+        return self._toRows(formula, e, variables) + [self._eRow(e, variables)]
+
+    def _toRows(self, formula, e, variables : list):
+        columns = VariableManager.getColumns({variable: i for i, variable in enumerate(variables)})
+        constraints = []
         for lc in formula.getAdherence(e):
             for constraint in lc:
-                constraintP = []
-                for variable in variables:
-                    if variable in constraint.variables:
-                        constraintP.append(constraint.variables[variable])
-                    else:
-                        constraintP.append(0)
+                # The ids follow the order of the variables of the constraint, whose coefficients are used as they are
+                ids, _, _ = constraint.getArrays()
+                constraintP = [0] * len(variables)
+                for column, coefficient in zip(columns[ids].tolist(), constraint.variables.values()):
+                    constraintP[column] = coefficient
                 constraints.append((constraintP, constraint.operator, constraint.bound))
+        return constraints
+
+    def _eRow(self, e, variables : list):
         lastConstraint = []
         for variable in variables: 
             lastConstraint.append(-1 if variable == e else 0)
-        return constraints + [(lastConstraint, ConstraintOperator.LEQ, 0)]
+        return (lastConstraint, ConstraintOperator.LEQ, 0)
 
     @abstractmethod
     def run(self, phi: Formula) -> Formula:
@@ -0,0 +1,45 @@
+"""
+Time budget of a revision, shared by every optimization problem given to the `olaaaf.mlo_solver.MLOSolver.MLOSolver`.
+"""
+
+from __future__ import annotations
+
+import time
+
+class TimeBudget:
+    """
+    Time budget of a revision, shared by every optimization problem given to the `olaaaf.mlo_solver.MLOSolver.MLOSolver`.
+    The budget starts running at its creation.
+
+    Parameters
+    ----------
+    seconds : float
+        The time allowed, in seconds.
+    """
+
+    def __init__(self, seconds : float):
+        self.__deadline = time.perf_counter() + seconds
+
+    def getRemainingTime(self) -> float:
+        """
+        Method returning the time left in the budget.
+
+        Returns
+        -------
+        float
+            The time left, in seconds, or 0 if the budget is exhausted.
+        """
+
+        return max(self.__deadline - time.perf_counter(), 0)
+
+    def isExpired(self) -> bool:
+        """
+        Method used to know if the budget is exhausted.
+
+        Returns
+        -------
+        bool
+            `True` if there is no time left, `False` otherwise.
+        """
+
+        return time.perf_counter() >= self.__deadline
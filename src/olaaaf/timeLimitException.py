@@ -0,0 +1,6 @@
+class TimeLimitException(Exception):
+    """
+    Exception raised when the `olaaaf.timeBudget.TimeBudget` of a revision is exhausted, i.e. when the solver returned
+    `olaaaf.mlo_solver.optimizationValues.OptimizationValues.TIMEOUT`.
+    """
+    pass
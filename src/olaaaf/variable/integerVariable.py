@@ -25,6 +25,8 @@ class IntegerVariable(Variable):
 
     """
 
+    __slots__ = ()
+
     def isInteger(self) -> bool:
         """
         Method used to known if the variable must have intergers values.
@@ -24,6 +24,8 @@ class RealVariable(Variable):
         Fractions représenting respectively the lower and upper bounds of the variable. If not defined, it is considered as if the variable is unbounded.
 
     """
+
+    __slots__ = ()
     
     def isInteger(self) -> bool:
         """
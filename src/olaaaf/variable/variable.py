@@ -23,8 +23,11 @@ class Variable(ABC):
         Fractions représenting respectively the lower and upper bounds of the variable. If not defined, it is considered as if the variable is unbounded.
     """
     
+    # Weak references let olaaaf.variable.variableManager.VariableManager reuse the ids of the collected variables
+    __slots__ = ("name", "bounds", "__weakref__")
+
     #: Name of the variable, by which they are identified.
-    name : str = ""
+    name : str
 
     def __init__(self, name, lowerBound = None, upperBound = None):
         self.name = name
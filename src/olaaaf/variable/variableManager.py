@@ -7,7 +7,11 @@ from __future__ import annotations
 
 from .variable import Variable
 
+import heapq
+import numpy as np
 import re
+import threading
+import weakref
 
 class VariableManager:
     """
@@ -22,6 +26,15 @@ class VariableManager:
     
     instance = {}
     __namePatern = "^[a-zA-Z]([a-zA-Z0-9:_])*$"
+    # Id of each name, number of living variables holding it, and id of each living variable by its address
+    __ids = {}
+    __idCounts = {}
+    __objectIds = {}
+    # Ids given back by the names of collected variables, and names whose variables were collected since the last new id
+    __freeIds = []
+    __nextId = 0
+    __released = []
+    __idsLock = threading.Lock()
 
     @staticmethod
     def verify(name: str, cls: type[Variable]) -> None:
@@ -123,4 +136,88 @@ class VariableManager:
         """
         
         obj = cls.__new__(name)
-        return obj
\ No newline at end of file
+        return obj
+
+    @classmethod
+    def getId(cls, variable : Variable) -> int:
+        """
+        Function returning the id of a `olaaaf.variable.variable.Variable`, declared or anonymous.
+        Ids are dense integers given by name in order of first use, so that they can index arrays, as done by
+        `olaaaf.formula.nullaryFormula.constraint.linearConstraint.LinearConstraint.getArrays`.
+        Once every variable holding a name has been collected, as anonymous variables are, its id is given to the next new name,
+        so that the ids only go up to about the number of variables alive.
+
+        Parameters
+        ----------
+        variable: olaaaf.variable.variable.Variable
+            The `olaaaf.variable.variable.Variable` whose id is wanted.
+
+        Returns
+        -------
+        int
+            The id of the `olaaaf.variable.variable.Variable`.
+        """
+
+        entry = cls.__objectIds.get(id(variable))
+        if entry is not None:
+            return entry[0]
+
+        with cls.__idsLock:
+            entry = cls.__objectIds.get(id(variable))
+            if entry is not None:
+                return entry[0]
+
+            # Names are only released here, the callbacks of the weak references possibly running while the lock is held
+            while cls.__released:
+                name = cls.__released.pop()
+                count = cls.__idCounts[name] - 1
+                if count > 0:
+                    cls.__idCounts[name] = count
+                else:
+                    del cls.__idCounts[name]
+                    heapq.heappush(cls.__freeIds, cls.__ids.pop(name))
+
+            name = variable.name
+            variableId = cls.__ids.get(name)
+            if variableId is None:
+                if cls.__freeIds:
+                    variableId = heapq.heappop(cls.__freeIds)
+                else:
+                    variableId = cls.__nextId
+                    cls.__nextId += 1
+                cls.__ids[name] = variableId
+            cls.__idCounts[name] = cls.__idCounts.get(name, 0) + 1
+
+            # Copies of a variable, e.g. unpickled ones, share the id of their name until they have all been collected
+            address = id(variable)
+            cls.__objectIds[address] = (variableId, weakref.ref(variable, lambda _, address=address, name=name: cls.__release(address, name)))
+        return variableId
+
+    @classmethod
+    def __release(cls, address : int, name : str):
+        cls.__objectIds.pop(address, None)
+        cls.__released.append(name)
+
+    @classmethod
+    def getColumns(cls, columns : dict[Variable, int]) -> np.ndarray:
+        """
+        Function returning the columns of some `olaaaf.variable.variable.Variable` as an array indexed by their ids,
+        allowing to place the coefficients given by `olaaaf.formula.nullaryFormula.constraint.linearConstraint.LinearConstraint.getArrays`
+        in a row by slicing. The array only goes up to the largest id of these variables, whatever the number of variables declared,
+        the ids of collected variables being reused.
+
+        Parameters
+        ----------
+        columns: dictionary of int by olaaaf.variable.variable.Variable
+            The column of each `olaaaf.variable.variable.Variable`.
+
+        Returns
+        -------
+        numpy.ndarray
+            The column of each id up to the largest one of `columns`, or -1 for the ids of the variables not in `columns`.
+        """
+
+        ids = np.fromiter((cls.getId(variable) for variable in columns), dtype=np.intp, count=len(columns))
+        res = np.full(ids.max() + 1 if len(ids) > 0 else 0, -1, dtype=np.intp)
+        res[ids] = list(columns.values())
+        return res
@@ -0,0 +1,60 @@
+import unittest
+import random
+from olaaaf.formula import And, Or, Not, Implication, FormulaManager, ConstraintPool
+from olaaaf.formula.nullaryFormula import LinearConstraint
+from olaaaf.variable import RealVariable
+
+variables = [RealVariable.declare("cp_x"), RealVariable.declare("cp_y")]
+atoms = [LinearConstraint(f"{a}*cp_x + {b}*cp_y <= {c}") for a, b, c in [(1, 0, 1), (0, 1, 2), (1, 1, 3), (2, -1, 0), (-1, 3, 4)]]
+
+def randomFormula(rng : random.Random, depth : int):
+    if depth == 0 or rng.random() < 0.25:
+        atom = rng.choice(atoms)
+        return Not(atom) if rng.random() < 0.3 else atom
+    kind = rng.random()
+    if kind < 0.4:
+        return And(*[randomFormula(rng, depth - 1) for _ in range(rng.randint(2, 3))])
+    if kind < 0.8:
+        return Or(*[randomFormula(rng, depth - 1) for _ in range(rng.randint(2, 3))])
+    if kind < 0.9:
+        return Not(randomFormula(rng, depth - 1))
+    return Implication(randomFormula(rng, depth - 1), randomFormula(rng, depth - 1))
+
+def conjunctions(phi) -> set[frozenset]:
+    # The conjunctions of the Disjunctive Normal Form given by Formula.toDNF, as sets of interned litterals
+    dnf = phi.toDNF()
+    return {frozenset(FormulaManager.intern(litteral) for litteral in (conjunction.children if isinstance(conjunction, And) else [conjunction]))
+            for conjunction in (dnf.children if isinstance(dnf, Or) else [dnf])}
+
+class TestConstraintPool(unittest.TestCase):
+    def test_toDNF_matches_formula(self):
+        rng = random.Random(25)
+        for _ in range(100):
+            phi = randomFormula(rng, 3)
+            pool = ConstraintPool()
+            terms = pool.toDNF(phi)
+            self.assertEqual(len(terms), len(set(terms)), "A term of the Disjunctive Normal Form is repeated.")
+            self.assertEqual({frozenset(pool.getLitterals(term)) for term in terms}, conjunctions(phi),
+                             "The pool doesn't give the Disjunctive Normal Form of the formula.")
+
+    def test_materialize(self):
+        phi = And(atoms[0], Or(atoms[1], Not(atoms[2])), Or(atoms[1], And(atoms[0], atoms[3])))
+        pool = ConstraintPool()
+        terms = pool.toDNF(phi)
+
+        # Every litteral is stored once, whatever the number of terms using it
+        self.assertEqual(len(pool), 4)
+        self.assertEqual(set(map(frozenset, map(pool.getLitterals, terms))), conjunctions(phi))
+
+        other = ConstraintPool()
+        otherTerms = other.toDNF(phi.toDNF())
+        for term in terms:
+            conjunction = pool.materialize(term)
+            self.assertIsInstance(conjunction, And)
+            self.assertEqual(conjunction.children, frozenset(pool.getLitterals(term)))
+            self.assertIs(conjunction, pool.materialize(term))
+            # Interned conjunctions are shared by pools whose ids differ
+            self.assertIn(conjunction, [other.materialize(otherTerm) for otherTerm in otherTerms])
+            self.assertTrue(any(conjunction is other.materialize(otherTerm) for otherTerm in otherTerms))
+
+if __name__ == '__main__': unittest.main()
@@ -0,0 +1,60 @@
+import unittest
+from fractions import Fraction
+from olaaaf.formula import And, Or, Not, FormulaManager
+from olaaaf.formula.nullaryFormula import LinearConstraint
+from olaaaf.variable import RealVariable
+
+x = RealVariable.declare("fm_x")
+y = RealVariable.declare("fm_y")
+
+class TestFormulaManager(unittest.TestCase):
+    def test_intern_identity(self):
+        # Structurally equal formulas, up to a positive factor and the order of the children, share one instance
+        a = FormulaManager.intern(LinearConstraint("fm_x + fm_y <= 2"))
+        b = FormulaManager.intern(LinearConstraint("2*fm_y + 2*fm_x <= 4"))
+        self.assertIs(a, b)
+
+        phi = FormulaManager.intern(And(LinearConstraint("fm_x <= 1"), Not(LinearConstraint("fm_y >= 3"))))
+        psi = FormulaManager.intern(And(Not(LinearConstraint("- fm_y <= -3")), LinearConstraint("3*fm_x <= 3")))
+        self.assertIs(phi, psi)
+        self.assertIs(FormulaManager.intern(phi), phi)
+        self.assertIsNot(phi, FormulaManager.intern(And(LinearConstraint("fm_x <= 1"), LinearConstraint("fm_y >= 3"))))
+
+    def test_intern_dedup(self):
+        conjunctions = [FormulaManager.intern(And(LinearConstraint(f"fm_x <= {i % 3}"), LinearConstraint(f"{i % 3 + 1}*fm_y >= 0"))) for i in range(9)]
+        self.assertEqual(len(set(conjunctions)), 3)
+        self.assertEqual(len(set(map(id, conjunctions))), 3)
+
+        phi = FormulaManager.intern(Or(*conjunctions))
+        self.assertEqual(len(phi.children), 3)
+        self.assertIsInstance(phi.children, frozenset)
+
+    def test_intern_immutable(self):
+        a = LinearConstraint("fm_x - fm_y <= 2")
+        canonical = FormulaManager.intern(a)
+        phi = FormulaManager.intern(And(a, LinearConstraint("fm_y <= 0")))
+
+        # Modifying an interned formula would change its hash while it is shared
+        with self.assertRaises(AttributeError):
+            canonical.bound = Fraction(3)
+        with self.assertRaises(AttributeError):
+            canonical.variables = {x: Fraction(1)}
+        with self.assertRaises(TypeError):
+            canonical.variables[x] = Fraction(2)
+        with self.assertRaises(TypeError):
+            del canonical.variables[y]
+        with self.assertRaises(AttributeError):
+            phi.children = frozenset()
+        self.assertEqual(canonical.bound, 2)
+
+        # A clone can be modified, its hash and equality following it
+        clone = canonical.clone()
+        self.assertEqual(clone, canonical)
+        self.assertEqual(hash(clone), hash(canonical))
+        clone.bound = Fraction(3)
+        self.assertNotEqual(clone, canonical)
+        self.assertEqual(clone, LinearConstraint("fm_x - fm_y <= 3"))
+        self.assertEqual(hash(clone), hash(LinearConstraint("fm_x - fm_y <= 3")))
+        self.assertIsNot(FormulaManager.intern(clone), canonical)
+
+if __name__ == '__main__': unittest.main()
@@ -0,0 +1,116 @@
+import unittest
+import gc
+import pickle
+from fractions import Fraction
+from olaaaf.formula.nullaryFormula import LinearConstraint
+from olaaaf.formula.nullaryFormula.constraint.constraintOperator import ConstraintOperator
+from olaaaf.variable import RealVariable, VariableManager
+
+x = RealVariable.declare("lc_x")
+y = RealVariable.declare("lc_y")
+
+def assertSame(test : unittest.TestCase, a : LinearConstraint, b : LinearConstraint):
+    test.assertEqual(a.canonicalKey(), b.canonicalKey())
+    test.assertEqual(a, b)
+    test.assertEqual(hash(a), hash(b))
+
+class TestLinearConstraint(unittest.TestCase):
+    def test_normalization(self):
+        # Equal up to a positive factor and to the operator
+        assertSame(self, LinearConstraint("2*lc_x <= 4"), LinearConstraint("lc_x <= 2"))
+        assertSame(self, LinearConstraint("- lc_x >= -2"), LinearConstraint("lc_x <= 2"))
+        assertSame(self, LinearConstraint("1/2*lc_x + 1/3*lc_y <= 1"), LinearConstraint("3*lc_x + 2*lc_y <= 6"))
+        assertSame(self, LinearConstraint("lc_y + lc_x <= 1"), LinearConstraint("lc_x + lc_y <= 1"))
+        self.assertEqual(LinearConstraint("4*lc_x - 6*lc_y <= 2").canonicalKey(),
+                         ((("lc_x", Fraction(2)), ("lc_y", Fraction(-3))), ConstraintOperator.LEQ, Fraction(1)))
+
+        # A negative factor changes the direction of an inequality
+        self.assertNotEqual(LinearConstraint("- 2*lc_x <= -4"), LinearConstraint("lc_x <= 2"))
+        self.assertNotEqual(LinearConstraint("lc_x <= 2"), LinearConstraint("lc_x <= 3"))
+        self.assertNotEqual(LinearConstraint("lc_x <= 2"), LinearConstraint("lc_x = 2"))
+
+    def test_equality_sign(self):
+        # The first coefficient of an equality is positive, whatever its sign was
+        assertSame(self, LinearConstraint("- lc_x - lc_y = -3"), LinearConstraint("lc_x + lc_y = 3"))
+        assertSame(self, LinearConstraint("lc_y - lc_x = -1"), LinearConstraint("2*lc_x - 2*lc_y = 2"))
+        self.assertNotEqual(LinearConstraint("lc_y - lc_x = 1"), LinearConstraint("lc_x - lc_y = 1"))
+        self.assertEqual(LinearConstraint("- 2*lc_x = 4").canonicalKey(), ((("lc_x", Fraction(1)),), ConstraintOperator.EQ, Fraction(-2)))
+
+    def test_zero_coefficients(self):
+        lc = LinearConstraint("")
+        lc.variables = {x: Fraction(2), y: Fraction(0)}
+        lc.operator = ConstraintOperator.LEQ
+        lc.bound = Fraction(4)
+        assertSame(self, lc, LinearConstraint("lc_x <= 2"))
+
+    def test_invalidation(self):
+        lc = LinearConstraint("lc_x + 2*lc_y <= 4")
+        hash(lc)
+        lc.getArrays()
+
+        # Replacing a variable by its value
+        lc.replace(y, Fraction(1))
+        assertSame(self, lc, LinearConstraint("lc_x <= 2"))
+        ids, numerators, denominator = lc.getArrays()
+        self.assertEqual(list(ids), [VariableManager.getId(x)])
+        self.assertEqual(list(numerators), [1])
+
+        # Modifying the variables in place
+        lc.variables[y] = Fraction(1, 2)
+        assertSame(self, lc, LinearConstraint("2*lc_x + lc_y <= 4"))
+        ids, numerators, denominator = lc.getArrays()
+        self.assertEqual(dict(zip(ids, numerators)), {VariableManager.getId(x): 2, VariableManager.getId(y): 1})
+        self.assertEqual(denominator, 2)
+
+        # Replacing the variables, the operator or the bound
+        lc.variables = {y: Fraction(3)}
+        assertSame(self, lc, LinearConstraint("lc_y <= 2/3"))
+        self.assertEqual(list(lc.getArrays()[0]), [VariableManager.getId(y)])
+        lc.operator = ConstraintOperator.GEQ
+        assertSame(self, lc, LinearConstraint("- lc_y <= -2/3"))
+        lc.bound = Fraction(1)
+        assertSame(self, lc, LinearConstraint("lc_y >= 1/3"))
+
+    def test_columns(self):
+        # The columns only go up to the largest id of the variables given, however many variables have an id
+        VariableManager.getId(x), VariableManager.getId(y)
+        for i in range(50):
+            VariableManager.getId(RealVariable.declare(f"lc_many{i}"))
+        columns = VariableManager.getColumns({y: 0, x: 1})
+        self.assertEqual(len(columns), max(VariableManager.getId(x), VariableManager.getId(y)) + 1)
+
+        lc = LinearConstraint("3*lc_x - 1/2*lc_y <= 1")
+        ids, numerators, denominator = lc.getArrays()
+        row = [0, 0]
+        for column, numerator in zip(columns[ids], numerators):
+            row[column] = Fraction(numerator, denominator)
+        self.assertEqual(row, [Fraction(-1, 2), Fraction(3)])
+
+    def test_reused_ids(self):
+        # The ids of collected anonymous variables are given again, so that the columns don't grow with the variables ever declared
+        VariableManager.getId(x), VariableManager.getId(y)
+        ids = set()
+        for _ in range(200):
+            lc = LinearConstraint("")
+            lc.variables = {RealVariable.declareAnonymous("lc_temporary"): Fraction(1), x: Fraction(1)}
+            lc.operator = ConstraintOperator.LEQ
+            lc.bound = Fraction(1)
+            ids.update(lc.getArrays()[0])
+        del lc
+        gc.collect()
+        self.assertLess(len(ids), 10, "Ids of collected variables are not reused.")
+
+        anonymous = RealVariable.declareAnonymous("lc_kept")
+        self.assertLess(len(VariableManager.getColumns({anonymous: 0, x: 1})), 200, "Columns grow with the collected variables.")
+
+        # A copy of a variable keeps the id of its name once the original is collected
+        copy = pickle.loads(pickle.dumps(anonymous))
+        anonymousId = VariableManager.getId(anonymous)
+        self.assertEqual(VariableManager.getId(copy), anonymousId)
+        del anonymous
+        gc.collect()
+        others = [RealVariable.declareAnonymous("lc_other") for _ in range(10)]
+        self.assertNotIn(anonymousId, [VariableManager.getId(other) for other in others], "Id of a living copy was given to another variable.")
+        self.assertEqual(VariableManager.getId(copy), anonymousId)
+
+if __name__ == '__main__': unittest.main()
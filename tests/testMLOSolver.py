@@ -4,7 +4,15 @@ from olaaaf.variable import RealVariable
 from olaaaf.variable import IntegerVariable
 from olaaaf.formula.nullaryFormula.constraint import ConstraintOperator
 from olaaaf.mlo_solver import OptimizationValues
+from olaaaf.mlo_solver import CachedMLOSolver
+from olaaaf.mlo_solver.decimalRounding import roundDecimals, snapToMultiple
 from fractions import Fraction
+import numpy as np
+from scipy.sparse import coo_array
+import importlib.util
+import pickle
+import sys
+from concurrent.futures import ThreadPoolExecutor
 
 class TestMLOSolver(unittest.TestCase):
     global solver
@@ -55,8 +63,287 @@ class TestMLOSolver(unittest.TestCase):
             ]
         res = solver.solve([x,y,z], objectif, constraints)
         self.assertEqual(res[0], OptimizationValues.INFEASIBLE, "Optimization of an infeasible problem is not detected.")
+        self.assertFalse(solver.isFeasible([x,y,z], constraints), "Infeasibility of an infeasible problem is not detected.")
+        self.assertTrue(solver.isFeasible([x,y,z], constraints[:2]), "Feasibility of a feasible problem is not detected.")
 
 
+    def test_farmer_sparse(self):
+        corn = IntegerVariable.declareAnonymous()
+        oat = IntegerVariable.declareAnonymous()
+        objectif = [-40,-30]
+        matrix = ([0,0,1,1,2,3], [0,1,0,1,0,1], [2,1,1,1,-1,-1])
+        operators = [ConstraintOperator.LEQ] * 4
+        bounds = [320, 240, 0, 0]
+        res = solver.solveSparse([corn,oat], objectif, matrix, operators, bounds)
+        self.assertEqual(res[0], OptimizationValues.OPTIMAL, "Sparse optimization of farmer problem is not correct.")
+        self.assertEqual(res[1][0], 80, "Sparse optimization of farmer problem is not correct. (corn value is not 80)")
+        self.assertEqual(res[1][1], 160, "Sparse optimization of farmer problem is not correct. (oat value is not 160)")
+        self.assertEqual(res[2], -8000, "Sparse optimization of farmer problem is not correct.")
+
+    def test_farmer_model(self):
+        corn = IntegerVariable.declareAnonymous()
+        oat = IntegerVariable.declareAnonymous()
+        constraints = [
+            ([2,1], ConstraintOperator.LEQ, 320), 
+            ([-1,0], ConstraintOperator.LEQ, 0), 
+            ([0,-1], ConstraintOperator.LEQ, 0)
+            ]
+        with solver.createModel([corn,oat], [-40,-30], constraints) as model:
+            constraintId = model.addConstraint([1,1], ConstraintOperator.LEQ, 240)
+            res = model.solve()
+            self.assertEqual(res[0], OptimizationValues.OPTIMAL, "Optimization of farmer model is not correct.")
+            self.assertEqual(res[2], -8000, "Optimization of farmer model is not correct.")
+
+            model.removeConstraint(constraintId)
+            model.setObjective([-40,0])
+            res = model.solve()
+            self.assertEqual(res[1][0], 160, "Optimization of modified farmer model is not correct. (corn value is not 160)")
+            self.assertEqual(res[2], -6400, "Optimization of modified farmer model is not correct.")
+
+            model.setBounds(0, 0, 100)
+            res = model.solve()
+            self.assertEqual(res[2], -4000, "Optimization of farmer model with new bounds is not correct.")
+
+    def test_model_bounds(self):
+        self.__checkModelBounds(solver)
+
+    @unittest.skipUnless(importlib.util.find_spec("lpsolve55"), "lp_solve 5.5 is not installed")
+    def test_model_bounds_lpsolve(self):
+        from olaaaf.mlo_solver import LPSolver
+        self.__checkModelBounds(LPSolver())
+
+    def __checkModelBounds(self, mloSolver):
+        x = RealVariable.declareAnonymous()
+        y = IntegerVariable.declareAnonymous(lowerBound=Fraction(0))
+        with mloSolver.createModel([x,y], [1,1], [([-1,1], ConstraintOperator.GEQ, -10)]) as model:
+            self.assertEqual(model.solve()[0], OptimizationValues.UNBOUNDED, "Optimization of unbounded model is not correct.")
+
+            # A null lower bound isn't a missing one
+            model.setBounds(0, 0, None)
+            res = model.solve()
+            self.assertEqual(res[0], OptimizationValues.OPTIMAL, "Optimization of model with a null lower bound is not correct.")
+            self.assertEqual(res[2], 0, "Optimization of model with a null lower bound is not correct.")
+
+            model.setBounds(1, 2, 5)
+            res = model.solve()
+            self.assertEqual(res[1][1], 2, "Optimization of model with new bounds is not correct. (y value is not 2)")
+            self.assertEqual(res[2], 2, "Optimization of model with new bounds is not correct.")
+
+            if hasattr(model, "_variables"):
+                self.assertEqual(model._variables[1], y, "Variable with new bounds is not the same variable anymore.")
+
+    def test_farmer_cached(self):
+        corn = IntegerVariable.declareAnonymous()
+        oat = IntegerVariable.declareAnonymous()
+        cachedSolver = CachedMLOSolver(solver, maxSize=1)
+        constraints = [
+            ([2,1], ConstraintOperator.LEQ, 320), 
+            ([1,1], ConstraintOperator.LEQ, 240), 
+            ([-1,0], ConstraintOperator.LEQ, 0), 
+            ([0,-1], ConstraintOperator.LEQ, 0)
+            ]
+        res = cachedSolver.solve([corn,oat], [-40,-30], constraints)
+        self.assertEqual(res[2], -8000, "Cached optimization of farmer problem is not correct.")
+
+        # Same problem, with the variables and constraints in another order
+        permuted = [([weights[1], weights[0]], operator, bound) for weights, operator, bound in reversed(constraints)]
+        res = cachedSolver.solve([oat,corn], [-30,-40], permuted)
+        self.assertEqual((cachedSolver.hits, cachedSolver.misses), (1, 1), "Permuted farmer problem was not found in the cache.")
+        self.assertEqual(res[1][0], 160, "Cached optimization of farmer problem is not correct. (oat value is not 160)")
+        self.assertEqual(res[1][1], 80, "Cached optimization of farmer problem is not correct. (corn value is not 80)")
+
+        res = cachedSolver.solveSparse([corn,oat], [-40,0], ([0,0,1,1,2,3], [0,1,0,1,0,1], [2,1,1,1,-1,-1]), [ConstraintOperator.LEQ] * 4, [320, 240, 0, 0])
+        res = cachedSolver.solve([corn,oat], [-40,-30], constraints)
+        self.assertEqual((cachedSolver.hits, cachedSolver.misses), (1, 3), "Least recently used result was not evicted.")
+        self.assertEqual(res[2], -8000, "Cached optimization of farmer problem is not correct.")
+
+    def test_farmer_cached_threads(self):
+        corn = IntegerVariable.declareAnonymous()
+        oat = IntegerVariable.declareAnonymous()
+        cachedSolver = CachedMLOSolver(solver, maxSize=2)
+        constraints = [
+            ([2,1], ConstraintOperator.LEQ, 320), 
+            ([1,1], ConstraintOperator.LEQ, 240), 
+            ([-1,0], ConstraintOperator.LEQ, 0), 
+            ([0,-1], ConstraintOperator.LEQ, 0)
+            ]
+        problems = [([corn,oat], [-40,-i], constraints) for i in range(4)] * 100
+
+        # Threads are switched as often as possible, so that they meet inside the cache
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                res = list(executor.map(lambda problem: cachedSolver.solve(*problem), problems))
+        finally:
+            sys.setswitchinterval(interval)
+
+        self.assertEqual([r[2] for r in res], [solver.solve(*problem)[2] for problem in problems], "Threaded cached optimization of farmer problems is not correct.")
+        self.assertEqual(cachedSolver.hits + cachedSolver.misses, len(problems), "Cache counters lost some problems.")
+
+        # Each copy of the solver sent to another process gets its own lock
+        copy = pickle.loads(pickle.dumps(cachedSolver))
+        self.assertEqual(copy.solve(*problems[0])[2], res[0][2], "Copied cached solver is not correct.")
+
+    def test_farmer_cutoff(self):
+        self.__checkCutoff(solver)
+
+    @unittest.skipUnless(importlib.util.find_spec("lpsolve55"), "lp_solve 5.5 is not installed")
+    def test_farmer_cutoff_lpsolve(self):
+        from olaaaf.mlo_solver import LPSolverRounded
+        self.__checkCutoff(LPSolverRounded())
+
+    def __checkCutoff(self, mloSolver):
+        corn = IntegerVariable.declareAnonymous()
+        oat = IntegerVariable.declareAnonymous()
+        constraints = [
+            ([2,1], ConstraintOperator.LEQ, 320), 
+            ([1,1], ConstraintOperator.LEQ, 240), 
+            ([-1,0], ConstraintOperator.LEQ, 0), 
+            ([0,-1], ConstraintOperator.LEQ, 0)
+            ]
+        res = mloSolver.solve([corn,oat], [40,30], constraints, cutoff=0)
+        self.assertEqual(res[0], OptimizationValues.OPTIMAL, "Optimal value equal to the cutoff is not kept.")
+        self.assertEqual(res[2], 0, "Optimization of farmer problem with a cutoff is not correct.")
+
+        res = mloSolver.solve([corn,oat], [-40,-30], constraints, cutoff=-8001)
+        self.assertEqual(res[0], OptimizationValues.INFEASIBLE, "Cutoff below the optimal value is not detected.")
+
+        # Problems pruned by their cutoff are given back without rounding their optimal value
+        res = mloSolver.solve([corn,oat], [40,30], [([1,1], ConstraintOperator.GEQ, 1)] + constraints, cutoff=Fraction(1,2))
+        self.assertEqual(res[0], OptimizationValues.INFEASIBLE, "Cutoff below the optimal value is not detected.")
+
+    def test_farmer_time_limit(self):
+        corn = IntegerVariable.declareAnonymous()
+        oat = IntegerVariable.declareAnonymous()
+        constraints = [
+            ([2,1], ConstraintOperator.LEQ, 320), 
+            ([1,1], ConstraintOperator.LEQ, 240), 
+            ([-1,0], ConstraintOperator.LEQ, 0), 
+            ([0,-1], ConstraintOperator.LEQ, 0)
+            ]
+        res = solver.solve([corn,oat], [-40,-30], constraints, timeLimit=60)
+        self.assertEqual(res[0], OptimizationValues.OPTIMAL, "Optimization of farmer problem with a time limit is not correct.")
+        self.assertEqual(res[2], -8000, "Optimization of farmer problem with a time limit is not correct.")
+
+    def test_farmer_arrays(self):
+        A = np.array([[2,1], [1,1]])
+        for mloSolver in [solver, CachedMLOSolver(solver)]:
+            res = mloSolver.solveArrays(np.array([-40.,-30.]), A, np.array([-np.inf,-np.inf]), np.array([320.,240.]),
+                                        np.zeros(2), np.array([np.inf,np.inf]), np.ones(2))
+            self.assertEqual(res[0], OptimizationValues.OPTIMAL, "Array optimization of farmer problem is not correct.")
+            self.assertTrue(np.allclose(res[1], [80,160]), "Array optimization of farmer problem is not correct.")
+            self.assertAlmostEqual(res[2], -8000, 7, "Array optimization of farmer problem is not correct.")
+
+    def test_farmer_arrays_exact(self):
+        A = coo_array((np.array([2.,1.,1.,1.]), (np.array([0,0,1,1], dtype=np.int64), np.array([0,1,0,1], dtype=np.int64))), shape=(2,2))
+        cached = CachedMLOSolver(solver)
+        for mloSolver in [solver, cached, cached]:
+            res = mloSolver.solveArrays(np.array([-40.,-30.]), A, np.array([-np.inf,-np.inf]), np.array([320.,240.]),
+                                        np.zeros(2), np.array([np.inf,np.inf]), np.ones(2), exact=True)
+            self.assertEqual(res[0], OptimizationValues.OPTIMAL, "Exact array optimization of farmer problem is not correct.")
+            self.assertEqual(res[1], [80,160], "Exact array optimization of farmer problem is not correct.")
+            self.assertEqual(res[2], -8000, "Exact array optimization of farmer problem is not correct.")
+        self.assertEqual(cached.hits, 1, "Array problem was not found in the cache.")
+
+    def test_farmer_arrays_cached(self):
+        # Array problems are given as they are to the decorated solver, without going through its other methods
+        calls = []
+        class ArraySolver(ScipySolverRounded):
+            def solveArrays(self, *args, **kwargs):
+                calls.append("solveArrays")
+                return super().solveArrays(*args, **kwargs)
+            def solveSparse(self, *args, **kwargs):
+                calls.append("solveSparse")
+                return super().solveSparse(*args, **kwargs)
+
+        cached = CachedMLOSolver(ArraySolver())
+        problem = (np.array([-40.,-30.]), np.array([[2,1], [1,1]]), np.array([-np.inf,-np.inf]), np.array([320.,240.]),
+                   np.zeros(2), np.array([np.inf,np.inf]), np.ones(2))
+        res = cached.solveArrays(*problem)
+        res[1][0] = 0
+        again = cached.solveArrays(*[np.array(array) for array in problem])
+        self.assertEqual(calls, ["solveArrays"], "Array problem was not given as it is to the decorated solver.")
+        self.assertEqual((cached.hits, cached.misses), (1, 1), "Array problem was not found in the cache.")
+        self.assertTrue(np.allclose(again[1], [80,160]), "Cached array optimization of farmer problem is not correct.")
+        self.assertAlmostEqual(again[2], -8000, 7, "Cached array optimization of farmer problem is not correct.")
+
+        # Any change of the arrays is another problem
+        cached.solveArrays(problem[0], problem[1], problem[2], np.array([320.,239.]), *problem[4:])
+        cached.solveArrays(*problem, exact=True)
+        cached.solveArrays(*problem, cutoff=-7000)
+        self.assertEqual((cached.hits, cached.misses), (1, 4), "Different array problems share their result.")
+
+    def test_farmer_feasible_arrays(self):
+        # The feasibility of cached problems is asked to the decorated solver's own feasibility check
+        calls = []
+        class FeasibilitySolver(ScipySolverRounded):
+            def isFeasibleArrays(self, *args, **kwargs):
+                calls.append("isFeasibleArrays")
+                return super().isFeasibleArrays(*args, **kwargs)
+
+        A = coo_array((np.array([2.,1.,1.,1.]), (np.array([0,0,1,1], dtype=np.int64), np.array([0,1,0,1], dtype=np.int64))), shape=(2,2))
+        cached = CachedMLOSolver(FeasibilitySolver())
+        for mloSolver in [solver, cached, cached]:
+            res = mloSolver.isFeasibleArrays(A, np.array([300.,-np.inf]), np.array([320.,240.]), np.zeros(2), np.array([np.inf,np.inf]), np.ones(2))
+            self.assertEqual(res[0], OptimizationValues.OPTIMAL, "Feasible farmer problem is not found feasible.")
+            self.assertTrue(300 - 1e-6 <= 2 * res[1][0] + res[1][1] <= 320 + 1e-6 and res[1][0] + res[1][1] <= 240 + 1e-6,
+                            "The point of a feasible farmer problem doesn't satisfy its constraints.")
+
+            res = mloSolver.isFeasibleArrays(A, np.array([300.,-np.inf]), np.array([320.,100.]), np.zeros(2), np.array([np.inf,np.inf]), np.ones(2),
+                                             exact=True)
+            self.assertEqual(res[0], OptimizationValues.INFEASIBLE, "Infeasible farmer problem is not found infeasible.")
+        self.assertEqual(calls, ["isFeasibleArrays"] * 2, "Feasibility of cached problems is not asked to the decorated solver.")
+        self.assertEqual((cached.hits, cached.misses), (2, 2), "Feasibility problems were not found in the cache.")
+
+    def test_rounding(self):
+        values = [0.1, 1/3, -2.5e-12, 1.5e-12, 123.4565, 1e20, -0.0, 2**-40]
+        self.assertEqual(roundDecimals(values, 12), [round(Fraction(x), 12) for x in values], "Vectorized rounding is not exact.")
+
+    def test_snapping(self):
+        # Tolerance of epsilon / 100 for large distances, as the ones of the examples, and relative to the distance for small ones
+        tiny = Fraction(1, 10**15)
+        for step, nearest, tolerance in ((Fraction(1, 10**4), Fraction(9743), Fraction(1, 10**6)),
+                                         (Fraction(1), Fraction(5), Fraction(5, 10**8)),
+                                         (Fraction(1, 2), Fraction(0), Fraction(1, 10**8)),
+                                         (Fraction(1, 10**4), Fraction(-9743), Fraction(1, 10**6))):
+            for sign in (1, -1):
+                self.assertEqual(snapToMultiple(nearest + sign * (tolerance - tiny), step), nearest, "A distance within the tolerance is not snapped.")
+                self.assertEqual(snapToMultiple(nearest + sign * tolerance, step), nearest, "A distance at the tolerance is not snapped.")
+                self.assertEqual(snapToMultiple(nearest + sign * (tolerance + tiny), step), nearest + sign * (tolerance + tiny),
+                                 "A distance beyond the tolerance is snapped.")
+
+        # HiGHS' error on the distance of the kiwi milkshake example
+        self.assertEqual(snapToMultiple(Fraction(9742.99999975), Fraction(1, 10**4)), 9743)
+
+    def test_farmer_many(self):
+        corn = IntegerVariable.declareAnonymous()
+        oat = IntegerVariable.declareAnonymous()
+        constraints = [
+            ([2,1], ConstraintOperator.LEQ, 320), 
+            ([1,1], ConstraintOperator.LEQ, 240), 
+            ([-1,0], ConstraintOperator.LEQ, 0), 
+            ([0,-1], ConstraintOperator.LEQ, 0)
+            ]
+        problems = [([corn,oat], [-40,-i], constraints) for i in range(50)]
+        try:
+            res = solver.solveMany(problems, workers=2)
+        finally:
+            solver.shutdown()
+        self.assertEqual([r[2] for r in res], [solver.solve(*problem)[2] for problem in problems], "Parallel optimization of farmer problems is not correct.")
+
+    def test_farmer_many_sparse(self):
+        corn = IntegerVariable.declareAnonymous()
+        oat = IntegerVariable.declareAnonymous()
+        matrix = ([0, 0, 1, 1, 2, 3], [0, 1, 0, 1, 0, 1], [2, 1, 1, 1, -1, -1])
+        operators = [ConstraintOperator.LEQ] * 4
+        problems = [([corn,oat], [-40,-i], matrix, operators, [320, 240, 0, 0]) for i in range(50)]
+        try:
+            res = solver.solveMany(problems, workers=2, method="solveSparse")
+        finally:
+            solver.shutdown()
+        self.assertEqual([r[2] for r in res], [solver.solveSparse(*problem)[2] for problem in problems], "Parallel optimization of sparse farmer problems is not correct.")
+
 # Put your mlo solver here to test it
 solver = ScipySolverRounded()
 if __name__ == '__main__': 
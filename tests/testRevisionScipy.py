@@ -0,0 +1,182 @@
+import unittest
+import random
+from olaaaf.variable import RealVariable
+from olaaaf.variable import IntegerVariable
+from fractions import Fraction
+from olaaaf.formula import And, Or, Not
+from olaaaf.formula.nullaryFormula import LinearConstraint
+from olaaaf.mlo_solver import ScipySolverRounded
+from olaaaf.mlo_solver import CachedMLOSolver
+from olaaaf.simplificator import Daalmans
+from olaaaf.projector import FloatConvexHullProjector
+from olaaaf.revision import Revision
+from olaaaf.formulaInterpreter import FormulaInterpreter
+from olaaaf.distance import DiscreteL1DistanceFunction
+
+
+class TestRevisionScipy(unittest.TestCase):
+
+    def setUp(self):
+        self.variables = [RealVariable.declare("rs_x", lowerBound=Fraction(-20), upperBound=Fraction(20)),
+                          IntegerVariable.declare("rs_n", lowerBound=Fraction(-20), upperBound=Fraction(20)),
+                          RealVariable.declare("rs_y", lowerBound=Fraction(-20), upperBound=Fraction(20))]
+        self.weights = {variable: Fraction(1) for variable in self.variables}
+        # Each test draws its own random formulas, the same from one run to another
+        self.rng = random.Random(self.id())
+
+    def randomConjunction(self) -> And:
+        # Conjunctions lie around a random center, so that many of them are far apart
+        litterals = []
+        for variable in self.variables:
+            center = self.rng.randint(-15, 15)
+            litterals.append(LinearConstraint(f"{variable.name} >= {center - self.rng.randint(1, 3)}"))
+            litterals.append(LinearConstraint(f"{variable.name} <= {center + self.rng.randint(1, 3)}"))
+        terms = " + ".join(f"{self.rng.choice([-2, -1, 1, 3])}*{variable.name}" for variable in self.rng.sample(self.variables, self.rng.randint(1, 2)))
+        lc = LinearConstraint(f"{terms} {self.rng.choice(['<=', '>='])} {self.rng.randint(-8, 8)}")
+        litterals.append(Not(lc) if self.rng.random() < 0.3 else lc)
+        return And(*litterals).toLessOrEqConstraint()
+
+    def randomProblem(self, size : int) -> tuple[list[And], list[And], dict]:
+        # Conjunctions of psi and mu, with random weights
+        return ([self.randomConjunction() for _ in range(size)], [self.randomConjunction() for _ in range(size)],
+                {variable: Fraction(self.rng.randint(1, 2)) for variable in self.variables})
+
+    def revise(self, psi, mu, weights, **kwargs):
+        # Result of the revision, or the error raised when no combination gives one
+        rev = Revision(ScipySolverRounded(), DiscreteL1DistanceFunction(weights, epsilon=Fraction(1)), onlyOneSolution=True, verbose=False)
+        rev.preload()
+        try:
+            return rev.execute(psi, mu, **kwargs)
+        except AttributeError as e:
+            return str(e)
+
+    def test_boxes_keep_optimal_pairs(self):
+        for _ in range(6):
+            psi, mu, weights = self.randomProblem(4)
+
+            # Each combination revised on its own can't be discarded by the others
+            distances = [res[0] for res in (self.revise(miniPsi, miniMu, weights) for miniPsi in psi for miniMu in mu) if not isinstance(res, str)]
+            if len(distances) == 0:
+                continue
+
+            for withMaxDist in (True, False):
+                self.assertEqual(self.revise(Or(*psi), Or(*mu), weights, withMaxDist=withMaxDist)[0], min(distances),
+                                 "An optimal combination was discarded by its bounding boxes.")
+
+    def test_rejected_best_pair(self):
+        # The closest conjunction of mu has no model at a multiple of epsilon, the farther one must still be revised
+        interpreter = FormulaInterpreter(ScipySolverRounded(), DiscreteL1DistanceFunction(self.weights))
+        psi = LinearConstraint("rs_x <= 0") & LinearConstraint("rs_x >= 0")
+        mu = (Not(LinearConstraint("rs_x <= 0")) & LinearConstraint("rs_x <= 1/2")) | (LinearConstraint("rs_x >= 5") & LinearConstraint("rs_x <= 6"))
+        for withMaxDist in (True, False):
+            for workers in (1, 2):
+                dStar, point = self.revise(psi, mu, self.weights, withMaxDist=withMaxDist, workers=workers)
+                self.assertEqual(dStar, 5, "The revision doesn't go on once its closest combination is rejected.")
+                self.assertTrue(interpreter.sat(point & LinearConstraint("rs_x = 5")), "The point of the revision is not correct.")
+
+    def test_sat_feasibility(self):
+        # Conjunctions without strict inequalities are only checked for feasibility
+        calls = []
+        class FeasibilitySolver(ScipySolverRounded):
+            def isFeasibleArrays(self, *args, **kwargs):
+                calls.append("isFeasibleArrays")
+                return super().isFeasibleArrays(*args, **kwargs)
+
+        x, y = self.variables[0], self.variables[2]
+        interpreter = FormulaInterpreter(FeasibilitySolver(), DiscreteL1DistanceFunction({x: Fraction(1), y: Fraction(0)}))
+        self.assertTrue(interpreter.sat(LinearConstraint("rs_x >= 1") & LinearConstraint("rs_x + rs_y <= 2")))
+        self.assertFalse(interpreter.sat(LinearConstraint("rs_x >= 3") & LinearConstraint("rs_x <= 2")))
+        self.assertEqual(len(calls), 2, "Conjunctions without strict inequalities are not checked with isFeasibleArrays.")
+
+        self.assertFalse(interpreter.sat(Not(LinearConstraint("rs_x <= 2")) & LinearConstraint("rs_x <= 2")))
+        self.assertTrue(interpreter.sat(Not(LinearConstraint("rs_x <= 1")) & LinearConstraint("rs_x <= 2")))
+        self.assertEqual(len(calls), 2, "Strict inequalities can't be checked without epsilon.")
+
+        # The block of rs_y has a null weight, any of its points is at a null distance
+        calls.clear()
+        psi = LinearConstraint("rs_x <= 0") & LinearConstraint("rs_y <= 0")
+        mu = LinearConstraint("rs_x >= 2") & LinearConstraint("rs_y >= 3")
+        dStar, point = interpreter.findOneSolution([x, y], psi, mu, None)
+        self.assertEqual(calls, ["isFeasibleArrays"], "Blocks at a null distance are not only checked for feasibility.")
+        self.assertEqual(dStar, 2, "The distance of the couple is not correct.")
+        self.assertTrue(interpreter.sat(point & mu), "The point of the couple is not a model of mu.")
+
+    def test_distance_beyond_bounds(self):
+        # Both points are within the bounds of the variables, but further apart than them
+        psi = LinearConstraint("rs_x <= -15") & LinearConstraint("rs_n <= -12")
+        mu = LinearConstraint("rs_x >= 16") & LinearConstraint("rs_n >= 10") & LinearConstraint("rs_y >= 0")
+        self.assertEqual(self.revise(psi, mu, self.weights)[0], 53, "The distance of a couple is bounded by the bounds of the variables.")
+
+    def test_discretized_point(self):
+        weights = {self.variables[0]: Fraction(1)}
+        interpreter = FormulaInterpreter(ScipySolverRounded(), DiscreteL1DistanceFunction(weights))
+
+        # The closest point of the adherence of mu isn't a model of mu, the distance being a multiple of epsilon or not
+        for mu, distance, value in ((Not(LinearConstraint("rs_x <= 1/2")), 1, "3/2"), (Not(LinearConstraint("rs_x <= 1")), 1, "2")):
+            dStar, point = self.revise(LinearConstraint("rs_x <= 0"), mu, weights)
+            self.assertEqual(dStar, distance, "The distance of the revision isn't discretized.")
+            self.assertTrue(interpreter.sat(point & mu & LinearConstraint(f"rs_x = {value}")), "The point of the revision isn't the discretized one.")
+
+    def test_parallel_matches_sequential(self):
+        x, y = self.variables[0], self.variables[2]
+
+        # Every conjunction of mu is at the same distance of psi, the tie must be broken the same way
+        problems = [([LinearConstraint("rs_x >= -1") & LinearConstraint("rs_x <= 1") & LinearConstraint("rs_y >= -1") & LinearConstraint("rs_y <= 1")],
+                     [LinearConstraint("rs_x >= 4"), LinearConstraint("rs_x <= -4"), LinearConstraint("rs_y >= 4"), LinearConstraint("rs_y <= -4"),
+                      LinearConstraint("rs_x + rs_y >= 5")], {x: Fraction(1), y: Fraction(1)})]
+        problems += [self.randomProblem(4) for _ in range(4)]
+
+        for psi, mu, weights in problems:
+            for onlyOneSolution in (True, False):
+                results = []
+                for workers in (1, 2):
+                    solver = ScipySolverRounded()
+                    simplifier = [Daalmans(solver)]
+                    rev = Revision(solver, DiscreteL1DistanceFunction(weights, epsilon=Fraction(1)), simplifier, onlyOneSolution=onlyOneSolution,
+                                   verbose=False, projector=FloatConvexHullProjector(simplifiers=simplifier, rounding=10))
+                    rev.preload()
+                    try:
+                        results.append(rev.execute(Or(*psi), Or(*mu), workers=workers))
+                    except AttributeError as e:
+                        results.append(str(e))
+                self.assertEqual(results[0], results[1], "The parallel revision doesn't give the same result as the sequential one.")
+
+    def test_threads_share_cache(self):
+        for _ in range(4):
+            psi, mu, weights = self.randomProblem(6)
+
+            results = []
+            for workers, threads in ((1, False), (4, True)):
+                solver = CachedMLOSolver(ScipySolverRounded(), maxSize=8)
+                rev = Revision(solver, DiscreteL1DistanceFunction(weights, epsilon=Fraction(1)), onlyOneSolution=True, verbose=False)
+                rev.preload()
+                try:
+                    results.append(rev.execute(Or(*psi), Or(*mu), workers=workers, threads=threads))
+                except AttributeError as e:
+                    results.append(str(e))
+            self.assertEqual(results[0], results[1], "Threads sharing the cached solver don't give the same result as the sequential revision.")
+
+    def test_disjunctive_matches_dnf(self):
+        u, v = RealVariable.declare("rs_u"), RealVariable.declare("rs_v")
+
+        # Unbounded variables far beyond the default big-M of the disjunctions
+        problems = [([LinearConstraint("rs_u <= 0"), LinearConstraint("rs_v <= 0")],
+                     [LinearConstraint("rs_u = 5000000") & LinearConstraint("rs_v = -3000000")], {u: Fraction(1), v: Fraction(1)}),
+                    ([LinearConstraint("rs_u <= -4000000"), LinearConstraint("rs_v >= 7000000")],
+                     [LinearConstraint("rs_u >= 2000000") & LinearConstraint("rs_v <= 0")], {u: Fraction(1), v: Fraction(2)})]
+        problems += [self.randomProblem(4) for _ in range(4)]
+
+        for psi, mu, weights in problems:
+            distances = []
+            for disjunctive in (False, True):
+                rev = Revision(ScipySolverRounded(), DiscreteL1DistanceFunction(weights, epsilon=Fraction(1)), onlyOneSolution=True,
+                               verbose=False, disjunctive=disjunctive)
+                rev.preload()
+                try:
+                    distances.append(rev.execute(Or(*psi), Or(*mu))[0])
+                except AttributeError:
+                    # Both revisions reject an unsatisfiable psi or mu, in their own words
+                    distances.append(None)
+            self.assertEqual(distances[0], distances[1], "The disjunctive revision doesn't find the distance of the Disjunctive Normal Form.")
+
+if __name__ == '__main__': unittest.main()